@@ -4,11 +4,14 @@ import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Collection, Optional
 
 from .enums import LogFormat
 from .schemas import AccessLogEntry
 
+# Pattern for uvicorn access log, compiled once for the per-line hot path
+_ACCESS_LOG_RE = re.compile(r'(\S+)\s+-\s+"(\w+)\s+(\S+)\s+HTTP/[\d.]+"[\s]+(\d+)')
+
 
 def parseAccessLogLine(line: str) -> Optional[AccessLogEntry]:
     """
@@ -23,17 +26,13 @@ def parseAccessLogLine(line: str) -> Optional[AccessLogEntry]:
     Returns:
         Parsed AccessLogEntry or None if parsing fails
     """
-    # Pattern for uvicorn access log
-    pattern = r'(\S+)\s+-\s+"(\w+)\s+(\S+)\s+HTTP/[\d.]+"[\s]+(\d+)'
-
-    match = re.search(pattern, line)
+    match = _ACCESS_LOG_RE.search(line)
     if not match:
         return None
 
-    clientIp = match.group(1).split(":")[0] if ":" in match.group(1) else match.group(1)
-    method = match.group(2)
-    path = match.group(3)
-    statusCode = int(match.group(4))
+    client, method, path, status = match.groups()
+    clientIp = client.split(":", 1)[0]
+    statusCode = int(status)
 
     # Extract query string if present
     queryString = None
@@ -70,17 +69,31 @@ def formatAccessLogEntry(
         return entry.toPrettyStr()
 
 
-def shouldLogRequest(path: str, excludePaths: list[str]) -> bool:
+def shouldLogRequest(path: str, excludePaths: Collection[str]) -> bool:
     """
     Check if a request should be logged.
 
+    A path is excluded if it equals an exclude path or is nested under one.
+    Passing a set/frozenset (e.g. LauncherConfig.excludePathsSet) checks the
+    path and each parent with hash lookups instead of scanning the list.
+
     Args:
         path: Request path
-        excludePaths: List of paths to exclude
+        excludePaths: Paths to exclude
 
     Returns:
         True if should log, False otherwise
     """
+    if isinstance(excludePaths, (set, frozenset)):
+        prefix = path
+        while True:
+            if prefix in excludePaths:
+                return False
+            cut = prefix.rfind("/")
+            if cut < 0:
+                return True
+            prefix = prefix[:cut]
+
     for excludePath in excludePaths:
         if path == excludePath or path.startswith(excludePath + "/"):
             return False
@@ -116,6 +129,12 @@ def writeAccessLog(
     """
     logFile.parent.mkdir(parents=True, exist_ok=True)
 
+    if logFormat == LogFormat.JSON:
+        # JSON is already UTF-8 bytes; skip the str round-trip
+        with open(logFile, "ab") as f:
+            f.write(entry.toJsonBytes() + b"\n")
+        return
+
     formattedLine = formatAccessLogEntry(entry, logFormat)
 
     with open(logFile, "a") as f:
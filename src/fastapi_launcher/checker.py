@@ -2,8 +2,9 @@
 
 import importlib.util
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from .config import loadConfig, getConfigSummary
 from .discover import discoverApp, validateAppPath, getAppPathCandidates
@@ -62,7 +63,7 @@ def checkDependency(moduleName: str, packageName: Optional[str] = None) -> Check
     """
     packageName = packageName or moduleName
 
-    if importlib.util.find_spec(moduleName) is not None:
+    if _findSpec(moduleName):
         return CheckResult(
             name=f"Dependency: {moduleName}",
             passed=True,
@@ -77,6 +78,12 @@ def checkDependency(moduleName: str, packageName: Optional[str] = None) -> Check
         )
 
 
+@lru_cache(maxsize=None)
+def _findSpec(moduleName: str) -> bool:
+    """Check whether a module is importable, searching sys.path once per name."""
+    return importlib.util.find_spec(moduleName) is not None
+
+
 def checkFastAPI() -> CheckResult:
     """Check if FastAPI is installed."""
     return checkDependency("fastapi")
@@ -194,7 +201,9 @@ def checkPyprojectToml(projectDir: Optional[Path] = None) -> CheckResult:
 
     pyprojectPath = projectDir / "pyproject.toml"
 
-    if not pyprojectPath.exists():
+    try:
+        stat = pyprojectPath.stat()
+    except OSError:
         return CheckResult(
             name="pyproject.toml",
             passed=True,  # Not required
@@ -202,13 +211,7 @@ def checkPyprojectToml(projectDir: Optional[Path] = None) -> CheckResult:
         )
 
     try:
-        try:
-            import tomllib
-        except ImportError:
-            import tomli as tomllib  # type: ignore
-
-        with open(pyprojectPath, "rb") as f:
-            data = tomllib.load(f)
+        data = _parsePyproject(str(pyprojectPath), stat.st_mtime_ns, stat.st_size)
 
         if "tool" in data and "fastapi-launcher" in data["tool"]:
             return CheckResult(
@@ -230,6 +233,28 @@ def checkPyprojectToml(projectDir: Optional[Path] = None) -> CheckResult:
         )
 
 
+@lru_cache(maxsize=8)
+def _parsePyproject(path: str, mtimeNs: int, size: int) -> dict[str, Any]:
+    """
+    Parse a pyproject.toml file, cached until its mtime or size changes.
+
+    Args:
+        path: Path to pyproject.toml
+        mtimeNs: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+
+    Returns:
+        Parsed TOML document (shared between callers; do not mutate)
+    """
+    try:
+        import tomllib
+    except ImportError:
+        import tomli as tomllib  # type: ignore
+
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
 def runAllChecks(projectDir: Optional[Path] = None) -> CheckReport:
     """
     Run all configuration and dependency checks.
@@ -14,7 +14,7 @@ from .enums import RunMode
 from .health import checkHealth, printHealthResult
 from .launcher import LaunchError, launch
 from .logs import cleanLogs, getLogFiles, printLogEntry, readLogFile
-from .port import getPortInfo, isPortInUse, waitForPortFree
+from .port import probePort, waitForPortFree
 from .process import (
     getProcessStatus,
     isProcessRunning,
@@ -480,15 +480,16 @@ def status(
             # Get worker statuses if verbose
             if verbose:
                 workerStatuses = getWorkerStatuses(pid)
-    elif isPortInUse(config.port, config.host):
-        # Server running but no PID file (started externally)
-        portInfo = getPortInfo(config.port)
-        statusInfo["running"] = True
-        statusInfo["pid"] = portInfo.pid
-
-        # Try to get worker statuses if verbose
-        if verbose and portInfo.pid:
-            workerStatuses = getWorkerStatuses(portInfo.pid)
+    else:
+        portInfo = probePort(config.port, config.host)
+        if portInfo.isOccupied:
+            # Server running but no PID file (started externally)
+            statusInfo["running"] = True
+            statusInfo["pid"] = portInfo.pid
+
+            # Try to get worker statuses if verbose
+            if verbose and portInfo.pid:
+                workerStatuses = getWorkerStatuses(portInfo.pid)
 
     printStatusTable(statusInfo, processInfo, workerStatuses)
 
@@ -85,6 +85,7 @@ def _parseEnvValues(values: dict[str, Any]) -> dict[str, Any]:
         "MAX_REQUESTS": "max_requests",
         "MAX_REQUESTS_JITTER": "max_requests_jitter",
         "WORKER_CLASS": "worker_class",
+        "PRELOAD_APP": "preload_app",
     }
 
     for envKey, value in values.items():
@@ -105,7 +106,7 @@ def _parseEnvValues(values: dict[str, Any]) -> dict[str, Any]:
                 result[configKey] = int(value)
             except (ValueError, TypeError):
                 pass
-        elif configKey in ("reload", "daemon", "access_log"):
+        elif configKey in ("reload", "daemon", "access_log", "preload_app"):
             result[configKey] = str(value).lower() in ("true", "1", "yes")
         elif configKey == "slow_request_threshold":
             try:
@@ -60,6 +60,8 @@ ENV_TEMPLATE = """# FastAPI Launcher Environment Configuration
 # Gunicorn-specific (when FA_SERVER=gunicorn)
 # FA_MAX_REQUESTS=1000
 # FA_MAX_REQUESTS_JITTER=100
+# Preloading shares the app across workers, but fa reload then needs a restart
+# FA_PRELOAD_APP=false
 
 # Logging
 # FA_LOG_LEVEL=info
@@ -1,5 +1,6 @@
 """Core launcher for uvicorn server."""
 
+import os
 import sys
 from pathlib import Path
 from typing import Optional
@@ -9,7 +10,7 @@ import uvicorn
 from .config import loadConfig
 from .discover import discoverApp, validateAppPath
 from .enums import RunMode, ServerBackend
-from .port import getPortInfo, isPortInUse
+from .port import probePort
 from .process import registerSignalHandlers, writePidFile
 from .schemas import LauncherConfig
 from .ui import (
@@ -62,8 +63,8 @@ def preLaunchChecks(config: LauncherConfig) -> str:
         LaunchError: If checks fail
     """
     # Check port availability
-    if isPortInUse(config.port, config.host):
-        portInfo = getPortInfo(config.port)
+    portInfo = probePort(config.port, config.host)
+    if portInfo.isOccupied:
         printPortConflict(config.port, portInfo.processName, portInfo.pid)
         raise LaunchError(f"Port {config.port} is already in use")
 
@@ -144,13 +145,11 @@ def launch(
 
     # Apply mode override
     if mode is not None:
-        config = LauncherConfig(
-            **{**config.model_dump(by_alias=False), "mode": mode}
-        ).getEffectiveConfig()
+        config = config.withOverrides(mode=mode).getEffectiveConfig()
 
     # Apply dev mode defaults
     if config.mode == RunMode.DEV and not config.reload:
-        config = LauncherConfig(**{**config.model_dump(by_alias=False), "reload": True})
+        config = config.withOverrides(reload=True)
 
     # Pre-launch checks
     appPath = preLaunchChecks(config)
@@ -165,10 +164,11 @@ def launch(
     pidFile = runtimeDir / "fa.pid"
     writePidFile(pidFile)
 
-    # Add project directory to path
+    # Add project directory to the front of the path so the user's modules
+    # win over installed packages of the same name (app, main, config, ...)
     projectDir = config.appDir or _safeCwd()
     projectDirStr = str(projectDir)
-    if projectDirStr not in sys.path:
+    if sys.path[:1] != [projectDirStr]:
         sys.path.insert(0, projectDirStr)
 
     # Register signal handlers
@@ -176,9 +176,7 @@ def launch(
 
     # Show startup banner
     if showBanner:
-        printStartupPanel(
-            LauncherConfig(**{**config.model_dump(by_alias=False), "app": appPath})
-        )
+        printStartupPanel(config.withOverrides(app=appPath))
 
     # Run server based on backend
     try:
@@ -191,8 +189,10 @@ def launch(
         raise LaunchError(f"Server failed: {e}") from e
     finally:
         # Cleanup PID file
-        if pidFile.exists():
-            pidFile.unlink()
+        try:
+            os.unlink(pidFile)
+        except FileNotFoundError:
+            pass
 
 
 def _runUvicorn(appPath: str, config: LauncherConfig, pidFile: Path) -> None:
@@ -246,7 +246,10 @@ def _runGunicorn(appPath: str, config: LauncherConfig, pidFile: Path) -> None:
                     self.cfg.set(key.lower(), value)
 
         def load(self):
-            return self.application
+            # Runs in each worker, or once in the master with preload_app
+            from uvicorn.importer import import_from_string
+
+            return import_from_string(self.application)
 
     # Build Gunicorn options
     options = config.toGunicornConfig()
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -179,31 +180,36 @@ def rotateLogs(
     """
     logFiles = getLogFiles(runtimeDir)
 
-    for logType, logFile in logFiles.items():
-        if not logFile.exists():
+    for logFile in logFiles.values():
+        try:
+            size = os.stat(logFile).st_size
+        except FileNotFoundError:
             continue
 
-        if logFile.stat().st_size > maxBytes:
+        if size > maxBytes:
             _rotateFile(logFile, backupCount)
 
 
 def _rotateFile(filePath: Path, backupCount: int) -> None:
     """Rotate a single log file."""
     # Remove oldest backup
-    oldestBackup = Path(f"{filePath}.{backupCount}")
-    if oldestBackup.exists():
-        oldestBackup.unlink()
+    try:
+        os.unlink(f"{filePath}.{backupCount}")
+    except FileNotFoundError:
+        pass
 
     # Shift existing backups
     for i in range(backupCount - 1, 0, -1):
-        src = Path(f"{filePath}.{i}")
-        dst = Path(f"{filePath}.{i + 1}")
-        if src.exists():
-            src.rename(dst)
+        try:
+            os.rename(f"{filePath}.{i}", f"{filePath}.{i + 1}")
+        except FileNotFoundError:
+            pass
 
     # Move current to .1
-    if filePath.exists():
-        filePath.rename(Path(f"{filePath}.1"))
+    try:
+        os.rename(filePath, f"{filePath}.1")
+    except FileNotFoundError:
+        pass
 
 
 def cleanLogs(runtimeDir: Path) -> int:
@@ -222,7 +228,7 @@ def cleanLogs(runtimeDir: Path) -> int:
 
     count = 0
     for logFile in logsDir.glob("*.log*"):
-        logFile.unlink()
+        os.unlink(logFile)
         count += 1
 
     return count
@@ -3,7 +3,7 @@
 import time
 from datetime import timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from rich.console import Console
 from rich.live import Live
@@ -14,11 +14,10 @@ from .config import loadConfig
 from .process import (
     ProcessStatus,
     WorkerStatus,
-    getProcessStatus,
-    getWorkerStatuses,
-    isProcessRunning,
+    getMasterAndWorkerStatus,
     readPidFile,
 )
+from .schemas import LauncherConfig
 
 
 console = Console()
@@ -45,12 +44,51 @@ def _formatUptime(uptime: Optional[timedelta]) -> str:
         return f"{seconds}s"
 
 
+class _UptimeCell:
+    """Uptime table cell whose text can be updated after the table is built.
+
+    Updating the cell and refreshing the Live display redraws the ticking
+    uptime without rebuilding the tables.
+    """
+
+    def __init__(self, uptime: Optional[timedelta]) -> None:
+        self.text = _formatUptime(uptime)
+
+    def update(self, uptime: Optional[timedelta]) -> bool:
+        """Show a new uptime; return True if the displayed text changed."""
+        text = _formatUptime(uptime)
+        changed = text != self.text
+        self.text = text
+        return changed
+
+    def __rich__(self) -> str:
+        return self.text
+
+
+def _uptimeCell(
+    pid: int,
+    uptime: Optional[timedelta],
+    uptimeCells: Optional[dict[int, _UptimeCell]],
+) -> Union[str, _UptimeCell]:
+    """Return a live uptime cell registered under pid, or plain text."""
+    if uptimeCells is None:
+        return _formatUptime(uptime)
+
+    cell = uptimeCells[pid] = _UptimeCell(uptime)
+    return cell
+
+
 def _buildStatusTable(
     masterStatus: ProcessStatus,
     workerStatuses: list[WorkerStatus],
     config: any,
+    uptimeCells: Optional[dict[int, _UptimeCell]] = None,
 ) -> Table:
-    """Build the status table for display."""
+    """Build the status table for display.
+
+    When uptimeCells is given, the uptime is rendered through a live cell
+    registered in it under the master PID.
+    """
     table = Table(
         title="FastAPI Launcher Monitor",
         show_header=True,
@@ -71,7 +109,9 @@ def _buildStatusTable(
     table.add_row("Status", statusText)
     table.add_row("PID", str(masterStatus.pid))
     table.add_row("URL", f"http://{config.host}:{config.port}")
-    table.add_row("Uptime", _formatUptime(masterStatus.uptime))
+    table.add_row(
+        "Uptime", _uptimeCell(masterStatus.pid, masterStatus.uptime, uptimeCells)
+    )
 
     if masterStatus.memoryMb:
         table.add_row("Memory", f"{masterStatus.memoryMb:.1f} MB")
@@ -83,8 +123,15 @@ def _buildStatusTable(
     return table
 
 
-def _buildWorkerTable(workerStatuses: list[WorkerStatus]) -> Table:
-    """Build the worker status table."""
+def _buildWorkerTable(
+    workerStatuses: list[WorkerStatus],
+    uptimeCells: Optional[dict[int, _UptimeCell]] = None,
+) -> Table:
+    """Build the worker status table.
+
+    When uptimeCells is given, worker uptimes are rendered through live
+    cells registered in it under each worker PID.
+    """
     table = Table(
         title="Workers",
         show_header=True,
@@ -112,7 +159,7 @@ def _buildWorkerTable(workerStatuses: list[WorkerStatus]) -> Table:
             statusText,
             f"{worker.cpuPercent:.1f}%",
             f"{worker.memoryMb:.1f} MB",
-            _formatUptime(worker.uptime),
+            _uptimeCell(worker.pid, worker.uptime, uptimeCells),
         )
 
     if not workerStatuses:
@@ -121,6 +168,88 @@ def _buildWorkerTable(workerStatuses: list[WorkerStatus]) -> Table:
     return table
 
 
+def _sampleServer(
+    pidFile: Path,
+) -> tuple[Optional[ProcessStatus], list[WorkerStatus]]:
+    """Sample master and worker status, or (None, []) if the server is down."""
+    pid = readPidFile(pidFile)
+
+    if pid is None:
+        return None, []
+
+    masterStatus, workerStatuses = getMasterAndWorkerStatus(pid)
+
+    if not masterStatus.isRunning:
+        return None, []
+
+    return masterStatus, workerStatuses
+
+
+def _formatStatusText(
+    masterStatus: Optional[ProcessStatus], config: LauncherConfig
+) -> str:
+    """Format master status as markup for the TUI status widget."""
+    if masterStatus is None:
+        return "[red]● Server is not running[/red]"
+
+    lines = [
+        "[green]● Running[/green]",
+        f"PID: {masterStatus.pid}",
+        f"URL: http://{config.host}:{config.port}",
+        f"Uptime: {_formatUptime(masterStatus.uptime)}",
+    ]
+
+    if masterStatus.memoryMb:
+        lines.append(f"Memory: {masterStatus.memoryMb:.1f} MB")
+    if masterStatus.cpuPercent is not None:
+        lines.append(f"CPU: {masterStatus.cpuPercent:.1f}%")
+
+    return "\n".join(lines)
+
+
+def _formatWorkersText(
+    masterStatus: Optional[ProcessStatus], workerStatuses: list[WorkerStatus]
+) -> str:
+    """Format worker statuses as markup for the TUI workers widget."""
+    if masterStatus is None:
+        return "[dim]No workers[/dim]"
+
+    if not workerStatuses:
+        return "[dim]No worker processes[/dim]"
+
+    lines = [f"[bold]Workers ({len(workerStatuses)})[/bold]", ""]
+
+    for w in workerStatuses:
+        status = "●" if w.status == "running" else "○"
+        lines.append(
+            f"{status} PID {w.pid}: {w.cpuPercent:.1f}% CPU, {w.memoryMb:.1f} MB"
+        )
+
+    return "\n".join(lines)
+
+
+def _snapshotKey(
+    masterStatus: Optional[ProcessStatus], workerStatuses: list[WorkerStatus]
+) -> Optional[tuple]:
+    """Build a key of the displayed values, used to skip identical re-renders.
+
+    Uptimes are left out: they tick on every sample and are refreshed in
+    place through the live uptime cells instead.
+    """
+    if masterStatus is None:
+        return None
+
+    return (
+        masterStatus.pid,
+        round(masterStatus.memoryMb or 0, 1),
+        round(masterStatus.cpuPercent or 0, 1),
+        tuple(
+            (w.pid, w.status, round(w.cpuPercent, 1), round(w.memoryMb, 1))
+            for w in workerStatuses
+        ),
+    )
+
+
 def runMonitorSimple(
     projectDir: Optional[Path] = None,
     refreshInterval: float = 1.0,
@@ -144,30 +273,47 @@ def runMonitorSimple(
     console.print("[bold cyan]FastAPI Launcher Monitor[/bold cyan]")
     console.print("[dim]Press Ctrl+C to exit[/dim]\n")
 
-    def generateTables():
-        pid = readPidFile(pidFile)
+    uptimeCells: dict[int, _UptimeCell] = {}
 
-        if pid is None or not isProcessRunning(pid):
+    def render(
+        masterStatus: Optional[ProcessStatus], workerStatuses: list[WorkerStatus]
+    ):
+        uptimeCells.clear()
+        if masterStatus is None:
             return Text("Server is not running", style="dim red")
 
-        masterStatus = getProcessStatus(pid)
-        workerStatuses = getWorkerStatuses(pid)
-
         from rich.console import Group
 
         return Group(
-            _buildStatusTable(masterStatus, workerStatuses, config),
+            _buildStatusTable(masterStatus, workerStatuses, config, uptimeCells),
             "",
-            _buildWorkerTable(workerStatuses),
+            _buildWorkerTable(workerStatuses, uptimeCells),
         )
 
+    masterStatus, workerStatuses = _sampleServer(pidFile)
+    lastKey = _snapshotKey(masterStatus, workerStatuses)
+
     try:
+        # Only rebuild the tables when the displayed values change; a ticking
+        # uptime just refreshes the live uptime cells
         with Live(
-            generateTables(), refresh_per_second=1 / refreshInterval, console=console
+            render(masterStatus, workerStatuses), auto_refresh=False, console=console
         ) as live:
             while True:
                 time.sleep(refreshInterval)
-                live.update(generateTables())
+                masterStatus, workerStatuses = _sampleServer(pidFile)
+                key = _snapshotKey(masterStatus, workerStatuses)
+                if key != lastKey:
+                    live.update(render(masterStatus, workerStatuses), refresh=True)
+                    lastKey = key
+                elif masterStatus is not None:
+                    uptimes = {masterStatus.pid: masterStatus.uptime}
+                    uptimes.update((w.pid, w.uptime) for w in workerStatuses)
+                    changed = False
+                    for pid, cell in uptimeCells.items():
+                        changed |= cell.update(uptimes[pid])
+                    if changed:
+                        live.refresh()
     except KeyboardInterrupt:
         console.print("\n[dim]Monitor stopped[/dim]")
 
@@ -201,70 +347,9 @@ def runMonitorTui(projectDir: Optional[Path] = None) -> None:
     class StatusWidget(Static):
         """Widget to display server status."""
 
-        def __init__(self):
-            super().__init__()
-            self.pid = None
-
-        def on_mount(self) -> None:
-            self.set_interval(1.0, self.refresh_status)
-
-        def refresh_status(self) -> None:
-            self.pid = readPidFile(pidFile)
-            self.refresh()
-
-        def render(self) -> str:
-            if self.pid is None or not isProcessRunning(self.pid):
-                return "[red]● Server is not running[/red]"
-
-            status = getProcessStatus(self.pid)
-
-            lines = [
-                "[green]● Running[/green]",
-                f"PID: {status.pid}",
-                f"URL: http://{config.host}:{config.port}",
-                f"Uptime: {_formatUptime(status.uptime)}",
-            ]
-
-            if status.memoryMb:
-                lines.append(f"Memory: {status.memoryMb:.1f} MB")
-            if status.cpuPercent is not None:
-                lines.append(f"CPU: {status.cpuPercent:.1f}%")
-
-            return "\n".join(lines)
-
     class WorkersWidget(Static):
         """Widget to display worker status."""
 
-        def __init__(self):
-            super().__init__()
-            self.pid = None
-
-        def on_mount(self) -> None:
-            self.set_interval(1.0, self.refresh_workers)
-
-        def refresh_workers(self) -> None:
-            self.pid = readPidFile(pidFile)
-            self.refresh()
-
-        def render(self) -> str:
-            if self.pid is None or not isProcessRunning(self.pid):
-                return "[dim]No workers[/dim]"
-
-            workers = getWorkerStatuses(self.pid)
-
-            if not workers:
-                return "[dim]No worker processes[/dim]"
-
-            lines = [f"[bold]Workers ({len(workers)})[/bold]", ""]
-
-            for w in workers:
-                status = "●" if w.status == "running" else "○"
-                lines.append(
-                    f"{status} PID {w.pid}: {w.cpuPercent:.1f}% CPU, {w.memoryMb:.1f} MB"
-                )
-
-            return "\n".join(lines)
-
     class MonitorApp(App):
         """FastAPI Launcher Monitor TUI Application."""
 
@@ -305,9 +390,28 @@ def runMonitorTui(projectDir: Optional[Path] = None) -> None:
             )
             yield Footer()
 
+        def on_mount(self) -> None:
+            self._lastTexts: dict[str, str] = {}
+            self._tick()
+            # One timer samples once per tick and feeds both widgets
+            self.set_interval(1.0, self._tick)
+
+        def _tick(self) -> None:
+            masterStatus, workerStatuses = _sampleServer(pidFile)
+            self._show("#status", _formatStatusText(masterStatus, config))
+            self._show(
+                "#workers", _formatWorkersText(masterStatus, workerStatuses)
+            )
+
+        def _show(self, selector: str, text: str) -> None:
+            # Skip the widget update (and repaint) when the text is unchanged
+            if self._lastTexts.get(selector) == text:
+                return
+            self._lastTexts[selector] = text
+            self.query_one(selector, Static).update(text)
+
         def action_refresh(self) -> None:
-            self.query_one("#status", StatusWidget).refresh_status()
-            self.query_one("#workers", WorkersWidget).refresh_workers()
+            self._tick()
 
     app = MonitorApp()
     app.run()
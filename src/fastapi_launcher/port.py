@@ -1,10 +1,16 @@
 """Port detection and management utilities."""
 
+import os
 import socket
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
-import psutil
+# Linux exposes the socket tables directly, which is much cheaper than
+# psutil.net_connections() resolving every socket of every process
+_HAS_PROCFS = sys.platform.startswith("linux")
+_PROC_NET_TCP = ("/proc/net/tcp", "/proc/net/tcp6")
+_TCP_LISTEN = "0A"
 
 
 @dataclass
@@ -15,11 +21,12 @@ class PortInfo:
     pid: Optional[int] = None
     processName: Optional[str] = None
     status: str = "unknown"
+    inUse: bool = False
 
     @property
     def isOccupied(self) -> bool:
         """Check if port is occupied."""
-        return self.pid is not None
+        return self.inUse or self.pid is not None
 
 
 def isPortInUse(port: int, host: str = "127.0.0.1") -> bool:
@@ -49,14 +56,35 @@ def getPortInfo(port: int) -> PortInfo:
     Returns:
         PortInfo with process details if port is occupied
     """
+    import psutil
+
     info = PortInfo(port=port)
 
+    if _HAS_PROCFS:
+        try:
+            inode = _findListenInode(port)
+        except OSError:
+            # /proc not readable, use psutil instead
+            pass
+        else:
+            if inode is not None:
+                info.status = "LISTEN"
+                info.inUse = True
+                info.pid = _findSocketOwner(inode)
+                if info.pid:
+                    try:
+                        info.processName = psutil.Process(info.pid).name()
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        pass
+            return info
+
     try:
         connections = psutil.net_connections(kind="inet")
         for conn in connections:
             if conn.laddr.port == port and conn.status == "LISTEN":
                 info.pid = conn.pid
                 info.status = conn.status
+                info.inUse = True
 
                 if conn.pid:
                     try:
@@ -69,10 +97,109 @@ def getPortInfo(port: int) -> PortInfo:
         # Fallback to socket check
         if isPortInUse(port):
             info.status = "occupied"
+            info.inUse = True
 
     return info
 
 
+def _findListenInode(port: int) -> Optional[str]:
+    """
+    Find the inode of the TCP socket listening on a port (Linux only).
+
+    Args:
+        port: Port number to look up
+
+    Returns:
+        Socket inode, or None if nothing listens on the port
+
+    Raises:
+        OSError: If no socket table could be read
+    """
+    tablesRead = 0
+
+    for tablePath in _PROC_NET_TCP:
+        try:
+            f = open(tablePath)
+        except FileNotFoundError:
+            # tcp6 is absent when IPv6 is disabled
+            continue
+
+        tablesRead += 1
+        with f:
+            next(f, None)  # Skip header
+            for line in f:
+                parts = line.split()
+                if parts[3] != _TCP_LISTEN:
+                    continue
+                if int(parts[1].rsplit(":", 1)[1], 16) == port:
+                    return parts[9]
+
+    if tablesRead == 0:
+        raise OSError("No /proc/net/tcp socket table available")
+
+    return None
+
+
+def _findSocketOwner(inode: str) -> Optional[int]:
+    """
+    Find the process holding a socket inode by scanning /proc/<pid>/fd.
+
+    Stops at the first match instead of resolving every open socket.
+
+    Args:
+        inode: Socket inode from /proc/net/tcp
+
+    Returns:
+        Owning PID, or None if not found or not permitted to inspect it
+    """
+    target = f"socket:[{inode}]"
+
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return None
+
+    for name in entries:
+        if not name.isdigit():
+            continue
+
+        fdDir = f"/proc/{name}/fd"
+        try:
+            fds = os.listdir(fdDir)
+        except OSError:
+            continue
+
+        for fd in fds:
+            try:
+                if os.readlink(f"{fdDir}/{fd}") == target:
+                    return int(name)
+            except OSError:
+                continue
+
+    return None
+
+
+def probePort(port: int, host: str = "127.0.0.1") -> PortInfo:
+    """
+    Probe a port and identify its occupying process only if it is in use.
+
+    Args:
+        port: Port number to check
+        host: Host to check on
+
+    Returns:
+        PortInfo with isOccupied set, plus process details if occupied
+    """
+    if not isPortInUse(port, host):
+        return PortInfo(port=port, status="free")
+
+    info = getPortInfo(port)
+    info.inUse = True
+    if info.status == "unknown":
+        info.status = "occupied"
+    return info
+
+
 def findAvailablePort(startPort: int = 8000, endPort: int = 8100) -> Optional[int]:
     """
     Find an available port in the given range.
@@ -101,6 +228,8 @@ def killProcessOnPort(port: int, force: bool = False) -> bool:
     Returns:
         True if process was killed, False otherwise
     """
+    import psutil
+
     info = getPortInfo(port)
 
     if info.pid is None:
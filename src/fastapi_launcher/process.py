@@ -1,14 +1,32 @@
 """Process management utilities."""
 
 import os
+import select
 import signal
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import psutil
+if TYPE_CHECKING:
+    import psutil
+
+_HAS_PROCFS = sys.platform.startswith("linux")
+if _HAS_PROCFS:
+    _CLK_TCK = os.sysconf("SC_CLK_TCK")
+    _PAGE_SIZE = os.sysconf("SC_PAGESIZE")
+
+# pidfds (Linux 5.3+) let us sleep until a process exits instead of polling,
+# and signal it without racing PID reuse
+_HAS_PIDFD = (
+    hasattr(os, "pidfd_open")
+    and hasattr(select, "epoll")
+    and hasattr(signal, "pidfd_send_signal")
+)
 
 
 @dataclass
@@ -29,6 +47,9 @@ def writePidFile(pidPath: Path, pid: Optional[int] = None) -> None:
     """
     Write PID to file.
 
+    The file is written beside the target and renamed into place, so a
+    concurrent readPidFile never sees it empty or half-written.
+
     Args:
         pidPath: Path to PID file
         pid: Process ID (defaults to current process)
@@ -36,8 +57,29 @@ def writePidFile(pidPath: Path, pid: Optional[int] = None) -> None:
     if pid is None:
         pid = os.getpid()
 
-    pidPath.parent.mkdir(parents=True, exist_ok=True)
-    pidPath.write_text(str(pid))
+    tmpPath = pidPath.with_name(f"{pidPath.name}.{os.getpid()}.tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(tmpPath, flags, 0o644)
+    except FileNotFoundError:
+        # Only create the runtime directory when it is actually missing
+        pidPath.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmpPath, flags, 0o644)
+
+    try:
+        try:
+            os.write(fd, b"%d" % pid)
+        finally:
+            os.close(fd)
+
+        os.replace(tmpPath, pidPath)
+    except BaseException:
+        # Don't leave the temp file behind in the runtime directory
+        try:
+            os.unlink(tmpPath)
+        except OSError:
+            pass
+        raise
 
 
 def readPidFile(pidPath: Path) -> Optional[int]:
@@ -50,14 +92,17 @@ def readPidFile(pidPath: Path) -> Optional[int]:
     Returns:
         PID if file exists and valid, None otherwise
     """
-    if not pidPath.exists():
+    try:
+        fd = os.open(pidPath, os.O_RDONLY)
+    except OSError:
         return None
 
     try:
-        content = pidPath.read_text().strip()
-        return int(content)
-    except (ValueError, IOError):
+        return int(os.read(fd, 32).strip())
+    except (ValueError, OSError):
         return None
+    finally:
+        os.close(fd)
 
 
 def writeEnvFile(runtimeDir: Path, envName: str) -> None:
@@ -128,6 +173,61 @@ def removePidFile(pidPath: Path) -> bool:
     return False
 
 
+@lru_cache(maxsize=256)
+def _cachedProc(pid: int, startTicks: int) -> "psutil.Process":
+    """Build a psutil.Process for a (pid, start time) identity."""
+    import psutil
+
+    return psutil.Process(pid)
+
+
+def _getProc(pid: int) -> "psutil.Process":
+    """
+    Get a psutil.Process, reusing the handle while the PID identity holds.
+
+    On Linux the cache key includes the start time from /proc/<pid>/stat,
+    so a reused PID gets a fresh handle.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        psutil.Process for the PID
+
+    Raises:
+        psutil.NoSuchProcess: If the process does not exist
+    """
+    import psutil
+
+    if _HAS_PROCFS:
+        try:
+            return _cachedProc(pid, _readProcStat(pid)[1])
+        except OSError:
+            pass
+
+    return psutil.Process(pid)
+
+
+def _isAlive(proc: "psutil.Process") -> bool:
+    """
+    Check liveness with a single status() read.
+
+    Args:
+        proc: Process handle
+
+    Returns:
+        True if the process exists and is neither zombie nor dead
+
+    Raises:
+        psutil.NoSuchProcess: If the process does not exist
+        psutil.AccessDenied: If the process cannot be inspected
+    """
+    import psutil
+
+    procStatus = proc.status()
+    return procStatus != psutil.STATUS_ZOMBIE and procStatus != psutil.STATUS_DEAD
+
+
 def isProcessRunning(pid: int) -> bool:
     """
     Check if a process is running.
@@ -141,11 +241,23 @@ def isProcessRunning(pid: int) -> bool:
     if pid <= 0:
         return False
 
+    # os.kill(pid, 0) would terminate the process on Windows
+    if sys.platform == "win32":
+        import psutil
+
+        try:
+            return _isAlive(_getProc(pid))
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return False
+
     try:
-        proc = psutil.Process(pid)
-        return proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE
-    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
         return False
+    except PermissionError:
+        # Exists but owned by another user
+        return True
 
 
 def getProcessStatus(pid: int) -> ProcessStatus:
@@ -158,18 +270,22 @@ def getProcessStatus(pid: int) -> ProcessStatus:
     Returns:
         ProcessStatus with process details
     """
+    import psutil
+
     status = ProcessStatus(pid=pid, isRunning=False)
 
     try:
-        proc = psutil.Process(pid)
-        status.isRunning = proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE
+        proc = _getProc(pid)
+        status.isRunning = _isAlive(proc)
 
         if status.isRunning:
             status.name = proc.name()
-            try:
-                status.cmdline = " ".join(proc.cmdline())
-            except (psutil.AccessDenied, psutil.ZombieProcess):
-                status.cmdline = None
+            status.cmdline = _readCmdline(pid) if _HAS_PROCFS else None
+            if status.cmdline is None:
+                try:
+                    status.cmdline = " ".join(proc.cmdline())
+                except (psutil.AccessDenied, psutil.ZombieProcess):
+                    status.cmdline = None
 
             try:
                 memInfo = proc.memory_info()
@@ -183,8 +299,9 @@ def getProcessStatus(pid: int) -> ProcessStatus:
                 pass
 
             try:
-                status.startTime = datetime.fromtimestamp(proc.create_time())
-                status.uptime = datetime.now() - status.startTime
+                createTime = proc.create_time()
+                status.startTime = datetime.fromtimestamp(createTime)
+                status.uptime = timedelta(seconds=time.time() - createTime)
             except (psutil.AccessDenied, psutil.ZombieProcess):
                 pass
 
@@ -223,29 +340,90 @@ def terminateProcess(pid: int, timeout: float = 5.0) -> bool:
     Returns:
         True if process was terminated, False otherwise
     """
+    import psutil
+
     if not isProcessRunning(pid):
         return True
 
+    pidfds = None
     try:
-        proc = psutil.Process(pid)
+        proc = _getProc(pid)
+        # Hold one pidfd from before the first signal until the last wait, so
+        # a recycled PID is neither signalled nor mistaken for our process
+        pidfds = _openPidfds([proc])
 
         # Send SIGTERM
-        proc.terminate()
+        if not _pidfdSignal(pidfds, signal.SIGTERM):
+            proc.terminate()
 
-        try:
-            proc.wait(timeout=timeout)
+        if _waitGone(proc, pidfds, timeout):
             return True
-        except psutil.TimeoutExpired:
-            # Force kill
+
+        # Force kill
+        if not _pidfdSignal(pidfds, signal.SIGKILL):
             proc.kill()
-            try:
-                proc.wait(timeout=3)
-                return True
-            except psutil.TimeoutExpired:
-                return False
+        return _waitGone(proc, pidfds, 3)
 
-    except (psutil.NoSuchProcess, psutil.AccessDenied):
+    except (psutil.NoSuchProcess, psutil.AccessDenied, PermissionError):
         return not isProcessRunning(pid)
+    finally:
+        _closePidfds(pidfds)
+
+
+def _pidfdSignal(
+    pidfds: Optional[dict[int, "psutil.Process"]], sig: signal.Signals
+) -> bool:
+    """
+    Signal the process behind a single open pidfd.
+
+    Args:
+        pidfds: Result of _openPidfds([proc])
+        sig: Signal to send
+
+    Returns:
+        True if the signal went through the pidfd (or the process is already
+        gone), False if there is no pidfd and the caller must signal by PID
+
+    Raises:
+        PermissionError: If we may not signal the process
+    """
+    if not pidfds:
+        return False
+
+    try:
+        signal.pidfd_send_signal(next(iter(pidfds)), sig)
+    except ProcessLookupError:
+        # Exited (and was reaped) already
+        pass
+    return True
+
+
+def _waitGone(
+    proc: "psutil.Process",
+    pidfds: Optional[dict[int, "psutil.Process"]],
+    timeout: float,
+) -> bool:
+    """
+    Wait for a process to exit, via its pidfd when one is open.
+
+    Args:
+        proc: Process to wait for
+        pidfds: Result of _openPidfds([proc]); None falls back to psutil's wait
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        True if the process exited, False on timeout
+    """
+    import psutil
+
+    if pidfds is not None:
+        return not _waitPidfds(pidfds, timeout)
+
+    try:
+        proc.wait(timeout=timeout)
+        return True
+    except psutil.TimeoutExpired:
+        return False
 
 
 def killProcess(pid: int) -> bool:
@@ -258,11 +436,13 @@ def killProcess(pid: int) -> bool:
     Returns:
         True if process was killed, False otherwise
     """
+    import psutil
+
     if not isProcessRunning(pid):
         return True
 
     try:
-        proc = psutil.Process(pid)
+        proc = _getProc(pid)
         proc.kill()
         proc.wait(timeout=3)
         return True
@@ -281,8 +461,10 @@ def waitForExit(pid: int, timeout: float = 30.0) -> bool:
     Returns:
         True if process exited, False if timeout
     """
+    import psutil
+
     try:
-        proc = psutil.Process(pid)
+        proc = _getProc(pid)
         proc.wait(timeout=timeout)
         return True
     except psutil.TimeoutExpired:
@@ -301,14 +483,66 @@ def getChildProcesses(pid: int) -> list[int]:
     Returns:
         List of child PIDs
     """
+    import psutil
+
+    if _HAS_PROCFS:
+        try:
+            return _readDescendantPids(pid)
+        except OSError:
+            # No such process, or kernel built without CONFIG_PROC_CHILDREN
+            pass
+
     try:
-        proc = psutil.Process(pid)
+        proc = _getProc(pid)
         children = proc.children(recursive=True)
         return [child.pid for child in children]
     except (psutil.NoSuchProcess, psutil.AccessDenied):
         return []
 
 
+def _readDescendantPids(pid: int) -> list[int]:
+    """
+    List descendant PIDs from the kernel's per-thread children files.
+
+    psutil's children(recursive=True) scans every process on the system;
+    this only opens /proc entries of actual descendants.
+
+    Args:
+        pid: Root process ID
+
+    Returns:
+        Descendant PIDs, parents before their children
+
+    Raises:
+        OSError: If the children list of pid itself cannot be read
+    """
+    # Fail fast so callers can fall back to psutil
+    os.stat(f"/proc/{pid}/task/{pid}/children")
+
+    descendants: list[int] = []
+    queue = [pid]
+
+    for current in queue:
+        try:
+            tids = os.listdir(f"/proc/{current}/task")
+        except OSError:
+            if current == pid:
+                raise
+            continue
+
+        for tid in tids:
+            try:
+                with open(f"/proc/{current}/task/{tid}/children", "rb") as f:
+                    kids = [int(kid) for kid in f.read().split()]
+            except OSError:
+                # Thread or process exited mid-walk
+                continue
+            descendants.extend(kids)
+            queue.extend(kids)
+
+    return descendants
+
+
 def terminateProcessTree(pid: int, timeout: float = 5.0) -> bool:
     """
     Terminate a process and all its children.
@@ -320,37 +554,214 @@ def terminateProcessTree(pid: int, timeout: float = 5.0) -> bool:
     Returns:
         True if all processes were terminated
     """
+    import psutil
+
     if not isProcessRunning(pid):
         return True
 
+    pidfds = None
     try:
-        proc = psutil.Process(pid)
+        proc = _getProc(pid)
         children = proc.children(recursive=True)
 
-        # Terminate children first
-        for child in children:
+        procs = [proc] + children
+        # Open pidfds before signalling so a recycled PID can't be mistaken
+        pidfds = _openPidfds(procs)
+
+        pgid = _sharedProcessGroup(pid, children)
+
+        if pgid is not None:
             try:
-                child.terminate()
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                # One syscall signals the master and every worker
+                os.killpg(pgid, signal.SIGTERM)
+            except ProcessLookupError:
+                # The whole group exited after we checked it
                 pass
+            except PermissionError:
+                # The group changed after we checked it, signal one by one
+                pgid = None
 
-        # Terminate parent
-        proc.terminate()
+        if pgid is None:
+            # Terminate children first
+            for child in children:
+                try:
+                    child.terminate()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+
+            # Terminate parent
+            proc.terminate()
 
         # Wait for all
-        gone, alive = psutil.wait_procs([proc] + children, timeout=timeout)
+        if pidfds is None:
+            gone, alive = psutil.wait_procs(procs, timeout=timeout)
+        else:
+            alive = _waitPidfds(pidfds, timeout)
 
         # Force kill survivors
-        for p in alive:
-            try:
-                p.kill()
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        if alive:
+            if pgid is not None:
+                try:
+                    os.killpg(pgid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            else:
+                for p in alive:
+                    try:
+                        p.kill()
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        pass
 
         return len(alive) == 0 or all(not p.is_running() for p in alive)
 
     except (psutil.NoSuchProcess, psutil.AccessDenied):
         return not isProcessRunning(pid)
+    finally:
+        _closePidfds(pidfds)
+
+
+def _sharedProcessGroup(pid: int, children: list["psutil.Process"]) -> Optional[int]:
+    """
+    Get the process group to signal for a whole process tree.
+
+    Only returned when pid leads its own group, every child is in it, every
+    member of the group is pid or one of its children, and it is not our
+    own group, so killpg can't hit unrelated processes.
+
+    Args:
+        pid: Master process ID
+        children: Child processes of pid
+
+    Returns:
+        Process group ID, or None if children must be signalled one by one
+    """
+    if sys.platform == "win32":
+        return None
+
+    try:
+        pgid = os.getpgid(pid)
+        if pgid != pid or pgid == os.getpgrp():
+            return None
+        if not all(os.getpgid(child.pid) == pgid for child in children):
+            return None
+    except OSError:
+        return None
+
+    treePids = {pid}
+    treePids.update(child.pid for child in children)
+    if _processGroupMembers(pgid) <= treePids:
+        return pgid
+
+    return None
+
+
+def _processGroupMembers(pgid: int) -> set[int]:
+    """
+    List the processes currently in a process group.
+
+    Args:
+        pgid: Process group ID
+
+    Returns:
+        PIDs of the group members
+    """
+    import psutil
+
+    members: set[int] = set()
+    for pid in psutil.pids():
+        try:
+            if os.getpgid(pid) == pgid:
+                members.add(pid)
+        except OSError:
+            # Exited while we were scanning
+            continue
+
+    return members
+
+
+def _openPidfds(
+    procs: list["psutil.Process"],
+) -> Optional[dict[int, "psutil.Process"]]:
+    """
+    Open a pidfd for each process.
+
+    Args:
+        procs: Processes to watch
+
+    Returns:
+        Mapping of pidfd to process, or None if pidfds are unsupported
+    """
+    if not _HAS_PIDFD:
+        return None
+
+    pidfds: dict[int, "psutil.Process"] = {}
+    for p in procs:
+        try:
+            pidfds[os.pidfd_open(p.pid)] = p
+        except ProcessLookupError:
+            # Already exited
+            continue
+        except OSError:
+            # e.g. ENOSYS on kernels older than 5.3
+            _closePidfds(pidfds)
+            return None
+
+    return pidfds
+
+
+def _waitPidfds(
+    pidfds: dict[int, "psutil.Process"], timeout: float
+) -> list["psutil.Process"]:
+    """
+    Wait until the processes behind pidfds exit.
+
+    The pidfds stay open, so the caller can still signal survivors through
+    them; close them with _closePidfds when done.
+
+    Args:
+        pidfds: Mapping of pidfd to process, as returned by _openPidfds
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        Processes still alive after timeout
+    """
+    pending = dict(pidfds)
+    deadline = time.monotonic() + timeout
+
+    with select.epoll() as ep:
+        for fd in pending:
+            ep.register(fd, select.EPOLLIN)
+
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            for fd, _ in ep.poll(remaining):
+                ep.unregister(fd)
+                proc = pending.pop(fd)
+                # Reap our own children so they don't linger as zombies
+                try:
+                    os.waitpid(proc.pid, os.WNOHANG)
+                except ChildProcessError:
+                    pass
+
+    return list(pending.values())
+
+
+def _closePidfds(pidfds: Optional[dict[int, "psutil.Process"]]) -> None:
+    """
+    Close pidfds and empty the mapping, so closing twice is harmless.
+
+    Args:
+        pidfds: Mapping of pidfd to process, as returned by _openPidfds
+    """
+    if not pidfds:
+        return
+
+    for fd in pidfds:
+        os.close(fd)
+    pidfds.clear()
 
 
 def registerSignalHandlers(
@@ -396,51 +807,199 @@ def getWorkerStatuses(mainPid: int) -> list[WorkerStatus]:
     Returns:
         List of WorkerStatus for each worker
     """
+    import psutil
+
     workers: list[WorkerStatus] = []
 
     try:
-        mainProc = psutil.Process(mainPid)
+        if _HAS_PROCFS:
+            return _sampleWorkersProcfs(getChildProcesses(mainPid))
+
+        mainProc = _getProc(mainPid)
         children = mainProc.children(recursive=True)
 
+        # Prime CPU counters so the non-blocking reads below return deltas
+        primed: list[psutil.Process] = []
         for child in children:
             try:
-                # Get worker process info
-                cpuPercent = child.cpu_percent(interval=0.1)
-                memInfo = child.memory_info()
-                memoryMb = memInfo.rss / (1024 * 1024)
-
-                # Determine status based on CPU usage
-                if cpuPercent > 0.5:
-                    status = "running"
-                else:
-                    status = "idle"
-
-                # Calculate uptime
-                try:
-                    startTime = datetime.fromtimestamp(child.create_time())
-                    uptime = datetime.now() - startTime
-                except Exception:
-                    uptime = None
-
-                workers.append(
-                    WorkerStatus(
-                        pid=child.pid,
-                        cpuPercent=cpuPercent,
-                        memoryMb=memoryMb,
-                        requestsHandled=0,  # Not available without app instrumentation
-                        status=status,
-                        uptime=uptime,
-                    )
-                )
+                child.cpu_percent(interval=None)
+                primed.append(child)
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
 
+        if primed:
+            time.sleep(0.1)
+
+        now = time.time()
+
+        for child in primed:
+            try:
+                with child.oneshot():
+                    info = child.as_dict(
+                        attrs=["cpu_percent", "memory_info", "create_time"]
+                    )
+            except psutil.NoSuchProcess:
+                continue
+
+            cpuPercent = info["cpu_percent"]
+            memInfo = info["memory_info"]
+            if cpuPercent is None or memInfo is None:
+                continue
+
+            # Determine status based on CPU usage
+            if cpuPercent > 0.5:
+                status = "running"
+            else:
+                status = "idle"
+
+            # Calculate uptime
+            uptime = None
+            if info["create_time"] is not None:
+                uptime = timedelta(seconds=now - info["create_time"])
+
+            workers.append(
+                WorkerStatus(
+                    pid=child.pid,
+                    cpuPercent=cpuPercent,
+                    memoryMb=memInfo.rss / (1024 * 1024),
+                    requestsHandled=0,  # Not available without app instrumentation
+                    status=status,
+                    uptime=uptime,
+                )
+            )
+
     except (psutil.NoSuchProcess, psutil.AccessDenied):
         pass
 
     return workers
 
 
+def _readProcStat(pid: int) -> tuple[int, int]:
+    """
+    Read CPU ticks and start time from /proc/<pid>/stat.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        Tuple of (utime + stime, starttime), both in clock ticks
+
+    Raises:
+        OSError: If the stat file cannot be read
+    """
+    fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY)
+    try:
+        data = os.read(fd, 1024)
+    finally:
+        os.close(fd)
+
+    # comm (field 2) may contain spaces, so split after its closing paren;
+    # fields[0] is then field 3 (state)
+    fields = data[data.rfind(b")") + 2 :].split()
+    return int(fields[11]) + int(fields[12]), int(fields[19])
+
+
+def _readCmdline(pid: int) -> Optional[str]:
+    """
+    Read a process command line from /proc/<pid>/cmdline.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        Space-separated command line, or None if it cannot be read
+    """
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    # Arguments are NUL-terminated; one pass turns them into spaces
+    return data.replace(b"\x00", b" ").rstrip().decode("utf-8", "replace")
+
+
+def _readStatmRss(pid: int) -> int:
+    """
+    Read resident set size in bytes from /proc/<pid>/statm.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        RSS in bytes
+
+    Raises:
+        OSError: If the statm file cannot be read
+    """
+    fd = os.open(f"/proc/{pid}/statm", os.O_RDONLY)
+    try:
+        data = os.read(fd, 256)
+    finally:
+        os.close(fd)
+
+    return int(data.split()[1]) * _PAGE_SIZE
+
+
+def _sampleWorkersProcfs(pids: list[int], interval: float = 0.1) -> list[WorkerStatus]:
+    """
+    Sample worker processes from procfs with a single shared CPU interval.
+
+    Args:
+        pids: Worker process IDs
+        interval: Seconds between the two CPU snapshots
+
+    Returns:
+        List of WorkerStatus for each worker still alive after sampling
+    """
+    import psutil
+
+    first: dict[int, tuple[int, int]] = {}
+    for pid in pids:
+        try:
+            first[pid] = _readProcStat(pid)
+        except OSError:
+            continue
+
+    if not first:
+        return []
+
+    wallStart = time.monotonic()
+    time.sleep(interval)
+    wall = time.monotonic() - wallStart
+
+    bootTime = psutil.boot_time()
+    now = time.time()
+    workers: list[WorkerStatus] = []
+
+    for pid, (cpuStart, startTicks) in first.items():
+        try:
+            cpuEnd, startTicksEnd = _readProcStat(pid)
+            rss = _readStatmRss(pid)
+        except OSError:
+            continue
+
+        # PID was reused between snapshots
+        if startTicksEnd != startTicks:
+            continue
+
+        cpuPercent = (cpuEnd - cpuStart) / _CLK_TCK / wall * 100
+        startTime = bootTime + startTicks / _CLK_TCK
+
+        workers.append(
+            WorkerStatus(
+                pid=pid,
+                cpuPercent=cpuPercent,
+                memoryMb=rss / (1024 * 1024),
+                requestsHandled=0,  # Not available without app instrumentation
+                status="running" if cpuPercent > 0.5 else "idle",
+                uptime=timedelta(seconds=now - startTime),
+            )
+        )
+
+    return workers
+
+
 def getMasterAndWorkerStatus(pid: int) -> tuple[ProcessStatus, list[WorkerStatus]]:
     """
     Get master process status and all worker statuses.
@@ -451,7 +1010,17 @@ def getMasterAndWorkerStatus(pid: int) -> tuple[ProcessStatus, list[WorkerStatus
     Returns:
         Tuple of (master_status, worker_statuses)
     """
-    masterStatus = getProcessStatus(pid)
-    workerStatuses = getWorkerStatuses(pid) if masterStatus.isRunning else []
+    if not isProcessRunning(pid):
+        return ProcessStatus(pid=pid, isRunning=False), []
+
+    # Both samples wait ~100 ms for a CPU delta, so overlap them; the
+    # executor lives only for this call, so no thread outlives the sample
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="fa-sampler") as pool:
+        workersFuture = pool.submit(getWorkerStatuses, pid)
+        masterStatus = getProcessStatus(pid)
+        workerStatuses = workersFuture.result()
+
+    if not masterStatus.isRunning:
+        return masterStatus, []
 
     return masterStatus, workerStatuses
@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from ..enums import LogFormat, RunMode, ServerBackend
 
@@ -26,7 +26,7 @@ class UvicornConfig(BaseModel):
     )
     timeout: int = Field(default=30, ge=1, description="Request timeout in seconds")
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
 
 
 class EnvironmentConfig(BaseModel):
@@ -49,8 +49,13 @@ class EnvironmentConfig(BaseModel):
         default=None, ge=0, alias="max_requests_jitter"
     )
     workerClass: Optional[str] = Field(default=None, alias="worker_class")
+    preloadApp: Optional[bool] = Field(default=None, alias="preload_app")
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
+
+
+# Override fields, fixed at class definition so applying them is a flat loop
+_ENV_OVERRIDE_FIELDS = tuple(EnvironmentConfig.model_fields)
 
 
 class LauncherConfig(BaseModel):
@@ -114,6 +119,15 @@ class LauncherConfig(BaseModel):
         alias="worker_class",
         description="Gunicorn worker class",
     )
+    preloadApp: bool = Field(
+        default=False,
+        alias="preload_app",
+        description=(
+            "Import the app in the Gunicorn master before forking workers; "
+            "workers then share it copy-on-write, but HUP / fa reload keeps "
+            "serving the old code"
+        ),
+    )
 
     # Logging
     logLevel: str = Field(default="info", alias="log_level", description="Log level")
@@ -166,15 +180,44 @@ class LauncherConfig(BaseModel):
         default=None, description="Named environment configurations"
     )
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
+
+    # Effective configs already built from this instance, keyed by envName
+    _effectiveCache: dict[Optional[str], "LauncherConfig"] = PrivateAttr(
+        default_factory=dict
+    )
+    _excludePathsSet: Optional[frozenset[str]] = PrivateAttr(default=None)
+
+    def __eq__(self, other: Any) -> bool:
+        # The effective-config cache is not part of the config's value
+        if not isinstance(other, LauncherConfig):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    @property
+    def excludePathsSet(self) -> frozenset[str]:
+        """excludePaths as a frozenset for O(1) lookups, built on first use."""
+        if self._excludePathsSet is None:
+            self._excludePathsSet = frozenset(self.excludePaths)
+        return self._excludePathsSet
 
     def getEffectiveConfig(self, envName: Optional[str] = None) -> "LauncherConfig":
         """Get configuration with environment-specific overrides applied.
 
+        The result is cached per envName.
+
         Args:
             envName: Named environment to use (e.g., 'staging', 'qa').
                     If None, uses dev/prod based on mode.
         """
+        effective = self._effectiveCache.get(envName)
+        if effective is None:
+            effective = self._applyEnvOverrides(envName)
+            self._effectiveCache[envName] = effective
+        return effective
+
+    def _applyEnvOverrides(self, envName: Optional[str]) -> "LauncherConfig":
+        """Build the effective config for envName without caching."""
         # Determine which environment config to use
         envConfig: Optional[EnvironmentConfig] = None
 
@@ -187,38 +230,27 @@ class LauncherConfig(BaseModel):
         if envConfig is None:
             return self
 
-        # Create a copy with overrides
-        data = self.model_dump(by_alias=False, exclude={"dev", "prod", "envs"})
-
-        # Apply all non-None overrides
-        if envConfig.host is not None:
-            data["host"] = envConfig.host
-        if envConfig.port is not None:
-            data["port"] = envConfig.port
-        if envConfig.reload is not None:
-            data["reload"] = envConfig.reload
-        if envConfig.workers is not None:
-            data["workers"] = envConfig.workers
-        if envConfig.logLevel is not None:
-            data["logLevel"] = envConfig.logLevel
-        if envConfig.logFormat is not None:
-            data["logFormat"] = envConfig.logFormat
-        if envConfig.daemon is not None:
-            data["daemon"] = envConfig.daemon
-        if envConfig.accessLog is not None:
-            data["accessLog"] = envConfig.accessLog
-        if envConfig.server is not None:
-            data["server"] = envConfig.server
-        if envConfig.timeoutGracefulShutdown is not None:
-            data["timeoutGracefulShutdown"] = envConfig.timeoutGracefulShutdown
-        if envConfig.maxRequests is not None:
-            data["maxRequests"] = envConfig.maxRequests
-        if envConfig.maxRequestsJitter is not None:
-            data["maxRequestsJitter"] = envConfig.maxRequestsJitter
-        if envConfig.workerClass is not None:
-            data["workerClass"] = envConfig.workerClass
-
-        return LauncherConfig(**data)
+        # Apply all non-None overrides; EnvironmentConfig already validated
+        # them, so copy instead of re-validating every field
+        overrides: dict[str, Any] = {"dev": None, "prod": None, "envs": None}
+        for name in _ENV_OVERRIDE_FIELDS:
+            value = getattr(envConfig, name)
+            if value is not None:
+                overrides[name] = value
+
+        return self.withOverrides(**overrides)
+
+    def withOverrides(self, **updates: Any) -> "LauncherConfig":
+        """Copy the config with some fields replaced by already-valid values.
+
+        Unlike LauncherConfig(**config.model_dump()), this does not
+        re-validate every field and nested environment config.
+        """
+        copied = self.model_copy(update=updates)
+        # model_copy shares private attrs; derived caches must start empty
+        copied._effectiveCache = {}
+        copied._excludePathsSet = None
+        return copied
 
     def toUvicornKwargs(self) -> dict[str, Any]:
         """Convert config to uvicorn.run() keyword arguments."""
@@ -254,6 +286,8 @@ class LauncherConfig(BaseModel):
             "errorlog": "-",
             "loglevel": self.logLevel.lower(),
             "graceful_timeout": self.timeoutGracefulShutdown,
+            # Opt-in: a preloaded app survives HUP, so reloads need a restart
+            "preload_app": self.preloadApp,
         }
 
         if self.maxRequests > 0:
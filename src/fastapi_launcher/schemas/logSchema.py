@@ -1,6 +1,6 @@
 """Log-related schema models."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
@@ -8,6 +8,20 @@ from pydantic import BaseModel, Field
 
 from ..enums import LogFormat
 
+try:
+    import orjson
+
+    # Match pydantic's JSON output: aware UTC datetimes end in "Z"
+    _ORJSON_OPTIONS = orjson.OPT_UTC_Z
+except ImportError:
+    orjson = None  # type: ignore
+
+# Last (second, formatted string) pair, so strftime runs once per second
+# rather than once per log line; a single tuple keeps updates atomic. The
+# second is keyed by wall clock and UTC offset, since aware datetimes compare
+# equal across timezones when they are the same instant
+_lastTimeStr: tuple[Optional[tuple[datetime, Optional[timedelta]]], str] = (None, "")
+
 
 class LogConfig(BaseModel):
     """Logging configuration."""
@@ -20,7 +34,7 @@ class LogConfig(BaseModel):
     maxBytes: int = Field(default=10 * 1024 * 1024, alias="max_bytes")  # 10MB
     backupCount: int = Field(default=5, alias="backup_count")
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
 
 
 class AccessLogEntry(BaseModel):
@@ -41,17 +55,46 @@ class AccessLogEntry(BaseModel):
         default=False, alias="is_slow", description="Whether this is a slow request"
     )
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
 
     def toPrettyStr(self) -> str:
         """Format log entry for pretty output."""
+        global _lastTimeStr
+
         slowMarker = " [SLOW]" if self.isSlow else ""
-        timeStr = self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+        second = (
+            self.timestamp.replace(microsecond=0, tzinfo=None),
+            self.timestamp.utcoffset(),
+        )
+        lastSecond, timeStr = _lastTimeStr
+        if second != lastSecond:
+            timeStr = second[0].strftime("%Y-%m-%d %H:%M:%S")
+            _lastTimeStr = (second, timeStr)
+
         return (
             f"{timeStr} | {self.method:7} {self.path} | "
             f"{self.statusCode} | {self.responseTime:.3f}s{slowMarker}"
         )
 
+    def toJsonBytes(self) -> bytes:
+        """Format log entry as UTF-8 JSON bytes, using orjson if installed.
+
+        The orjson output is byte-for-byte the same as model_dump_json(by_alias=True).
+        """
+        if orjson is not None:
+            return orjson.dumps(
+                {key: getattr(self, name) for name, key in _JSON_KEYS},
+                option=_ORJSON_OPTIONS,
+            )
+        return self.__pydantic_serializer__.to_json(self, by_alias=True)
+
     def toJsonStr(self) -> str:
         """Format log entry for JSON output."""
-        return self.model_dump_json(by_alias=True)
+        return self.toJsonBytes().decode()
+
+
+# (attribute, JSON key) pairs in field order, matching model_dump(by_alias=True)
+_JSON_KEYS = tuple(
+    (name, field.alias or name) for name, field in AccessLogEntry.model_fields.items()
+)
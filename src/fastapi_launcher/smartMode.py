@@ -1,8 +1,9 @@
 """Smart environment detection module."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from dotenv import dotenv_values
 from loguru import logger
@@ -10,6 +11,30 @@ from loguru import logger
 from .enums import RunMode
 
 
+# Only these keys are read from .env for detection
+_DOTENV_KEYS = ("FA_ENV", "PYTHON_ENV")
+
+# Map common environment names to modes
+_ENV_MODE_MAP = {
+    "dev": RunMode.DEV,
+    "development": RunMode.DEV,
+    "local": RunMode.DEV,
+    "prod": RunMode.PROD,
+    "production": RunMode.PROD,
+}
+
+# Files that hint at the environment during heuristic detection; kept as
+# names so no Path objects are built unless an indicator matches
+_PRE_COMMIT_HOOK = (".git", "hooks", "pre-commit")
+_DEV_INDICATORS = (".pre-commit-config.yaml",)
+_PROD_INDICATORS = (
+    "Dockerfile",
+    "docker-compose.yml",
+    "docker-compose.yaml",
+    "Procfile",  # Heroku
+    "app.yaml",  # Google App Engine
+)
+
 # Environment detection priority:
 # 1. FA_ENV environment variable
 # 2. PYTHON_ENV environment variable
@@ -21,6 +46,10 @@ from .enums import RunMode
 def detectEnvironment(projectDir: Optional[Path] = None) -> tuple[str, RunMode]:
     """Detect the current environment and run mode.
 
+    Files are re-checked on every call, so adding a .env or an indicator
+    file takes effect immediately; the .env parse and the directory listing
+    are cached per (path, mtime) and can be reset with clearDetectionCaches().
+
     Args:
         projectDir: Project directory to check (defaults to cwd)
 
@@ -28,54 +57,171 @@ def detectEnvironment(projectDir: Optional[Path] = None) -> tuple[str, RunMode]:
         Tuple of (environment_name, run_mode)
     """
     if projectDir is None:
-        projectDir = Path.cwd()
+        projectDir = _cwdPath(os.getcwd())
+
+    return _detectEnvironment(projectDir, *_readEnvVars())
+
+
+@lru_cache(maxsize=4)
+def _cwdPath(cwd: str) -> Path:
+    """Get a reusable Path for the working directory.
+
+    Reusing one Path per directory keeps its cached str/hash, which makes
+    the detection cache lookup cheaper than hashing a fresh Path.cwd().
+
+    Args:
+        cwd: Result of os.getcwd()
+
+    Returns:
+        Path for the directory
+    """
+    return Path(cwd)
 
+
+def _readEnvVars() -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """Read the detection environment variables in one pass.
+
+    Returns:
+        Tuple of (FA_ENV, PYTHON_ENV, NODE_ENV) values
+    """
+    env = os.environ
+    return env.get("FA_ENV"), env.get("PYTHON_ENV"), env.get("NODE_ENV")
+
+
+def _detectEnvironment(
+    projectDir: Path,
+    faEnv: Optional[str],
+    pythonEnv: Optional[str],
+    nodeEnv: Optional[str],
+) -> tuple[str, RunMode]:
+    """Detect the environment from explicit environment variable values.
+
+    Args:
+        projectDir: Project directory to check
+        faEnv: Value of FA_ENV
+        pythonEnv: Value of PYTHON_ENV
+        nodeEnv: Value of NODE_ENV
+
+    Returns:
+        Tuple of (environment_name, run_mode)
+    """
     # 1. Check FA_ENV
-    faEnv = os.environ.get("FA_ENV")
     if faEnv:
         logger.debug(f"Environment detected from FA_ENV | env={faEnv}")
         return _normalizeEnv(faEnv)
 
     # 2. Check PYTHON_ENV
-    pythonEnv = os.environ.get("PYTHON_ENV")
     if pythonEnv:
         logger.debug(f"Environment detected from PYTHON_ENV | env={pythonEnv}")
         return _normalizeEnv(pythonEnv)
 
     # 3. Check NODE_ENV (for full-stack projects)
-    nodeEnv = os.environ.get("NODE_ENV")
     if nodeEnv:
         logger.debug(f"Environment detected from NODE_ENV | env={nodeEnv}")
         return _normalizeEnv(nodeEnv)
 
-    # 4. Check .env file
+    # 4. Check .env file; stat() doubles as the existence check
     envPath = projectDir / ".env"
-    if envPath.exists():
-        try:
-            dotenvValues = dotenv_values(envPath)
-
-            # Check for FA_ENV in .env
-            dotenvFaEnv = dotenvValues.get("FA_ENV")
-            if dotenvFaEnv:
-                logger.debug(
-                    f"Environment detected from .env FA_ENV | env={dotenvFaEnv}"
-                )
-                return _normalizeEnv(dotenvFaEnv)
-
-            # Check for PYTHON_ENV in .env
-            dotenvPythonEnv = dotenvValues.get("PYTHON_ENV")
-            if dotenvPythonEnv:
-                logger.debug(
-                    f"Environment detected from .env PYTHON_ENV | env={dotenvPythonEnv}"
-                )
-                return _normalizeEnv(dotenvPythonEnv)
-        except Exception as e:
-            logger.warning(f"Failed to read .env file | error={e}")
+    try:
+        envStat = envPath.stat()
+        dotenvValues = _loadDotenv(str(envPath), envStat.st_mtime_ns, envStat.st_size)
+    except FileNotFoundError:
+        dotenvValues = {}
+    except Exception as e:
+        logger.warning(f"Failed to read .env file | error={e}")
+        dotenvValues = {}
+
+    # Check for FA_ENV in .env
+    dotenvFaEnv = dotenvValues.get("FA_ENV")
+    if dotenvFaEnv:
+        logger.debug(f"Environment detected from .env FA_ENV | env={dotenvFaEnv}")
+        return _normalizeEnv(dotenvFaEnv)
+
+    # Check for PYTHON_ENV in .env
+    dotenvPythonEnv = dotenvValues.get("PYTHON_ENV")
+    if dotenvPythonEnv:
+        logger.debug(
+            f"Environment detected from .env PYTHON_ENV | env={dotenvPythonEnv}"
+        )
+        return _normalizeEnv(dotenvPythonEnv)
 
     # 5. Heuristic detection
     return _heuristicDetection(projectDir)
 
 
+def clearDetectionCaches() -> None:
+    """Forget cached .env parses and project directory listings."""
+    _loadDotenv.cache_clear()
+    _listProjectDir.cache_clear()
+
+
+@lru_cache(maxsize=32)
+def _loadDotenv(envPath: str, mtimeNs: int, size: int) -> dict[str, Optional[str]]:
+    """Parse a .env file, cached until its mtime or size changes.
+
+    Args:
+        envPath: Path to the .env file
+        mtimeNs: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+
+    Returns:
+        Parsed .env values (at least FA_ENV and PYTHON_ENV when present)
+    """
+    try:
+        return _scanDotenvKeys(Path(envPath), _DOTENV_KEYS)
+    except ValueError:
+        # Quoting or interpolation the scanner does not handle
+        return dotenv_values(envPath)
+
+
+def _scanDotenvKeys(envPath: Path, keys: tuple[str, ...]) -> dict[str, str]:
+    """Scan a .env file for a few keys without fully parsing it.
+
+    Later assignments override earlier ones, as in python-dotenv. Handles
+    plain, quoted and ``export``-prefixed assignments and trailing comments.
+
+    Args:
+        envPath: Path to the .env file
+        keys: Variable names to look for
+
+    Returns:
+        Mapping of the keys that were found to their values
+
+    Raises:
+        ValueError: If a wanted value needs escapes, interpolation or spans
+            several lines, or the file is not valid UTF-8
+    """
+    found: dict[str, str] = {}
+
+    with envPath.open(encoding="utf-8") as f:
+        for line in f:
+            name, sep, value = line.partition("=")
+            if not sep:
+                continue
+
+            name = name.strip()
+            if name.startswith("export "):
+                name = name[7:].lstrip()
+            if name not in keys:
+                continue
+
+            value = value.strip()
+            if value[:1] in ("'", '"'):
+                end = value.find(value[0], 1)
+                if end == -1:
+                    raise ValueError(f"Unterminated quoted value for {name}")
+                value = value[1:end]
+            else:
+                value = value.split(" #", 1)[0].rstrip()
+
+            if "$" in value or "\\" in value:
+                raise ValueError(f"Value for {name} needs full .env parsing")
+
+            found[name] = value
+
+    return found
+
+
 def _normalizeEnv(envValue: str) -> tuple[str, RunMode]:
     """Normalize environment value to (env_name, run_mode).
 
@@ -87,18 +233,9 @@ def _normalizeEnv(envValue: str) -> tuple[str, RunMode]:
     """
     envLower = envValue.lower().strip()
 
-    # Map common environment names to modes
-    devEnvNames = ("dev", "development", "local")
-    prodEnvNames = ("prod", "production")
-
-    if envLower in devEnvNames:
-        return envLower, RunMode.DEV
-    elif envLower in prodEnvNames:
-        return envLower, RunMode.PROD
-    else:
-        # Custom environment names (staging, qa, test, etc.)
-        # Default to prod mode for safety
-        return envLower, RunMode.PROD
+    # Custom environment names (staging, qa, test, etc.)
+    # default to prod mode for safety
+    return envLower, _ENV_MODE_MAP.get(envLower, RunMode.PROD)
 
 
 def _heuristicDetection(projectDir: Path) -> tuple[str, RunMode]:
@@ -116,28 +253,22 @@ def _heuristicDetection(projectDir: Path) -> tuple[str, RunMode]:
         Tuple of (env_name, run_mode)
     """
     # Check for development indicators
-    devIndicators = [
-        projectDir / ".git" / "hooks" / "pre-commit",
-        projectDir / ".pre-commit-config.yaml",
-    ]
-
-    for indicator in devIndicators:
-        if indicator.exists():
-            logger.debug(f"Development indicator found | path={indicator}")
+    if _hasPreCommitHook(projectDir):
+        hookPath = os.path.join(projectDir, *_PRE_COMMIT_HOOK)
+        logger.debug(f"Development indicator found | path={hookPath}")
+        return "dev", RunMode.DEV
+
+    entries = _scanProjectDir(projectDir)
+
+    for name in _DEV_INDICATORS:
+        if name in entries:
+            logger.debug(f"Development indicator found | path={projectDir / name}")
             return "dev", RunMode.DEV
 
     # Check for production indicators
-    prodIndicators = [
-        projectDir / "Dockerfile",
-        projectDir / "docker-compose.yml",
-        projectDir / "docker-compose.yaml",
-        projectDir / "Procfile",  # Heroku
-        projectDir / "app.yaml",  # Google App Engine
-    ]
-
-    for indicator in prodIndicators:
-        if indicator.exists():
-            logger.debug(f"Production indicator found | path={indicator}")
+    for name in _PROD_INDICATORS:
+        if name in entries:
+            logger.debug(f"Production indicator found | path={projectDir / name}")
             return "prod", RunMode.PROD
 
     # Default to development
@@ -145,9 +276,80 @@ def _heuristicDetection(projectDir: Path) -> tuple[str, RunMode]:
     return "dev", RunMode.DEV
 
 
+def _exists(path: Union[str, Path]) -> bool:
+    """Check that a path exists without fetching its attributes.
+
+    access(F_OK) skips filling in a stat struct, making it cheaper than
+    Path.exists() for pure existence checks.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        True if the path exists
+    """
+    return os.access(path, os.F_OK)
+
+
+def _hasPreCommitHook(projectDir: Path) -> bool:
+    """Check for a git pre-commit hook.
+
+    Args:
+        projectDir: Project directory
+
+    Returns:
+        True if .git/hooks/pre-commit exists
+    """
+    return _exists(os.path.join(projectDir, *_PRE_COMMIT_HOOK))
+
+
+def _scanProjectDir(projectDir: Path) -> frozenset[str]:
+    """Get the top-level entry names of the project directory.
+
+    The listing is cached until the directory's mtime changes, so detection
+    and getEnvironmentInfo share one directory read.
+
+    Args:
+        projectDir: Project directory
+
+    Returns:
+        Entry names; if the directory cannot be listed, only the indicator
+        files that exist
+    """
+    try:
+        return _listProjectDir(str(projectDir), os.stat(projectDir).st_mtime_ns)
+    except OSError:
+        return frozenset(
+            name
+            for name in _DEV_INDICATORS + _PROD_INDICATORS
+            if _exists(projectDir / name)
+        )
+
+
+@lru_cache(maxsize=8)
+def _listProjectDir(dirPath: str, mtimeNs: int) -> frozenset[str]:
+    """List a directory once per (path, mtime).
+
+    Args:
+        dirPath: Directory path
+        mtimeNs: Directory modification time in nanoseconds (cache key only)
+
+    Returns:
+        Entry names in the directory
+
+    Raises:
+        OSError: If the directory cannot be listed
+    """
+    with os.scandir(dirPath) as it:
+        return frozenset(entry.name for entry in it)
+
+
 def getEnvironmentInfo(projectDir: Optional[Path] = None) -> dict:
     """Get detailed environment detection information.
 
+    When FA_ENV, PYTHON_ENV or NODE_ENV decides the environment, the project
+    directory is not probed and the ``has_*`` entries are None.
+
     Args:
         projectDir: Project directory
 
@@ -155,21 +357,33 @@ def getEnvironmentInfo(projectDir: Optional[Path] = None) -> dict:
         Dictionary with detection details
     """
     if projectDir is None:
-        projectDir = Path.cwd()
+        projectDir = _cwdPath(os.getcwd())
 
-    detectedEnv, detectedMode = detectEnvironment(projectDir)
+    faEnv, pythonEnv, nodeEnv = _readEnvVars()
+    detectedEnv, detectedMode = _detectEnvironment(
+        projectDir, faEnv, pythonEnv, nodeEnv
+    )
 
-    return {
+    info = {
         "detected_env": detectedEnv,
         "detected_mode": detectedMode.value,
-        "fa_env": os.environ.get("FA_ENV"),
-        "python_env": os.environ.get("PYTHON_ENV"),
-        "node_env": os.environ.get("NODE_ENV"),
+        "fa_env": faEnv,
+        "python_env": pythonEnv,
+        "node_env": nodeEnv,
         "project_dir": str(projectDir),
-        "has_pre_commit": (projectDir / ".git" / "hooks" / "pre-commit").exists(),
-        "has_dockerfile": (projectDir / "Dockerfile").exists(),
-        "has_docker_compose": (
-            (projectDir / "docker-compose.yml").exists()
-            or (projectDir / "docker-compose.yaml").exists()
-        ),
+        "has_pre_commit": None,
+        "has_dockerfile": None,
+        "has_docker_compose": None,
     }
+
+    # Indicators only matter when no environment variable decided
+    if faEnv or pythonEnv or nodeEnv:
+        return info
+
+    entries = _scanProjectDir(projectDir)
+    info["has_pre_commit"] = _hasPreCommitHook(projectDir)
+    info["has_dockerfile"] = "Dockerfile" in entries
+    info["has_docker_compose"] = (
+        "docker-compose.yml" in entries or "docker-compose.yaml" in entries
+    )
+    return info
@@ -1,7 +1,8 @@
 """Rich UI components for beautiful terminal output."""
 
 from datetime import timedelta
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Iterable, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -12,6 +13,9 @@ from rich.text import Text
 from .enums import RunMode
 from .schemas import LauncherConfig
 
+# Rich is imported eagerly on purpose: the CLI already loads rich.table and
+# rich.progress through httpx (health.py) and logs.py, so deferring the
+# imports here would not shorten startup
 console = Console()
 
 
@@ -36,6 +40,17 @@ METHOD_COLORS = {
     "OPTIONS": "dim white",
 }
 
+# Access log markup is built once; it is looked up for every logged request
+_METHOD_MARKUP = {
+    method: f"[{color}]{method:7}[/]" for method, color in METHOD_COLORS.items()
+}
+
+# Config values rendered specially by type; everything else uses str()
+_VALUE_FORMATTERS = {
+    bool: lambda value: "[green]true[/]" if value else "[red]false[/]",
+    type(None): lambda value: "[dim]not set[/]",
+}
+
 
 def printStartupPanel(config: LauncherConfig) -> None:
     """Print startup information panel."""
@@ -161,22 +176,25 @@ def printWorkerStatusTable(workerStatuses: list) -> None:
 
 def _formatUptime(uptime: timedelta) -> str:
     """Format uptime duration."""
-    totalSeconds = int(uptime.total_seconds())
+    return _formatUptimeSeconds(int(uptime.total_seconds()))
+
 
+@lru_cache(maxsize=1024)
+def _formatUptimeSeconds(totalSeconds: int) -> str:
+    """Format a whole-second uptime; workers started together share entries."""
     days, remainder = divmod(totalSeconds, 86400)
     hours, remainder = divmod(remainder, 3600)
     minutes, seconds = divmod(remainder, 60)
 
-    parts = []
-    if days > 0:
-        parts.append(f"{days}d")
-    if hours > 0:
-        parts.append(f"{hours}h")
+    text = f"{seconds}s"
     if minutes > 0:
-        parts.append(f"{minutes}m")
-    parts.append(f"{seconds}s")
+        text = f"{minutes}m {text}"
+    if hours > 0:
+        text = f"{hours}h {text}"
+    if days > 0:
+        text = f"{days}d {text}"
 
-    return " ".join(parts)
+    return text
 
 
 def printErrorPanel(
@@ -244,13 +262,7 @@ def printConfigTable(config: dict[str, Any], title: str = "Configuration") -> No
     table.add_column("Source", style="dim")
 
     for key, value in config.items():
-        if isinstance(value, bool):
-            valueStr = "[green]true[/]" if value else "[red]false[/]"
-        elif value is None:
-            valueStr = "[dim]not set[/]"
-        else:
-            valueStr = str(value)
-
+        valueStr = _VALUE_FORMATTERS.get(type(value), str)(value)
         table.add_row(key, valueStr, "")
 
     console.print(table)
@@ -258,12 +270,25 @@ def printConfigTable(config: dict[str, Any], title: str = "Configuration") -> No
 
 def colorizeHttpMethod(method: str) -> str:
     """Get Rich markup for HTTP method."""
+    return _METHOD_MARKUP.get(method) or _fallbackMethodMarkup(method)
+
+
+@lru_cache(maxsize=64)
+def _fallbackMethodMarkup(method: str) -> str:
+    """Build Rich markup for a lowercase or non-standard HTTP method."""
     color = METHOD_COLORS.get(method.upper(), "white")
     return f"[{color}]{method:7}[/]"
 
 
 def colorizeStatusCode(code: int) -> str:
     """Get Rich markup for HTTP status code."""
+    if 0 <= code < len(_STATUS_MARKUP):
+        return _STATUS_MARKUP[code]
+    return _statusCodeMarkup(code)
+
+
+def _statusCodeMarkup(code: int) -> str:
+    """Build Rich markup for HTTP status code."""
     if code < 200:
         color = "dim"
     elif code < 300:
@@ -277,6 +302,10 @@ def colorizeStatusCode(code: int) -> str:
     return f"[{color}]{code}[/]"
 
 
+# Built once from _statusCodeMarkup, so it follows it; looked up per request
+_STATUS_MARKUP = tuple(_statusCodeMarkup(code) for code in range(1000))
+
+
 def printHealthStatus(
     healthy: bool, url: str, responseTime: Optional[float] = None
 ) -> None:
@@ -313,11 +342,36 @@ def printAccessLogEntry(
     isSlow: bool = False,
 ) -> None:
     """Print a formatted access log entry."""
-    methodStr = colorizeHttpMethod(method)
-    statusStr = colorizeStatusCode(statusCode)
-    timeColor = "red" if isSlow else "dim"
-    slowMarker = " [bold red][SLOW][/]" if isSlow else ""
+    printAccessLogEntries([(method, path, statusCode, responseTime, isSlow)])
 
-    console.print(
-        f"{methodStr} {path:40} {statusStr} [{timeColor}]{responseTime:.3f}s[/]{slowMarker}"
-    )
+
+def printAccessLogEntries(
+    entries: Iterable[tuple[str, str, int, float, bool]],
+) -> None:
+    """Print access log entries with a single console write.
+
+    When output is not a terminal (a pipe or log file), the entries are
+    written as plain text directly, skipping Rich's markup and render path.
+
+    Args:
+        entries: (method, path, statusCode, responseTime, isSlow) tuples
+    """
+    if not console.is_terminal:
+        lines = [
+            f"{method:7} {path:40} {statusCode} {responseTime:.3f}s"
+            f"{' [SLOW]' if isSlow else ''}\n"
+            for method, path, statusCode, responseTime, isSlow in entries
+        ]
+        if lines:
+            console.file.write("".join(lines))
+            console.file.flush()
+        return
+
+    lines = [
+        f"{colorizeHttpMethod(method)} {path:40} {colorizeStatusCode(statusCode)} "
+        f"[{'red' if isSlow else 'dim'}]{responseTime:.3f}s[/]"
+        f"{' [bold red][SLOW][/]' if isSlow else ''}"
+        for method, path, statusCode, responseTime, isSlow in entries
+    ]
+    if lines:
+        console.print("\n".join(lines))
@@ -1,13 +1,19 @@
 """Pytest configuration and fixtures for FastAPI Launcher tests."""
 
 import os
+import shutil
 import sys
-import tempfile
+import uuid
 from pathlib import Path
-from typing import Generator
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from typing import Any, Callable, Generator
+from unittest.mock import MagicMock, patch
 
 import pytest
+import typer
+
+from fastapi_launcher.schemas import LauncherConfig
+from fastapi_launcher.smartMode import clearDetectionCaches
 
 # Skip tests that use Unix-only features on Windows
 if sys.platform == "win32":
@@ -15,19 +21,33 @@ if sys.platform == "win32":
         "test_daemon.py",  # Uses os.fork
     ]
 
+# Attribute names for config mocks, read once instead of per test
+_LAUNCHER_CONFIG_ATTRS = dir(LauncherConfig())
 
-@pytest.fixture
-def tempDir() -> Generator[Path, None, None]:
-    """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+
+@pytest.fixture(scope="session")
+def sessionTempRoot(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one base directory that per-test temp directories live under."""
+    return tmp_path_factory.mktemp("fa-tests")
 
 
 @pytest.fixture
-def mockProjectDir(tempDir: Path) -> Path:
-    """Create a mock FastAPI project directory structure."""
+def tempDir(sessionTempRoot: Path) -> Generator[Path, None, None]:
+    """Create a temporary directory for tests, removed after the test."""
+    # A flat uuid subdirectory skips tmp_path's per-test numbered-dir bookkeeping
+    path = sessionTempRoot / uuid.uuid4().hex
+    path.mkdir()
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def mockProjectTemplate(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the mock FastAPI project once per session."""
+    templateDir = tmp_path_factory.mktemp("mockProject")
+
     # Create pyproject.toml with fastapi-launcher config
-    pyprojectPath = tempDir / "pyproject.toml"
+    pyprojectPath = templateDir / "pyproject.toml"
     pyprojectPath.write_text("""
 [project]
 name = "test-project"
@@ -40,7 +60,7 @@ port = 8000
 """)
 
     # Create main.py with a FastAPI app
-    mainPath = tempDir / "main.py"
+    mainPath = templateDir / "main.py"
     mainPath.write_text("""
 from fastapi import FastAPI
 
@@ -55,6 +75,14 @@ def health():
     return {"status": "healthy"}
 """)
 
+    return templateDir
+
+
+@pytest.fixture
+def mockProjectDir(tempDir: Path, mockProjectTemplate: Path) -> Path:
+    """Create a mock FastAPI project directory structure."""
+    # Tests may modify the project, so each gets its own copy
+    shutil.copytree(mockProjectTemplate, tempDir, dirs_exist_ok=True)
     return tempDir
 
 
@@ -97,6 +125,7 @@ def cleanEnv() -> Generator[None, None, None]:
     
     # Restore original variables
     os.environ.update(originalEnv)
+    clearDetectionCaches()
 
 
 @pytest.fixture
@@ -115,3 +144,67 @@ def mockPidFile(mockRuntimeDir: Path) -> Path:
     pidFile = mockRuntimeDir / "fa.pid"
     pidFile.write_text(str(os.getpid()))
     return pidFile
+
+
+@pytest.fixture
+def mockConfig(tempDir: Path) -> MagicMock:
+    """Create a launcher config mock rooted in the temp directory."""
+    config = MagicMock(spec_set=_LAUNCHER_CONFIG_ATTRS)
+    config.runtimeDir = tempDir / "runtime"
+    config.host = "127.0.0.1"
+    config.port = 8000
+    config.healthPath = "/health"
+    config.logFormat = "pretty"
+    return config
+
+
+@pytest.fixture
+def patchLoadConfig(mockConfig: MagicMock) -> Generator[MagicMock, None, None]:
+    """Patch the CLI's loadConfig to return mockConfig."""
+    with patch(
+        "fastapi_launcher.cli.loadConfig", return_value=mockConfig
+    ) as mockLoadConfig:
+        yield mockLoadConfig
+
+
+@pytest.fixture
+def mockLaunch() -> Generator[MagicMock, None, None]:
+    """Patch the CLI's launch with a mock that checks call signatures."""
+    with patch("fastapi_launcher.cli.launch", autospec=True) as mockLaunchFunc:
+        yield mockLaunchFunc
+
+
+@pytest.fixture
+def serverProcessMocks(mocker, patchLoadConfig: MagicMock) -> SimpleNamespace:
+    """Patch the CLI's process helpers so a server looks like it is running."""
+    return SimpleNamespace(
+        loadConfig=patchLoadConfig,
+        readPidFile=mocker.patch("fastapi_launcher.cli.readPidFile", return_value=12345),
+        isProcessRunning=mocker.patch(
+            "fastapi_launcher.cli.isProcessRunning", return_value=True
+        ),
+        terminateProcess=mocker.patch(
+            "fastapi_launcher.cli.terminateProcess", return_value=True
+        ),
+        removePidFile=mocker.patch("fastapi_launcher.cli.removePidFile"),
+        waitForPortFree=mocker.patch(
+            "fastapi_launcher.cli.waitForPortFree", return_value=True
+        ),
+        createSpinner=mocker.patch("fastapi_launcher.cli.createSpinner"),
+        sendSignal=mocker.patch("fastapi_launcher.process.sendSignal", return_value=True),
+    )
+
+
+def _invokeCommand(command: Callable[..., Any], **kwargs: Any) -> int:
+    """Call a CLI command function directly and return its exit code."""
+    try:
+        command(**kwargs)
+    except typer.Exit as e:
+        return e.exit_code
+    return 0
+
+
+@pytest.fixture
+def invokeCommand() -> Callable[..., int]:
+    """Run CLI command functions without Click's argument parsing."""
+    return _invokeCommand
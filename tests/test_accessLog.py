@@ -121,6 +121,20 @@ class TestShouldLogRequest:
         """Test with empty exclude list."""
         assert shouldLogRequest("/anything", []) is True
 
+    @pytest.mark.parametrize(
+        "path",
+        ["/", "/health", "/health/", "/health/live", "/healthz", "/internal/a/b", "/api", "api", ""],
+    )
+    @pytest.mark.parametrize(
+        "excludePaths",
+        [["/health", "/internal"], ["/"], ["/health/"], [""], []],
+    )
+    def test_set_matches_list(self, path: str, excludePaths: list[str]) -> None:
+        """Test frozenset lookups give the same answer as the list scan."""
+        assert shouldLogRequest(path, frozenset(excludePaths)) == shouldLogRequest(
+            path, excludePaths
+        )
+
 
 class TestIsSlowRequest:
     """Tests for slow request detection."""
@@ -1,85 +1,132 @@
 """Tests for configuration and dependency checker."""
 
+from io import StringIO
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from typing import Generator, Optional
 
 import pytest
+from rich.console import Console
 
 from fastapi_launcher.checker import (
     CheckReport,
     CheckResult,
+    _findSpec,
+    _parsePyproject,
     checkAppPath,
     checkConfig,
     checkDependency,
     checkFastAPI,
     checkPyprojectToml,
     checkUvicorn,
+    printCheckReport,
     runAllChecks,
     showConfig,
 )
-from fastapi_launcher.schemas import LauncherConfig
+
+_INVALID_PORT_TOML = b"[tool.fastapi-launcher]\nport = -1\n"
+_PORT_TOO_HIGH_TOML = b"[tool.fastapi-launcher]\nport = 70000\n"
+_NO_LAUNCHER_TOML = b"[project]\nname = 'test'\n"
+
+
+
+@pytest.fixture(autouse=True)
+def clearCheckerCaches() -> Generator[None, None, None]:
+    """Keep cached lookups and parses from leaking between tests."""
+    _findSpec.cache_clear()
+    _parsePyproject.cache_clear()
+    yield
+    _findSpec.cache_clear()
+    _parsePyproject.cache_clear()
+
+
+
+@pytest.fixture
+def quietConsole(monkeypatch: pytest.MonkeyPatch) -> StringIO:
+    """Send Rich output to an in-memory, non-terminal console."""
+    output = StringIO()
+    quiet = Console(file=output)
+    monkeypatch.setattr("fastapi_launcher.ui.console", quiet)
+    monkeypatch.setattr("fastapi_launcher.checker.console", quiet)
+    return output
+
+
+
+@pytest.fixture(scope="session")
+def allChecksReport(mockProjectTemplate: Path) -> CheckReport:
+    """Run the full check pipeline on the mock project once per session."""
+    return runAllChecks(mockProjectTemplate)
+
+
+
+@pytest.fixture(scope="session")
+def missingDependencyResult() -> CheckResult:
+    """Check a missing module once; the negative lookup tries every finder."""
+    return checkDependency("nonexistent_package_xyz")
+
+
+@pytest.fixture(scope="session")
+def emptyProjectDir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Empty project directory shared by tests that only read from it."""
+    return tmp_path_factory.mktemp("emptyProject")
+
+
+@pytest.fixture
+def stubConfig() -> SimpleNamespace:
+    """Stand-in config for checkAppPath, which only reads ``app``."""
+    return SimpleNamespace(app=None)
+
 
 
 class TestCheckResult:
     """Tests for CheckResult dataclass."""
 
-    def test_passed_result(self) -> None:
-        """Test passed check result."""
-        result = CheckResult(
-            name="Test Check",
-            passed=True,
-            message="All good",
-        )
-        
-        assert result.passed is True
-        assert result.suggestions == []
-
-    def test_failed_result_with_suggestions(self) -> None:
-        """Test failed result with suggestions."""
-        result = CheckResult(
-            name="Test Check",
-            passed=False,
-            message="Something wrong",
-            suggestions=["Try this", "Or that"],
-        )
-        
-        assert result.passed is False
-        assert len(result.suggestions) == 2
+    @pytest.mark.parametrize(
+        ("passed", "suggestions", "expectedSuggestions"),
+        [(True, None, 0), (False, ["Try this", "Or that"], 2)],
+    )
+    def test_check_result(
+        self, passed: bool, suggestions: Optional[list[str]], expectedSuggestions: int
+    ) -> None:
+        """Test check results with and without suggestions."""
+        kwargs = {"suggestions": suggestions} if suggestions is not None else {}
+        result = CheckResult(name="Test Check", passed=passed, message="msg", **kwargs)
+
+        assert result.passed is passed
+        assert len(result.suggestions) == expectedSuggestions
 
 
 class TestCheckReport:
     """Tests for CheckReport."""
 
-    def test_all_passed(self) -> None:
-        """Test all checks passed."""
+    @pytest.mark.parametrize(
+        ("outcomes", "allPassed", "passedCount", "failedCount"),
+        [
+            ([True, True], True, 2, 0),
+            ([True, False], False, 1, 1),
+            ([], True, 0, 0),
+        ],
+        ids=["all-passed", "some-failed", "empty"],
+    )
+    def test_report_counts(
+        self,
+        outcomes: list[bool],
+        allPassed: bool,
+        passedCount: int,
+        failedCount: int,
+    ) -> None:
+        """Test report summary properties for different result mixes."""
         report = CheckReport(results=[
-            CheckResult("Check 1", True, "OK"),
-            CheckResult("Check 2", True, "OK"),
+            CheckResult(f"Check {i}", passed, "OK" if passed else "Failed")
+            for i, passed in enumerate(outcomes, 1)
         ])
-        
-        assert report.allPassed is True
-        assert report.passedCount == 2
-        assert report.failedCount == 0
 
-    def test_some_failed(self) -> None:
-        """Test some checks failed."""
-        report = CheckReport(results=[
-            CheckResult("Check 1", True, "OK"),
-            CheckResult("Check 2", False, "Failed"),
-        ])
-        
-        assert report.allPassed is False
-        assert report.passedCount == 1
-        assert report.failedCount == 1
-
-    def test_empty_report(self) -> None:
-        """Test empty report."""
-        report = CheckReport()
-        
-        assert report.allPassed is True
-        assert report.passedCount == 0
+        assert report.allPassed is allPassed
+        assert report.passedCount == passedCount
+        assert report.failedCount == failedCount
 
 
+@pytest.mark.xdist_group("checker_dep")
 class TestCheckDependency:
     """Tests for dependency checking."""
 
@@ -89,55 +136,50 @@ class TestCheckDependency:
         
         assert result.passed is True
 
-    def test_missing_dependency(self) -> None:
+    def test_missing_dependency(self, missingDependencyResult: CheckResult) -> None:
         """Test checking missing dependency."""
-        result = checkDependency("nonexistent_package_xyz")
-        
-        assert result.passed is False
-        assert len(result.suggestions) > 0
+        assert missingDependencyResult.passed is False
+        assert len(missingDependencyResult.suggestions) > 0
 
+    def test_lookup_cached(self, mocker) -> None:
+        """Test repeated checks of one module search sys.path once."""
+        mockFindSpec = mocker.patch(
+            "fastapi_launcher.checker.importlib.util.find_spec", return_value=None
+        )
 
-class TestCheckFastAPI:
-    """Tests for FastAPI dependency check."""
+        checkDependency("some_module")
+        checkDependency("some_module")
 
-    @patch("fastapi_launcher.checker.importlib.util.find_spec")
-    def test_fastapi_installed(self, mockFindSpec) -> None:
-        """Test when FastAPI is installed."""
-        mockFindSpec.return_value = True
-        
-        result = checkFastAPI()
-        
-        assert result.passed is True
+        mockFindSpec.assert_called_once_with("some_module")
 
-    @patch("fastapi_launcher.checker.importlib.util.find_spec")
-    def test_fastapi_not_installed(self, mockFindSpec) -> None:
-        """Test when FastAPI is not installed."""
-        mockFindSpec.return_value = None
-        
-        result = checkFastAPI()
-        
-        assert result.passed is False
 
+@pytest.mark.xdist_group("checker_dep")
+class TestCheckServerDependencies:
+    """Tests for the FastAPI and uvicorn dependency checks."""
 
-class TestCheckUvicorn:
-    """Tests for uvicorn dependency check."""
+    @pytest.mark.parametrize(
+        "checker", [checkFastAPI, checkUvicorn], ids=["fastapi", "uvicorn"]
+    )
+    @pytest.mark.parametrize(("specValue", "expected"), [(True, True), (None, False)])
+    def test_dependency_check(self, mocker, checker, specValue, expected: bool) -> None:
+        """Test each check reports whether its package is importable."""
+        mocker.patch(
+            "fastapi_launcher.checker.importlib.util.find_spec",
+            return_value=specValue,
+        )
 
-    @patch("fastapi_launcher.checker.importlib.util.find_spec")
-    def test_uvicorn_installed(self, mockFindSpec) -> None:
-        """Test when uvicorn is installed."""
-        mockFindSpec.return_value = True
-        
-        result = checkUvicorn()
-        
-        assert result.passed is True
+        result = checker()
+
+        assert result.passed is expected
 
 
+@pytest.mark.xdist_group("checker_fs")
 class TestCheckPyprojectToml:
     """Tests for pyproject.toml check."""
 
-    def test_no_pyproject(self, tempDir: Path) -> None:
+    def test_no_pyproject(self, emptyProjectDir: Path) -> None:
         """Test when pyproject.toml doesn't exist."""
-        result = checkPyprojectToml(tempDir)
+        result = checkPyprojectToml(emptyProjectDir)
         
         assert result.passed is True
         assert "defaults" in result.message.lower()
@@ -151,14 +193,24 @@ class TestCheckPyprojectToml:
 
     def test_without_launcher_section(self, tempDir: Path) -> None:
         """Test without launcher section."""
-        pyprojectPath = tempDir / "pyproject.toml"
-        pyprojectPath.write_text("[project]\nname = 'test'\n")
-        
+        (tempDir / "pyproject.toml").write_bytes(_NO_LAUNCHER_TOML)
+
         result = checkPyprojectToml(tempDir)
         
         assert result.passed is True
 
+    def test_reparses_after_change(self, tempDir: Path) -> None:
+        """Test that an edited pyproject.toml is not served from the cache."""
+        pyprojectPath = tempDir / "pyproject.toml"
+        pyprojectPath.write_bytes(_NO_LAUNCHER_TOML)
+        assert "No [tool.fastapi-launcher]" in checkPyprojectToml(tempDir).message
 
+        pyprojectPath.write_bytes(_NO_LAUNCHER_TOML + _INVALID_PORT_TOML)
+
+        assert "Found [tool.fastapi-launcher]" in checkPyprojectToml(tempDir).message
+
+
+@pytest.mark.xdist_group("checker_fs")
 class TestCheckConfig:
     """Tests for configuration check."""
 
@@ -168,98 +220,96 @@ class TestCheckConfig:
         
         assert result.passed is True
 
-    def test_invalid_config(self, tempDir: Path) -> None:
+    @pytest.mark.parametrize("payload", [_INVALID_PORT_TOML, _PORT_TOO_HIGH_TOML])
+    def test_invalid_config(self, tempDir: Path, payload: bytes) -> None:
         """Test with invalid configuration."""
-        pyprojectPath = tempDir / "pyproject.toml"
-        pyprojectPath.write_text("""
-[tool.fastapi-launcher]
-port = -1
-""")
-        
+        (tempDir / "pyproject.toml").write_bytes(payload)
+
         result = checkConfig(tempDir)
         
         assert result.passed is False
 
 
+@pytest.mark.xdist_group("checker_fs")
 class TestCheckAppPath:
     """Tests for app path check."""
 
-    def test_app_discovered(self, mockProjectDir: Path) -> None:
+    def test_app_discovered(
+        self, mockProjectDir: Path, stubConfig: SimpleNamespace
+    ) -> None:
         """Test when app is discovered."""
-        config = LauncherConfig()
-        
-        result = checkAppPath(config, mockProjectDir)
+        result = checkAppPath(stubConfig, mockProjectDir)
         
         assert result.passed is True
         assert "main:app" in result.message
 
-    def test_no_app_found(self, tempDir: Path) -> None:
+    def test_no_app_found(
+        self, emptyProjectDir: Path, stubConfig: SimpleNamespace
+    ) -> None:
         """Test when no app is found."""
-        config = LauncherConfig()
-        
-        result = checkAppPath(config, tempDir)
+        result = checkAppPath(stubConfig, emptyProjectDir)
         
         assert result.passed is False
         assert len(result.suggestions) > 0
 
 
+@pytest.mark.xdist_group("checker_fs")
 class TestRunAllChecks:
     """Tests for running all checks."""
 
-    def test_run_all_checks(self, mockProjectDir: Path) -> None:
-        """Test running all checks."""
-        report = runAllChecks(mockProjectDir)
-        
-        assert len(report.results) >= 4  # At least 4 checks
+    def test_run_all_checks(self, allChecksReport: CheckReport) -> None:
+        """Test running all checks includes every check type."""
+        assert len(allChecksReport.results) >= 4  # At least 4 checks
 
-    def test_includes_all_check_types(self, mockProjectDir: Path) -> None:
-        """Test that all check types are included."""
-        report = runAllChecks(mockProjectDir)
-        
-        names = [r.name for r in report.results]
-        
-        # Check key checks are present
-        assert any("fastapi" in n.lower() for n in names)
-        assert any("uvicorn" in n.lower() for n in names)
-        assert any("pyproject" in n.lower() for n in names)
+        # Check key checks are present, in one pass over the results
+        foundFastapi = foundUvicorn = foundPyproject = False
+        for result in allChecksReport.results:
+            name = result.name.lower()
+            foundFastapi |= "fastapi" in name
+            foundUvicorn |= "uvicorn" in name
+            foundPyproject |= "pyproject" in name
+
+        assert foundFastapi
+        assert foundUvicorn
+        assert foundPyproject
 
 
+@pytest.mark.xdist_group("checker_fs")
 class TestShowConfig:
     """Tests for showing configuration."""
 
-    def test_show_config(self, mockProjectDir: Path) -> None:
+    def test_show_config(self, mockProjectDir: Path, quietConsole: StringIO) -> None:
         """Test showing configuration."""
-        # Just verify no exception
         showConfig(mockProjectDir)
 
-    def test_show_config_error(self, tempDir: Path) -> None:
+        assert "Current Configuration" in quietConsole.getvalue()
+
+    def test_show_config_error(self, tempDir: Path, quietConsole: StringIO) -> None:
         """Test showing config with error."""
-        pyprojectPath = tempDir / "pyproject.toml"
-        pyprojectPath.write_text("[tool.fastapi-launcher]\nport = -1\n")
-        
+        (tempDir / "pyproject.toml").write_bytes(_INVALID_PORT_TOML)
+
         # Should not raise, just print error
         showConfig(tempDir)
 
+        assert "Error loading configuration" in quietConsole.getvalue()
+
 
 class TestPrintCheckReport:
     """Tests for printing check report."""
 
-    def test_print_all_passed(self) -> None:
+    def test_print_all_passed(self, quietConsole: StringIO) -> None:
         """Test printing all passed report."""
-        from fastapi_launcher.checker import printCheckReport
-        
         report = CheckReport(results=[
             CheckResult("Check 1", True, "OK"),
             CheckResult("Check 2", True, "OK"),
         ])
         
-        # Just verify no exception
         printCheckReport(report)
 
-    def test_print_with_failures(self) -> None:
+        assert "All 2 checks passed!" in quietConsole.getvalue()
+
+    def test_print_with_failures(self, quietConsole: StringIO) -> None:
         """Test printing report with failures."""
-        from fastapi_launcher.checker import printCheckReport
-        
         report = CheckReport(results=[
             CheckResult("Check 1", True, "OK"),
             CheckResult("Check 2", False, "Failed", suggestions=["Try this"]),
@@ -267,29 +317,30 @@ class TestPrintCheckReport:
         
         printCheckReport(report)
 
+        assert "→ Try this" in quietConsole.getvalue()
+
 
+@pytest.mark.xdist_group("checker_fs")
 class TestCheckAppPathWithCandidates:
     """Tests for checkAppPath with candidates."""
 
-    def test_app_path_with_candidates(self, tempDir: Path) -> None:
+    def test_app_path_with_candidates(
+        self, emptyProjectDir: Path, mocker, stubConfig: SimpleNamespace
+    ) -> None:
         """Test checkAppPath shows candidates when not found."""
-        from fastapi_launcher.discover import getAppPathCandidates
-        
-        # Create a file that looks like it might have an app
-        mainPath = tempDir / "main.py"
-        mainPath.write_text("from fastapi import FastAPI\napp = FastAPI()")
-        
-        config = LauncherConfig()
-        
-        with patch("fastapi_launcher.checker.discoverApp") as mockDiscover:
-            mockDiscover.return_value = None
-            
-            result = checkAppPath(config, tempDir)
-            
-            # Should fail but show candidates
-            # Note: it might pass if discovery works
+        mocker.patch("fastapi_launcher.checker.discoverApp", return_value=None)
+        mocker.patch(
+            "fastapi_launcher.checker.getAppPathCandidates", return_value=["main:app"]
+        )
+
+        result = checkAppPath(stubConfig, emptyProjectDir)
+
+        # Should fail but show candidates
+        assert result.passed is False
+        assert "Found candidates: main:app" in result.suggestions
 
 
+@pytest.mark.xdist_group("checker_dep")
 class TestCheckDependencyPackageName:
     """Tests for checkDependency with package name."""
 
@@ -302,18 +353,15 @@ class TestCheckDependencyPackageName:
         assert "Pillow" in result.suggestions[0]
 
 
+@pytest.mark.xdist_group("checker_fs")
 class TestCheckConfigErrors:
     """Tests for checkConfig error handling."""
 
-    def test_check_config_with_env_error(self, tempDir: Path) -> None:
+    def test_check_config_with_env_error(
+        self, emptyProjectDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test checkConfig with environment variable errors."""
-        import os
-        
-        # Set invalid env var
-        os.environ["FA_PORT"] = "invalid"
-        
-        try:
-            result = checkConfig(tempDir)
-            # Should still work, invalid values are ignored
-        finally:
-            del os.environ["FA_PORT"]
+        monkeypatch.setenv("FA_PORT", "invalid")
+
+        # Should still work, invalid values are ignored
+        checkConfig(emptyProjectDir)
@@ -1,32 +1,68 @@
 """Tests for CLI commands."""
 
-import os
+import shutil
 import sys
+from datetime import timedelta
+from io import StringIO
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Callable, Optional
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
-from typer.testing import CliRunner
-
-from fastapi_launcher.cli import app
+import typer.main
+from click.testing import CliRunner
+from rich.console import Console
+
+from fastapi_launcher.checker import CheckReport, CheckResult
+from fastapi_launcher.cli import (
+    _readPersistedEnvName,
+    app,
+    check as checkCommand,
+    config as configCommand,
+    versionCallback,
+)
+from fastapi_launcher.enums import RunMode, ServerBackend
+from fastapi_launcher.health import HealthCheckResult
+from fastapi_launcher.launcher import LaunchError
+from fastapi_launcher.port import PortInfo
+from fastapi_launcher.process import ProcessStatus, WorkerStatus
 
 
 runner = CliRunner()
 
+# Build the Click command tree once instead of on every invoke
+cli = typer.main.get_command(app)
+
+_PYPROJECT_BASIC = b'[project]\nname = "test-project"\nversion = "0.1.0"\n'
+
+_LOG_SAMPLE = "\n".join(f"Line {i}" for i in range(100)).encode()
+
+
+@pytest.fixture(scope="session")
+def sampleLogFile(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a 100-line log file once per session for tests to copy."""
+    logFile = tmp_path_factory.mktemp("logTemplate") / "fa.log"
+    logFile.write_bytes(_LOG_SAMPLE)
+    return logFile
+
 
 class TestVersionCommand:
     """Tests for version command."""
 
-    def test_version_flag(self) -> None:
-        """Test --version flag."""
-        result = runner.invoke(app, ["--version"])
-        
-        assert result.exit_code == 0
-        assert "FastAPI Launcher" in result.output
+    def test_version_flag(
+        self, monkeypatch: pytest.MonkeyPatch, invokeCommand: Callable[..., int]
+    ) -> None:
+        """Test --version callback prints the version and exits."""
+        output = StringIO()
+        monkeypatch.setattr("fastapi_launcher.cli.console", Console(file=output))
+
+        assert invokeCommand(versionCallback, value=True) == 0
+        assert "FastAPI Launcher" in output.getvalue()
 
     def test_version_short_flag(self) -> None:
         """Test -v flag."""
-        result = runner.invoke(app, ["-v"])
+        result = runner.invoke(cli, ["-v"], catch_exceptions=False)
         
         assert result.exit_code == 0
 
@@ -34,202 +70,173 @@ class TestVersionCommand:
 class TestDevCommand:
     """Tests for dev command."""
 
-    @patch("fastapi_launcher.cli.launch")
-    def test_dev_default_options(self, mockLaunch: MagicMock, mockProjectDir: Path) -> None:
-        """Test dev command with defaults."""
-        os.chdir(mockProjectDir)
-        
-        result = runner.invoke(app, ["dev"])
-        
-        # May fail due to app discovery, but launch should be attempted
-        mockLaunch.assert_called_once()
-        callArgs = mockLaunch.call_args
-        assert callArgs.kwargs["cliArgs"]["reload"] is True
-
-    @patch("fastapi_launcher.cli.launch")
-    def test_dev_custom_port(self, mockLaunch: MagicMock, mockProjectDir: Path) -> None:
-        """Test dev command with custom port."""
-        os.chdir(mockProjectDir)
-        
-        result = runner.invoke(app, ["dev", "--port", "9000"])
-        
-        mockLaunch.assert_called_once()
-        callArgs = mockLaunch.call_args
-        assert callArgs.kwargs["cliArgs"]["port"] == 9000
-
-    @patch("fastapi_launcher.cli.launch")
-    def test_dev_no_reload(self, mockLaunch: MagicMock, mockProjectDir: Path) -> None:
-        """Test dev command without reload."""
-        os.chdir(mockProjectDir)
+    @pytest.mark.parametrize(
+        ("args", "key", "expected"),
+        [
+            ([], "reload", True),
+            (["--port", "9000"], "port", 9000),
+            (["--no-reload"], "reload", False),
+        ],
+        ids=["defaults", "custom_port", "no_reload"],
+    )
+    def test_dev_options(
+        self,
+        mockLaunch: MagicMock,
+        mockProjectDir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        args: list[str],
+        key: str,
+        expected: object,
+    ) -> None:
+        """Test dev command options reach launch's cliArgs."""
+        monkeypatch.chdir(mockProjectDir)
         
-        result = runner.invoke(app, ["dev", "--no-reload"])
+        result = runner.invoke(cli, ["dev", *args], catch_exceptions=False)
         
+        assert result.exit_code == 0
         mockLaunch.assert_called_once()
-        callArgs = mockLaunch.call_args
-        assert callArgs.kwargs["cliArgs"]["reload"] is False
+        assert mockLaunch.call_args.kwargs["cliArgs"][key] == expected
 
 
 class TestStartCommand:
     """Tests for start command."""
 
-    @patch("fastapi_launcher.cli.launch")
+    @pytest.mark.parametrize(
+        ("args", "expectedWorkers"),
+        [([], 4), (["--workers", "8"], 8)],
+        ids=["defaults", "custom_workers"],
+    )
     @patch("fastapi_launcher.cli.loadConfig")
-    def test_start_default_options(
-        self, mockLoadConfig: MagicMock, mockLaunch: MagicMock
-    ) -> None:
-        """Test start command with defaults."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=Path("runtime"))
-        
-        result = runner.invoke(app, ["start"])
-        
-        mockLaunch.assert_called_once()
-        callArgs = mockLaunch.call_args
-        assert callArgs.kwargs["cliArgs"]["workers"] == 4
-
-    @patch("fastapi_launcher.cli.launch")
-    @patch("fastapi_launcher.cli.loadConfig")
-    def test_start_custom_workers(
-        self, mockLoadConfig: MagicMock, mockLaunch: MagicMock
+    def test_start_workers(
+        self,
+        mockLoadConfig: MagicMock,
+        mockLaunch: MagicMock,
+        tempDir: Path,
+        args: list[str],
+        expectedWorkers: int,
     ) -> None:
-        """Test start command with custom workers."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=Path("runtime"))
+        """Test start command passes the worker count to launch."""
+        mockLoadConfig.return_value = SimpleNamespace(runtimeDir=tempDir / "runtime")
         
-        result = runner.invoke(app, ["start", "--workers", "8"])
+        result = runner.invoke(cli, ["start", *args], catch_exceptions=False)
         
+        assert result.exit_code == 0
         mockLaunch.assert_called_once()
-        callArgs = mockLaunch.call_args
-        assert callArgs.kwargs["cliArgs"]["workers"] == 8
+        assert mockLaunch.call_args.kwargs["cliArgs"]["workers"] == expectedWorkers
 
-    @patch("fastapi_launcher.cli.daemonize")
-    @patch("fastapi_launcher.cli.setupDaemonLogging")
-    @patch("fastapi_launcher.cli.checkDaemonSupport")
-    @patch("fastapi_launcher.cli.launch")
-    @patch("fastapi_launcher.cli.loadConfig")
     def test_start_uses_config_daemon_when_no_flag(
         self,
-        mockLoadConfig: MagicMock,
         mockLaunch: MagicMock,
-        mockCheckDaemonSupport: MagicMock,
-        mockSetupDaemonLogging: MagicMock,
-        mockDaemonize: MagicMock,
         mockProjectDir: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """未指定 --daemon 时，应当尊重配置中的 daemon=true。"""
-        os.chdir(mockProjectDir)
-        mockCheckDaemonSupport.return_value = (True, "")
-        mockSetupDaemonLogging.return_value = mockProjectDir / "runtime" / "fa.log"
-
-        # 配置合并后的最终结果：daemon=true
-        mockLoadConfig.return_value = MagicMock(runtimeDir=Path("runtime"), daemon=True)
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            checkDaemonSupport=DEFAULT,
+            setupDaemonLogging=DEFAULT,
+            daemonize=DEFAULT,
+        ) as mocks:
+            monkeypatch.chdir(mockProjectDir)
+            mocks["checkDaemonSupport"].return_value = (True, "")
+            mocks["setupDaemonLogging"].return_value = mockProjectDir / "runtime" / "fa.log"
+
+            # 配置合并后的最终结果：daemon=true
+            mocks["loadConfig"].return_value = SimpleNamespace(
+                runtimeDir=Path("runtime"), daemon=True
+            )
 
-        result = runner.invoke(app, ["start"])
+            result = runner.invoke(cli, ["start"], catch_exceptions=False)
 
-        assert result.exit_code == 0
-        # loadConfig 可能被调用多次（_readPersistedEnvName 会调用一次）
-        assert mockLoadConfig.call_count >= 1
-        # 找到 start 命令实际调用的那次（带 cliArgs 参数）
-        startCalls = [c for c in mockLoadConfig.call_args_list if "cliArgs" in c.kwargs]
-        assert len(startCalls) == 1
-        # 关键：未显式指定时，CLI 不应写入 daemon=False 覆盖配置
-        passedCliArgs = startCalls[0].kwargs.get("cliArgs", {})
-        assert "daemon" not in passedCliArgs
-
-        mockDaemonize.assert_called_once()
-        mockLaunch.assert_called_once()
-        assert mockLaunch.call_args.kwargs["showBanner"] is False
+            assert result.exit_code == 0
+            # loadConfig 可能被调用多次（_readPersistedEnvName 会调用一次）
+            assert mocks["loadConfig"].call_count >= 1
+            # 找到 start 命令实际调用的那次（带 cliArgs 参数）
+            startCalls = [c for c in mocks["loadConfig"].call_args_list if "cliArgs" in c.kwargs]
+            assert len(startCalls) == 1
+            # 关键：未显式指定时，CLI 不应写入 daemon=False 覆盖配置
+            passedCliArgs = startCalls[0].kwargs.get("cliArgs", {})
+            assert "daemon" not in passedCliArgs
+
+            mocks["daemonize"].assert_called_once()
+            mockLaunch.assert_called_once()
+            assert mockLaunch.call_args.kwargs["showBanner"] is False
 
 
 class TestStopCommand:
     """Tests for stop command."""
 
-    def test_stop_no_pid_file(self, tempDir: Path) -> None:
+    def test_stop_no_pid_file(self, patchLoadConfig: MagicMock) -> None:
         """Test stop when no PID file exists."""
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig:
-            with patch("fastapi_launcher.cli.readPidFile") as mockReadPid:
-                mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime")
-                mockReadPid.return_value = None
-                
-                result = runner.invoke(app, ["stop"])
-                
-                assert result.exit_code == 1
-
-    def test_stop_running_process(self, tempDir: Path) -> None:
-        """Test stopping running process."""
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isProcessRunning") as mockIsRunning, \
-             patch("fastapi_launcher.cli.terminateProcess") as mockTerminate, \
-             patch("fastapi_launcher.cli.removePidFile") as mockRemovePid, \
-             patch("fastapi_launcher.cli.waitForPortFree") as mockWaitPort, \
-             patch("fastapi_launcher.cli.createSpinner") as mockSpinner:
-            
-            mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime", port=8000)
-            mockReadPid.return_value = 12345
-            mockIsRunning.return_value = True
-            mockTerminate.return_value = True
-            mockWaitPort.return_value = True
-            mockSpinner.return_value.__enter__ = MagicMock(return_value=MagicMock())
-            mockSpinner.return_value.__exit__ = MagicMock(return_value=False)
+        with patch("fastapi_launcher.cli.readPidFile") as mockReadPid:
+            mockReadPid.return_value = None
             
-            result = runner.invoke(app, ["stop"])
+            result = runner.invoke(cli, ["stop"], catch_exceptions=False)
             
-            mockTerminate.assert_called_once()
+            assert result.exit_code == 1
+
+    def test_stop_running_process(self, serverProcessMocks: SimpleNamespace) -> None:
+        """Test stopping running process."""
+        result = runner.invoke(cli, ["stop"], catch_exceptions=False)
+        
+        assert result.exit_code == 0
+        assert "Server stopped successfully" in result.output
+        serverProcessMocks.terminateProcess.assert_called_once()
+        assert serverProcessMocks.terminateProcess.call_args.args[0] == 12345
+        serverProcessMocks.removePidFile.assert_called_once()
 
 
 class TestStatusCommand:
     """Tests for status command."""
 
-    def test_status_not_running(self, tempDir: Path) -> None:
+    def test_status_not_running(self, patchLoadConfig: MagicMock) -> None:
         """Test status when not running."""
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isPortInUse") as mockPortInUse, \
-             patch("fastapi_launcher.cli.printStatusTable") as mockPrintStatus:
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            readPidFile=DEFAULT,
+            probePort=DEFAULT,
+            printStatusTable=DEFAULT,
+        ) as mocks:
+            mocks["readPidFile"].return_value = None
+            mocks["probePort"].return_value = PortInfo(port=8000, status="free")
             
-            mockLoadConfig.return_value = MagicMock(
-                runtimeDir=tempDir / "runtime",
-                host="127.0.0.1",
-                port=8000,
-            )
-            mockReadPid.return_value = None
-            mockPortInUse.return_value = False
-            
-            result = runner.invoke(app, ["status"])
+            result = runner.invoke(cli, ["status"], catch_exceptions=False)
             
             assert result.exit_code == 0
-            mockPrintStatus.assert_called_once()
+            mocks["printStatusTable"].assert_called_once()
 
 
 class TestLogsCommand:
     """Tests for logs command."""
 
-    @patch("fastapi_launcher.cli.printLogEntry")
-    @patch("fastapi_launcher.cli.readLogFile")
-    @patch("fastapi_launcher.cli.getLogFiles")
-    @patch("fastapi_launcher.cli.loadConfig")
-    def test_logs_default(
-        self,
-        mockLoadConfig: MagicMock,
-        mockGetLogFiles: MagicMock,
-        mockReadLog: MagicMock,
-        mockPrintLog: MagicMock,
-        tempDir: Path,
-    ) -> None:
+    def test_logs_default(self, tempDir: Path) -> None:
         """Test logs command."""
-        logFile = tempDir / "logs" / "fa.log"
-        logFile.parent.mkdir(parents=True, exist_ok=True)
-        logFile.write_text("Test log line\n")
-        
-        mockLoadConfig.return_value = MagicMock(
-            runtimeDir=tempDir,
-            logFormat="pretty",
-        )
-        mockGetLogFiles.return_value = {"main": logFile, "access": logFile, "error": logFile}
-        mockReadLog.return_value = iter(["Test log line"])
-        
-        result = runner.invoke(app, ["logs"])
-        
-        assert result.exit_code == 0
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            getLogFiles=DEFAULT,
+            readLogFile=DEFAULT,
+            printLogEntry=DEFAULT,
+        ) as mocks:
+            logFile = tempDir / "logs" / "fa.log"
+            logFile.parent.mkdir(parents=True, exist_ok=True)
+            logFile.write_text("Test log line\n")
+            
+            mocks["loadConfig"].return_value = SimpleNamespace(
+                runtimeDir=tempDir,
+                logFormat="pretty",
+            )
+            mocks["getLogFiles"].return_value = {
+                "main": logFile,
+                "access": logFile,
+                "error": logFile,
+            }
+            mocks["readLogFile"].return_value = ["Test log line"]
+            
+            result = runner.invoke(cli, ["logs"], catch_exceptions=False)
+            
+            assert result.exit_code == 0
 
     @patch("fastapi_launcher.cli.getLogFiles")
     @patch("fastapi_launcher.cli.loadConfig")
@@ -239,128 +246,122 @@ class TestLogsCommand:
         mockGetLogFiles: MagicMock,
     ) -> None:
         """Test logs with invalid type."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=Path("runtime"))
+        mockLoadConfig.return_value = SimpleNamespace(runtimeDir=Path("runtime"))
         mockGetLogFiles.return_value = {"main": Path("fa.log")}
         
-        result = runner.invoke(app, ["logs", "--type", "invalid"])
+        result = runner.invoke(cli, ["logs", "--type", "invalid"], catch_exceptions=False)
         
         assert result.exit_code == 1
 
-
-class TestHealthCommand:
-    """Tests for health command."""
-
-    @patch("fastapi_launcher.cli.printHealthResult")
-    @patch("fastapi_launcher.cli.checkHealth")
-    @patch("fastapi_launcher.cli.loadConfig")
-    def test_health_success(
+    def test_logs_with_lines(
         self,
-        mockLoadConfig: MagicMock,
-        mockCheckHealth: MagicMock,
-        mockPrintResult: MagicMock,
+        mockConfig: MagicMock,
+        patchLoadConfig: MagicMock,
+        sampleLogFile: Path,
+        mocker,
     ) -> None:
-        """Test health check success."""
-        from fastapi_launcher.health import HealthCheckResult
-        
-        mockLoadConfig.return_value = MagicMock(
-            host="127.0.0.1",
-            port=8000,
-            healthPath="/health",
+        """Test logs command with line count."""
+        logsDir = mockConfig.runtimeDir / "logs"
+        logsDir.mkdir(parents=True)
+        shutil.copyfile(sampleLogFile, logsDir / "fa.log")
+        mockReadLogFile = mocker.patch(
+            "fastapi_launcher.cli.readLogFile", return_value=["Line 99"]
         )
-        mockCheckHealth.return_value = HealthCheckResult(healthy=True, statusCode=200)
+        mockPrintLogEntry = mocker.patch("fastapi_launcher.cli.printLogEntry")
         
-        result = runner.invoke(app, ["health"])
+        result = runner.invoke(cli, ["logs", "--lines", "10"], catch_exceptions=False)
         
         assert result.exit_code == 0
+        mockReadLogFile.assert_called_once_with(logsDir / "fa.log", lines=10, follow=False)
+        mockPrintLogEntry.assert_called_once_with("Line 99", "pretty")
+
+
+class TestHealthCommand:
+    """Tests for health command."""
 
+    @pytest.mark.parametrize(
+        ("healthResult", "exitCode"),
+        [
+            (HealthCheckResult(healthy=True, statusCode=200), 0),
+            (HealthCheckResult(healthy=False, error="Connection refused"), 1),
+        ],
+        ids=["success", "failure"],
+    )
     @patch("fastapi_launcher.cli.printHealthResult")
     @patch("fastapi_launcher.cli.checkHealth")
-    @patch("fastapi_launcher.cli.loadConfig")
-    def test_health_failure(
+    def test_health_exit_code(
         self,
-        mockLoadConfig: MagicMock,
         mockCheckHealth: MagicMock,
         mockPrintResult: MagicMock,
+        patchLoadConfig: MagicMock,
+        healthResult: HealthCheckResult,
+        exitCode: int,
     ) -> None:
-        """Test health check failure."""
-        from fastapi_launcher.health import HealthCheckResult
-        
-        mockLoadConfig.return_value = MagicMock(
-            host="127.0.0.1",
-            port=8000,
-            healthPath="/health",
-        )
-        mockCheckHealth.return_value = HealthCheckResult(
-            healthy=False, error="Connection refused"
-        )
+        """Test health exits non-zero only when the server is unhealthy."""
+        mockCheckHealth.return_value = healthResult
         
-        result = runner.invoke(app, ["health"])
+        result = runner.invoke(cli, ["health"], catch_exceptions=False)
         
-        assert result.exit_code == 1
+        assert result.exit_code == exitCode
 
-    @patch("fastapi_launcher.cli.printHealthResult")
-    @patch("fastapi_launcher.cli.checkHealth")
-    @patch("fastapi_launcher.cli.loadConfig")
-    def test_health_supports_env_option(
-        self,
-        mockLoadConfig: MagicMock,
-        mockCheckHealth: MagicMock,
-        mockPrintResult: MagicMock,
-    ) -> None:
+    def test_health_supports_env_option(self) -> None:
         """health 命令应支持 --env 参数并传入 loadConfig。"""
-        from fastapi_launcher.health import HealthCheckResult
-
-        mockLoadConfig.return_value = MagicMock(
-            host="127.0.0.1",
-            port=8020,
-            healthPath="/health",
-        )
-        mockCheckHealth.return_value = HealthCheckResult(healthy=True, statusCode=200)
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            checkHealth=DEFAULT,
+            printHealthResult=DEFAULT,
+        ) as mocks:
+            mocks["loadConfig"].return_value = SimpleNamespace(
+                host="127.0.0.1",
+                port=8020,
+                healthPath="/health",
+            )
+            mocks["checkHealth"].return_value = HealthCheckResult(healthy=True, statusCode=200)
 
-        result = runner.invoke(app, ["health", "--env", "prod"])
+            result = runner.invoke(cli, ["health", "--env", "prod"], catch_exceptions=False)
 
-        assert result.exit_code == 0
-        assert mockLoadConfig.call_args.kwargs.get("envName") == "prod"
+            assert result.exit_code == 0
+            assert mocks["loadConfig"].call_args.kwargs.get("envName") == "prod"
 
-    @patch("fastapi_launcher.cli.printHealthResult")
-    @patch("fastapi_launcher.cli.checkHealth")
-    @patch("fastapi_launcher.cli.loadConfig")
     def test_health_uses_persisted_env_by_default(
         self,
-        mockLoadConfig: MagicMock,
-        mockCheckHealth: MagicMock,
-        mockPrintResult: MagicMock,
         mockProjectDir: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """未传 --env 时，应优先读取 runtime/fa.env 的环境名。"""
-        from fastapi_launcher.health import HealthCheckResult
-
-        os.chdir(mockProjectDir)
-        runtimeDir = mockProjectDir / "runtime"
-        runtimeDir.mkdir(parents=True, exist_ok=True)
-        (runtimeDir / "fa.env").write_text("prod\n")
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            checkHealth=DEFAULT,
+            printHealthResult=DEFAULT,
+        ) as mocks:
+            monkeypatch.chdir(mockProjectDir)
+            runtimeDir = mockProjectDir / "runtime"
+            runtimeDir.mkdir(parents=True, exist_ok=True)
+            (runtimeDir / "fa.env").write_text("prod\n")
 
-        def _loadConfigSideEffect(*args, **kwargs):
-            assert kwargs.get("envName") == "prod"
-            return MagicMock(host="127.0.0.1", port=8020, healthPath="/health")
+            def _loadConfigSideEffect(*args, **kwargs):
+                assert kwargs.get("envName") == "prod"
+                return MagicMock(host="127.0.0.1", port=8020, healthPath="/health")
 
-        mockLoadConfig.side_effect = _loadConfigSideEffect
-        mockCheckHealth.return_value = HealthCheckResult(healthy=True, statusCode=200)
+            mocks["loadConfig"].side_effect = _loadConfigSideEffect
+            mocks["checkHealth"].return_value = HealthCheckResult(healthy=True, statusCode=200)
 
-        result = runner.invoke(app, ["health"])
+            result = runner.invoke(cli, ["health"], catch_exceptions=False)
 
-        assert result.exit_code == 0
+            assert result.exit_code == 0
 
 
 class TestConfigCommandWithEnv:
     """Tests for config command with --env option."""
 
     @patch("fastapi_launcher.cli.showConfig")
-    def test_config_supports_env_option(self, mockShowConfig: MagicMock) -> None:
+    def test_config_supports_env_option(
+        self, mockShowConfig: MagicMock, invokeCommand: Callable[..., int]
+    ) -> None:
         """config 命令应支持 --env 参数并透传给 showConfig。"""
-        result = runner.invoke(app, ["config", "--env", "prod"])
-
-        assert result.exit_code == 0
+        assert invokeCommand(configCommand, env="prod") == 0
         assert mockShowConfig.call_args.kwargs.get("envName") == "prod"
 
 
@@ -368,48 +369,38 @@ class TestConfigCommand:
     """Tests for config command."""
 
     @patch("fastapi_launcher.cli.showConfig")
-    def test_config_display(self, mockShowConfig: MagicMock) -> None:
+    def test_config_display(
+        self, mockShowConfig: MagicMock, invokeCommand: Callable[..., int]
+    ) -> None:
         """Test config command."""
-        result = runner.invoke(app, ["config"])
-        
-        assert result.exit_code == 0
+        assert invokeCommand(configCommand, env=None) == 0
         mockShowConfig.assert_called_once()
 
 
 class TestCheckCommand:
     """Tests for check command."""
 
+    @pytest.mark.parametrize(
+        ("passed", "exitCode"),
+        [(True, 0), (False, 1)],
+        ids=["all_pass", "some_fail"],
+    )
     @patch("fastapi_launcher.cli.printCheckReport")
     @patch("fastapi_launcher.cli.runAllChecks")
-    def test_check_all_pass(
-        self, mockRunChecks: MagicMock, mockPrintReport: MagicMock
-    ) -> None:
-        """Test check when all pass."""
-        from fastapi_launcher.checker import CheckReport, CheckResult
-        
-        mockRunChecks.return_value = CheckReport(results=[
-            CheckResult("Test", True, "OK"),
-        ])
-        
-        result = runner.invoke(app, ["check"])
-        
-        assert result.exit_code == 0
-
-    @patch("fastapi_launcher.cli.printCheckReport")
-    @patch("fastapi_launcher.cli.runAllChecks")
-    def test_check_some_fail(
-        self, mockRunChecks: MagicMock, mockPrintReport: MagicMock
+    def test_check_exit_code(
+        self,
+        mockRunChecks: MagicMock,
+        mockPrintReport: MagicMock,
+        invokeCommand: Callable[..., int],
+        passed: bool,
+        exitCode: int,
     ) -> None:
-        """Test check when some fail."""
-        from fastapi_launcher.checker import CheckReport, CheckResult
-        
+        """Test check exits non-zero only when a check fails."""
         mockRunChecks.return_value = CheckReport(results=[
-            CheckResult("Test", False, "Failed"),
+            CheckResult("Test", passed, "msg"),
         ])
         
-        result = runner.invoke(app, ["check"])
-        
-        assert result.exit_code == 1
+        assert invokeCommand(checkCommand) == exitCode
 
 
 class TestCleanCommand:
@@ -418,121 +409,110 @@ class TestCleanCommand:
     @patch("fastapi_launcher.cli.loadConfig")
     def test_clean_no_runtime(self, mockLoadConfig: MagicMock, tempDir: Path) -> None:
         """Test clean when runtime dir doesn't exist."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "nonexistent")
+        mockLoadConfig.return_value = SimpleNamespace(runtimeDir=tempDir / "nonexistent")
         
-        result = runner.invoke(app, ["clean", "--yes"])
+        result = runner.invoke(cli, ["clean", "--yes"], catch_exceptions=False)
         
         assert result.exit_code == 0
 
     @patch("fastapi_launcher.cli.cleanLogs")
-    @patch("fastapi_launcher.cli.loadConfig")
     def test_clean_logs_only(
-        self, mockLoadConfig: MagicMock, mockCleanLogs: MagicMock, tempDir: Path
+        self,
+        mockCleanLogs: MagicMock,
+        mockConfig: MagicMock,
+        patchLoadConfig: MagicMock,
     ) -> None:
         """Test clean logs only."""
-        runtimeDir = tempDir / "runtime"
-        runtimeDir.mkdir()
+        mockConfig.runtimeDir.mkdir()
         
-        mockLoadConfig.return_value = MagicMock(runtimeDir=runtimeDir)
         mockCleanLogs.return_value = 3
         
-        result = runner.invoke(app, ["clean", "--logs", "--yes"])
+        result = runner.invoke(cli, ["clean", "--logs", "--yes"], catch_exceptions=False)
         
         assert result.exit_code == 0
         mockCleanLogs.assert_called_once()
 
-    def test_clean_requires_confirmation(self, tempDir: Path) -> None:
+    def test_clean_requires_confirmation(
+        self, mockConfig: MagicMock, patchLoadConfig: MagicMock
+    ) -> None:
         """Test clean requires confirmation."""
-        runtimeDir = tempDir / "runtime"
-        runtimeDir.mkdir()
+        mockConfig.runtimeDir.mkdir()
         
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig:
-            mockLoadConfig.return_value = MagicMock(runtimeDir=runtimeDir)
-            
-            # Without --yes, should prompt and exit on "n"
-            result = runner.invoke(app, ["clean"], input="n\n")
-            
-            # Should exit without error when user declines
-            assert result.exit_code == 0
+        # Without --yes, should prompt and exit on "n"
+        result = runner.invoke(cli, ["clean"], input="n\n", catch_exceptions=False)
+        
+        # Should exit without error when user declines
+        assert result.exit_code == 0
 
 
 class TestRestartCommand:
     """Tests for restart command."""
 
-    def test_restart_not_running(self, tempDir: Path) -> None:
+    def test_restart_not_running(self, patchLoadConfig: MagicMock) -> None:
         """Test restart when server not running."""
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isProcessRunning") as mockIsRunning, \
-             patch("fastapi_launcher.cli.launch") as mockLaunch:
-            
-            mockLoadConfig.return_value = MagicMock(
-                runtimeDir=tempDir / "runtime",
-                port=8000,
-                mode=MagicMock(),
-            )
-            mockReadPid.return_value = None
-            mockIsRunning.return_value = False
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            readPidFile=DEFAULT,
+            isProcessRunning=DEFAULT,
+            launch=DEFAULT,
+        ) as mocks:
+            mocks["readPidFile"].return_value = None
+            mocks["isProcessRunning"].return_value = False
             
-            result = runner.invoke(app, ["restart"])
+            result = runner.invoke(cli, ["restart"], catch_exceptions=False)
             
             # Should still try to start
-            mockLaunch.assert_called_once()
+            assert result.exit_code == 0
+            assert "Starting server" in result.output
+            assert "Stopping" not in result.output
+            mocks["launch"].assert_called_once()
 
-    def test_restart_running_server(self, tempDir: Path) -> None:
+    def test_restart_running_server(
+        self, serverProcessMocks: SimpleNamespace, mocker
+    ) -> None:
         """Test restart when server is running."""
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isProcessRunning") as mockIsRunning, \
-             patch("fastapi_launcher.cli.terminateProcess") as mockTerminate, \
-             patch("fastapi_launcher.cli.removePidFile"), \
-             patch("fastapi_launcher.cli.waitForPortFree") as mockWaitPort, \
-             patch("fastapi_launcher.cli.setupDaemonLogging"), \
-             patch("fastapi_launcher.cli.daemonize"), \
-             patch("fastapi_launcher.cli.launch") as mockLaunch:
-            
-            mockLoadConfig.return_value = MagicMock(
-                runtimeDir=tempDir / "runtime",
-                port=8000,
-                mode=MagicMock(),
-            )
-            mockReadPid.return_value = 12345
-            mockIsRunning.return_value = True
-            mockTerminate.return_value = True
-            mockWaitPort.return_value = True
-            
-            result = runner.invoke(app, ["restart"])
-            
-            mockTerminate.assert_called_once()
+        mocks = mocker.patch.multiple(
+            "fastapi_launcher.cli",
+            setupDaemonLogging=DEFAULT,
+            daemonize=DEFAULT,
+            launch=DEFAULT,
+        )
+        
+        result = runner.invoke(cli, ["restart"], catch_exceptions=False)
+        
+        assert result.exit_code == 0
+        assert "Server stopped" in result.output
+        assert "Starting server" in result.output
+        serverProcessMocks.terminateProcess.assert_called_once()
+        mocks["launch"].assert_called_once()
 
 
 class TestDevCommandExtended:
     """Extended tests for dev command."""
 
-    @patch("fastapi_launcher.cli.launch")
     def test_dev_with_reload_dirs(self, mockLaunch: MagicMock) -> None:
         """Test dev command with reload dirs."""
-        result = runner.invoke(app, ["dev", "--reload-dirs", "src,lib"])
+        result = runner.invoke(cli, ["dev", "--reload-dirs", "src,lib"], catch_exceptions=False)
         
+        assert result.exit_code == 0
         mockLaunch.assert_called_once()
         callKwargs = mockLaunch.call_args.kwargs
         assert callKwargs["cliArgs"]["reload_dirs"] == ["src", "lib"]
 
-    @patch("fastapi_launcher.cli.launch")
     def test_dev_with_app_path(self, mockLaunch: MagicMock) -> None:
         """Test dev command with app path."""
-        result = runner.invoke(app, ["dev", "--app", "mymodule:api"])
+        result = runner.invoke(cli, ["dev", "--app", "mymodule:api"], catch_exceptions=False)
         
+        assert result.exit_code == 0
         mockLaunch.assert_called_once()
         callKwargs = mockLaunch.call_args.kwargs
         assert callKwargs["cliArgs"]["app"] == "mymodule:api"
 
-    @patch("fastapi_launcher.cli.launch")
     def test_dev_keyboard_interrupt(self, mockLaunch: MagicMock) -> None:
         """Test dev command handles keyboard interrupt."""
         mockLaunch.side_effect = KeyboardInterrupt()
         
-        result = runner.invoke(app, ["dev"])
+        result = runner.invoke(cli, ["dev"], catch_exceptions=False)
         
         # Should exit gracefully
         assert result.exit_code == 0
@@ -543,195 +523,98 @@ class TestStartCommandExtended:
 
     def test_start_with_daemon(self, tempDir: Path) -> None:
         """Test start command with daemon mode."""
-        with patch("fastapi_launcher.cli.launch") as mockLaunch, \
-             patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.checkDaemonSupport") as mockCheck, \
-             patch("fastapi_launcher.cli.setupDaemonLogging") as mockSetupLog, \
-             patch("fastapi_launcher.cli.daemonize") as mockDaemonize, \
-             patch("fastapi_launcher.cli.Path") as mockPath:
-            
-            runtimeDir = MagicMock()
-            runtimeDir.is_absolute.return_value = True
-            runtimeDir.__truediv__ = MagicMock(return_value=tempDir / "fa.pid")
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            launch=DEFAULT,
+            loadConfig=DEFAULT,
+            checkDaemonSupport=DEFAULT,
+            setupDaemonLogging=DEFAULT,
+            daemonize=DEFAULT,
+        ) as mocks, patch("fastapi_launcher.cli.Path.cwd", return_value=tempDir):
             
-            mockLoadConfig.return_value = MagicMock(runtimeDir=runtimeDir)
-            mockCheck.return_value = (True, "Supported")
-            mockSetupLog.return_value = tempDir / "runtime/logs/fa.log"
-            mockPath.cwd.return_value = tempDir
+            mocks["loadConfig"].return_value = SimpleNamespace(runtimeDir=tempDir / "runtime")
+            mocks["checkDaemonSupport"].return_value = (True, "Supported")
+            mocks["setupDaemonLogging"].return_value = tempDir / "runtime/logs/fa.log"
             
-            result = runner.invoke(app, ["start", "--daemon"])
+            result = runner.invoke(cli, ["start", "--daemon"], catch_exceptions=False)
             
             # Daemon mode should be triggered
-            mockCheck.assert_called_once()
+            mocks["checkDaemonSupport"].assert_called_once()
 
-    @patch("fastapi_launcher.cli.launch")
     @patch("fastapi_launcher.cli.loadConfig")
     def test_start_daemon_not_supported(self, mockLoadConfig: MagicMock, mockLaunch: MagicMock) -> None:
         """Test start command when daemon not supported."""
-        from pathlib import Path
-        
         with patch("fastapi_launcher.cli.checkDaemonSupport") as mockCheck:
-            mockLoadConfig.return_value = MagicMock(runtimeDir=Path("runtime"))
+            mockLoadConfig.return_value = SimpleNamespace(runtimeDir=Path("runtime"))
             mockCheck.return_value = (False, "Not supported on Windows")
             
-            result = runner.invoke(app, ["start", "--daemon"])
+            result = runner.invoke(cli, ["start", "--daemon"], catch_exceptions=False)
             
             # Should still try to run
 
-    @patch("fastapi_launcher.cli.launch")
     @patch("fastapi_launcher.cli.loadConfig")
     def test_start_launch_error(self, mockLoadConfig: MagicMock, mockLaunch: MagicMock) -> None:
         """Test start command with launch error."""
-        from fastapi_launcher.launcher import LaunchError
-        from pathlib import Path
-        
-        mockLoadConfig.return_value = MagicMock(runtimeDir=Path("runtime"))
+        mockLoadConfig.return_value = SimpleNamespace(runtimeDir=Path("runtime"))
         mockLaunch.side_effect = LaunchError("Failed to start")
         
-        result = runner.invoke(app, ["start"])
-        
-        assert result.exit_code == 1
-
-
-class TestLogsCommand:
-    """Tests for logs command."""
-
-    def test_logs_with_lines(self, tempDir: Path) -> None:
-        """Test logs command with line count."""
-        logsDir = tempDir / "runtime" / "logs"
-        logsDir.mkdir(parents=True)
-        logFile = logsDir / "fa.log"
-        logFile.write_text("\n".join(f"Line {i}" for i in range(100)))
-        
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig:
-            mockConfig = MagicMock()
-            mockConfig.runtimeDir = tempDir / "runtime"
-            mockConfig.logFormat = MagicMock()
-            mockLoadConfig.return_value = mockConfig
-            
-            result = runner.invoke(app, ["logs", "--lines", "10"])
-            
-            # Should succeed and show last 10 lines
-
-
-class TestCheckCommand:
-    """Tests for check command."""
-
-    @patch("fastapi_launcher.cli.runAllChecks")
-    @patch("fastapi_launcher.cli.printCheckReport")
-    def test_check_all_pass(self, mockPrint: MagicMock, mockRun: MagicMock) -> None:
-        """Test check command when all pass."""
-        from fastapi_launcher.checker import CheckReport, CheckResult
-        
-        mockRun.return_value = CheckReport(results=[
-            CheckResult("Test", True, "OK")
-        ])
-        
-        result = runner.invoke(app, ["check"])
-        
-        assert result.exit_code == 0
-
-    @patch("fastapi_launcher.cli.runAllChecks")
-    @patch("fastapi_launcher.cli.printCheckReport")
-    def test_check_with_failures(self, mockPrint: MagicMock, mockRun: MagicMock) -> None:
-        """Test check command with failures."""
-        from fastapi_launcher.checker import CheckReport, CheckResult
-        
-        mockRun.return_value = CheckReport(results=[
-            CheckResult("Test", False, "Failed")
-        ])
-        
-        result = runner.invoke(app, ["check"])
+        result = runner.invoke(cli, ["start"], catch_exceptions=False)
         
         assert result.exit_code == 1
 
 
-class TestConfigCommand:
-    """Tests for config command."""
-
-    @patch("fastapi_launcher.cli.showConfig")
-    def test_config_show(self, mockShow: MagicMock) -> None:
-        """Test config show command."""
-        result = runner.invoke(app, ["config"])
-        
-        mockShow.assert_called_once()
-
-
 class TestInitCommand:
     """Tests for init command."""
 
-    def test_init_success(self, tempDir: Path) -> None:
-        """Test init command success."""
-        # Create a pyproject.toml without launcher config
-        pyprojectPath = tempDir / "pyproject.toml"
-        pyprojectPath.write_text("""[project]
-name = "test-project"
-version = "0.1.0"
-""")
-        
-        os.chdir(tempDir)
-        
-        result = runner.invoke(app, ["init"])
-        
-        assert result.exit_code == 0
-
-    def test_init_already_exists(self, tempDir: Path) -> None:
-        """Test init command when config already exists."""
-        # Create a pyproject.toml with launcher config
-        pyprojectPath = tempDir / "pyproject.toml"
-        pyprojectPath.write_text("""[project]
-name = "test-project"
-version = "0.1.0"
-
-[tool.fastapi-launcher]
-app = "main:app"
-""")
-        
-        os.chdir(tempDir)
+    @pytest.mark.parametrize(
+        ("pyproject", "args"),
+        [
+            (_PYPROJECT_BASIC, []),
+            (_PYPROJECT_BASIC + b'\n[tool.fastapi-launcher]\napp = "main:app"\n', []),
+            (
+                _PYPROJECT_BASIC + b'\n[tool.fastapi-launcher]\napp = "old:app"\n',
+                ["--force"],
+            ),
+        ],
+        ids=["success", "already_exists", "force"],
+    )
+    def test_init(
+        self,
+        tempDir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        pyproject: bytes,
+        args: list[str],
+    ) -> None:
+        """Test init succeeds with or without an existing launcher section."""
+        (tempDir / "pyproject.toml").write_bytes(pyproject)
+        monkeypatch.chdir(tempDir)
         
-        result = runner.invoke(app, ["init"])
+        result = runner.invoke(cli, ["init", *args], catch_exceptions=False)
         
-        # Should exit with 0 since it's not an error
+        # An existing section is not an error
         assert result.exit_code == 0
 
-    def test_init_with_env(self, tempDir: Path) -> None:
+    def test_init_with_env(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test init command with --env flag."""
-        pyprojectPath = tempDir / "pyproject.toml"
-        pyprojectPath.write_text("""[project]
-name = "test-project"
-version = "0.1.0"
-""")
+        (tempDir / "pyproject.toml").write_bytes(_PYPROJECT_BASIC)
         
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
-        result = runner.invoke(app, ["init", "--env"])
+        result = runner.invoke(cli, ["init", "--env"], catch_exceptions=False)
         
         assert result.exit_code == 0
         # Check .env.example was created
         assert (tempDir / ".env.example").exists()
 
-    def test_init_with_force(self, tempDir: Path) -> None:
-        """Test init command with --force flag."""
-        pyprojectPath = tempDir / "pyproject.toml"
-        pyprojectPath.write_text("""[project]
-name = "test-project"
-version = "0.1.0"
-
-[tool.fastapi-launcher]
-app = "old:app"
-""")
-        
-        os.chdir(tempDir)
-        
-        result = runner.invoke(app, ["init", "--force"])
-        
-        assert result.exit_code == 0
-
-    def test_init_no_pyproject(self, tempDir: Path) -> None:
+    def test_init_no_pyproject(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test init command failure when no pyproject.toml."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
-        result = runner.invoke(app, ["init"])
+        result = runner.invoke(cli, ["init"], catch_exceptions=False)
         
         assert result.exit_code == 1
 
@@ -739,73 +622,55 @@ app = "old:app"
 class TestRunCommand:
     """Tests for run (smart mode) command."""
 
-    @patch("fastapi_launcher.cli.launch")
-    @patch("fastapi_launcher.smartMode.detectEnvironment")
-    def test_run_detects_dev(self, mockDetect: MagicMock, mockLaunch: MagicMock) -> None:
-        """Test run command detects development."""
-        from fastapi_launcher.enums import RunMode
-        
-        mockDetect.return_value = ("dev", RunMode.DEV)
-        
-        result = runner.invoke(app, ["run"])
-        
-        mockLaunch.assert_called_once()
-        callKwargs = mockLaunch.call_args.kwargs
-        assert callKwargs["mode"] == RunMode.DEV
-
-    @patch("fastapi_launcher.cli.launch")
+    @pytest.mark.parametrize(
+        ("detected", "expectedMode", "expectedEnv"),
+        [
+            (("dev", RunMode.DEV), RunMode.DEV, None),
+            (("prod", RunMode.PROD), RunMode.PROD, None),
+            (("staging", RunMode.PROD), RunMode.PROD, "staging"),
+        ],
+        ids=["dev", "prod", "staging"],
+    )
     @patch("fastapi_launcher.smartMode.detectEnvironment")
-    def test_run_detects_prod(self, mockDetect: MagicMock, mockLaunch: MagicMock) -> None:
-        """Test run command detects production."""
-        from fastapi_launcher.enums import RunMode
-        
-        mockDetect.return_value = ("prod", RunMode.PROD)
+    def test_run_detects_environment(
+        self,
+        mockDetect: MagicMock,
+        mockLaunch: MagicMock,
+        detected: tuple[str, RunMode],
+        expectedMode: RunMode,
+        expectedEnv: Optional[str],
+    ) -> None:
+        """Test run command launches with the detected environment."""
+        mockDetect.return_value = detected
         
-        result = runner.invoke(app, ["run"])
+        result = runner.invoke(cli, ["run"], catch_exceptions=False)
         
         mockLaunch.assert_called_once()
         callKwargs = mockLaunch.call_args.kwargs
-        assert callKwargs["mode"] == RunMode.PROD
+        assert callKwargs["mode"] == expectedMode
+        assert callKwargs["envName"] == expectedEnv
 
-    @patch("fastapi_launcher.cli.launch")
-    @patch("fastapi_launcher.smartMode.detectEnvironment")
-    def test_run_detects_staging(self, mockDetect: MagicMock, mockLaunch: MagicMock) -> None:
-        """Test run command detects staging environment."""
-        from fastapi_launcher.enums import RunMode
-        
-        mockDetect.return_value = ("staging", RunMode.PROD)
-        
-        result = runner.invoke(app, ["run"])
-        
-        mockLaunch.assert_called_once()
-        callKwargs = mockLaunch.call_args.kwargs
-        assert callKwargs["envName"] == "staging"
-
-    @patch("fastapi_launcher.cli.launch")
     @patch("fastapi_launcher.smartMode.detectEnvironment")
     def test_run_with_custom_options(self, mockDetect: MagicMock, mockLaunch: MagicMock) -> None:
         """Test run command with custom options."""
-        from fastapi_launcher.enums import RunMode
-        
         mockDetect.return_value = ("dev", RunMode.DEV)
         
-        result = runner.invoke(app, ["run", "--port", "9000", "--app", "myapp:app"])
+        result = runner.invoke(
+            cli, ["run", "--port", "9000", "--app", "myapp:app"], catch_exceptions=False
+        )
         
         mockLaunch.assert_called_once()
         callKwargs = mockLaunch.call_args.kwargs
         assert callKwargs["cliArgs"]["port"] == 9000
         assert callKwargs["cliArgs"]["app"] == "myapp:app"
 
-    @patch("fastapi_launcher.cli.launch")
     @patch("fastapi_launcher.smartMode.detectEnvironment")
     def test_run_keyboard_interrupt(self, mockDetect: MagicMock, mockLaunch: MagicMock) -> None:
         """Test run command handles keyboard interrupt."""
-        from fastapi_launcher.enums import RunMode
-        
         mockDetect.return_value = ("dev", RunMode.DEV)
         mockLaunch.side_effect = KeyboardInterrupt()
         
-        result = runner.invoke(app, ["run"])
+        result = runner.invoke(cli, ["run"], catch_exceptions=False)
         
         assert result.exit_code == 0
 
@@ -817,43 +682,29 @@ class TestReloadCommand:
         """Test reload when no server running."""
         with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
              patch("fastapi_launcher.cli.readPidFile") as mockReadPid:
-            mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime")
+            mockLoadConfig.return_value = SimpleNamespace(runtimeDir=tempDir / "runtime")
             mockReadPid.return_value = None
             
-            result = runner.invoke(app, ["reload"])
+            result = runner.invoke(cli, ["reload"], catch_exceptions=False)
             
             assert result.exit_code == 1
 
-    def test_reload_process_not_running(self, tempDir: Path) -> None:
+    def test_reload_process_not_running(self, serverProcessMocks: SimpleNamespace) -> None:
         """Test reload when process not running."""
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isProcessRunning") as mockIsRunning, \
-             patch("fastapi_launcher.cli.removePidFile"):
-            mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime")
-            mockReadPid.return_value = 12345
-            mockIsRunning.return_value = False
-            
-            result = runner.invoke(app, ["reload"])
-            
-            assert result.exit_code == 1
+        serverProcessMocks.isProcessRunning.return_value = False
+        
+        result = runner.invoke(cli, ["reload"], catch_exceptions=False)
+        
+        assert result.exit_code == 1
+        serverProcessMocks.removePidFile.assert_called_once()
 
     @pytest.mark.skipif(sys.platform == "win32", reason="Reload uses SIGHUP not available on Windows")
-    def test_reload_success_unix(self, tempDir: Path) -> None:
+    def test_reload_success_unix(self, serverProcessMocks: SimpleNamespace) -> None:
         """Test reload command success on Unix."""
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isProcessRunning") as mockIsRunning, \
-             patch("fastapi_launcher.process.sendSignal") as mockSendSignal:
-            mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime")
-            mockReadPid.return_value = 12345
-            mockIsRunning.return_value = True
-            mockSendSignal.return_value = True
-            
-            result = runner.invoke(app, ["reload"])
-            
-            # Should succeed or at least not fail with exit 1 due to missing pid
-            mockSendSignal.assert_called_once()
+        result = runner.invoke(cli, ["reload"], catch_exceptions=False)
+        
+        assert result.exit_code == 0
+        serverProcessMocks.sendSignal.assert_called_once()
 
 
 class TestMonitorCommand:
@@ -861,135 +712,139 @@ class TestMonitorCommand:
 
     @patch("fastapi_launcher.monitor.checkTextualInstalled")
     @patch("fastapi_launcher.monitor.runMonitorSimple")
-    @patch("fastapi_launcher.cli.isProcessRunning")
-    @patch("fastapi_launcher.cli.readPidFile")
-    @patch("fastapi_launcher.cli.loadConfig")
     def test_monitor_no_tui(
-        self, mockLoadConfig: MagicMock, mockReadPid: MagicMock,
-        mockIsRunning: MagicMock, mockRunSimple: MagicMock,
-        mockCheckTextual: MagicMock, tempDir: Path
+        self,
+        mockRunSimple: MagicMock,
+        mockCheckTextual: MagicMock,
+        tempDir: Path,
     ) -> None:
         """Test monitor command with --no-tui."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime")
-        mockReadPid.return_value = 12345
-        mockIsRunning.return_value = True
-        mockRunSimple.side_effect = KeyboardInterrupt()
-        
-        result = runner.invoke(app, ["monitor", "--no-tui"])
-        
-        mockRunSimple.assert_called_once()
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            readPidFile=DEFAULT,
+            isProcessRunning=DEFAULT,
+        ) as mocks:
+            mocks["loadConfig"].return_value = SimpleNamespace(runtimeDir=tempDir / "runtime")
+            mocks["readPidFile"].return_value = 12345
+            mocks["isProcessRunning"].return_value = True
+            mockRunSimple.side_effect = KeyboardInterrupt()
+            
+            result = runner.invoke(cli, ["monitor", "--no-tui"], catch_exceptions=False)
+            
+            mockRunSimple.assert_called_once()
 
     @patch("fastapi_launcher.monitor.checkTextualInstalled")
     @patch("fastapi_launcher.monitor.runMonitorSimple")
-    @patch("fastapi_launcher.cli.isProcessRunning")
-    @patch("fastapi_launcher.cli.readPidFile")
-    @patch("fastapi_launcher.cli.loadConfig")
     def test_monitor_textual_not_installed(
-        self, mockLoadConfig: MagicMock, mockReadPid: MagicMock,
-        mockIsRunning: MagicMock, mockRunSimple: MagicMock,
-        mockCheckTextual: MagicMock, tempDir: Path
+        self,
+        mockRunSimple: MagicMock,
+        mockCheckTextual: MagicMock,
+        tempDir: Path,
     ) -> None:
         """Test monitor command when textual not installed."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime")
-        mockReadPid.return_value = 12345
-        mockIsRunning.return_value = True
-        mockCheckTextual.return_value = False
-        mockRunSimple.side_effect = KeyboardInterrupt()
-        
-        result = runner.invoke(app, ["monitor"])
-        
-        # Should fall back to simple mode
-        mockRunSimple.assert_called_once()
-
-    @patch("fastapi_launcher.cli.isProcessRunning")
-    @patch("fastapi_launcher.cli.readPidFile")
-    @patch("fastapi_launcher.cli.loadConfig")
-    def test_monitor_server_not_running(
-        self, mockLoadConfig: MagicMock, mockReadPid: MagicMock,
-        mockIsRunning: MagicMock, tempDir: Path
-    ) -> None:
-        """Test monitor command when server not running."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime")
-        mockReadPid.return_value = None
-        mockIsRunning.return_value = False
-        
-        with patch("fastapi_launcher.monitor.runMonitorSimple") as mockRunSimple:
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            readPidFile=DEFAULT,
+            isProcessRunning=DEFAULT,
+        ) as mocks:
+            mocks["loadConfig"].return_value = SimpleNamespace(runtimeDir=tempDir / "runtime")
+            mocks["readPidFile"].return_value = 12345
+            mocks["isProcessRunning"].return_value = True
+            mockCheckTextual.return_value = False
             mockRunSimple.side_effect = KeyboardInterrupt()
             
-            result = runner.invoke(app, ["monitor", "--no-tui"])
+            result = runner.invoke(cli, ["monitor"], catch_exceptions=False)
             
-            # Should still try to start monitor (it will show "not running")
+            # Should fall back to simple mode
+            mockRunSimple.assert_called_once()
+
+    def test_monitor_server_not_running(self, tempDir: Path) -> None:
+        """Test monitor command when server not running."""
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            readPidFile=DEFAULT,
+            isProcessRunning=DEFAULT,
+        ) as mocks:
+            mocks["loadConfig"].return_value = SimpleNamespace(runtimeDir=tempDir / "runtime")
+            mocks["readPidFile"].return_value = None
+            mocks["isProcessRunning"].return_value = False
+            
+            with patch("fastapi_launcher.monitor.runMonitorSimple") as mockRunSimple:
+                mockRunSimple.side_effect = KeyboardInterrupt()
+                
+                result = runner.invoke(cli, ["monitor", "--no-tui"], catch_exceptions=False)
+                
+                # Should still try to start monitor (it will show "not running")
 
 
 class TestStartWithEnvAndServer:
     """Tests for start command with new options."""
 
-    @patch("fastapi_launcher.cli.launch")
     @patch("fastapi_launcher.cli.loadConfig")
     def test_start_with_env(
-        self, mockLoadConfig: MagicMock, mockLaunch: MagicMock
+        self, mockLoadConfig: MagicMock, mockLaunch: MagicMock, tempDir: Path
     ) -> None:
         """Test start command with --env option."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=Path("runtime"))
+        # The env name is persisted under runtimeDir, so keep it out of the cwd
+        mockLoadConfig.return_value = SimpleNamespace(runtimeDir=tempDir / "runtime")
         
-        result = runner.invoke(app, ["start", "--env", "staging"])
+        result = runner.invoke(cli, ["start", "--env", "staging"], catch_exceptions=False)
         
         mockLaunch.assert_called_once()
         callKwargs = mockLaunch.call_args.kwargs
         assert callKwargs["envName"] == "staging"
 
-    @patch("fastapi_launcher.cli.launch")
     @patch("fastapi_launcher.cli.loadConfig")
     def test_start_with_server_gunicorn(
         self, mockLoadConfig: MagicMock, mockLaunch: MagicMock
     ) -> None:
         """Test start command with --server gunicorn."""
-        from fastapi_launcher.enums import ServerBackend
-        
-        mockLoadConfig.return_value = MagicMock(runtimeDir=Path("runtime"))
+        mockLoadConfig.return_value = SimpleNamespace(runtimeDir=Path("runtime"))
         
-        result = runner.invoke(app, ["start", "--server", "gunicorn"])
+        result = runner.invoke(cli, ["start", "--server", "gunicorn"], catch_exceptions=False)
         
         mockLaunch.assert_called_once()
         callKwargs = mockLaunch.call_args.kwargs
         assert callKwargs["cliArgs"]["server"] == ServerBackend.GUNICORN
 
-    @patch("fastapi_launcher.cli.launch")
     @patch("fastapi_launcher.cli.loadConfig")
     def test_start_with_invalid_server(
         self, mockLoadConfig: MagicMock, mockLaunch: MagicMock
     ) -> None:
         """Test start command with invalid server backend."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=Path("runtime"))
+        mockLoadConfig.return_value = SimpleNamespace(runtimeDir=Path("runtime"))
         
-        result = runner.invoke(app, ["start", "--server", "invalid"])
+        result = runner.invoke(cli, ["start", "--server", "invalid"], catch_exceptions=False)
         
         assert result.exit_code == 1
         mockLaunch.assert_not_called()
 
-    @patch("fastapi_launcher.cli.launch")
     @patch("fastapi_launcher.cli.loadConfig")
     def test_start_with_timeout_graceful_shutdown(
         self, mockLoadConfig: MagicMock, mockLaunch: MagicMock
     ) -> None:
         """Test start command with --timeout-graceful-shutdown."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=Path("runtime"))
+        mockLoadConfig.return_value = SimpleNamespace(runtimeDir=Path("runtime"))
         
-        result = runner.invoke(app, ["start", "--timeout-graceful-shutdown", "30"])
+        result = runner.invoke(
+            cli, ["start", "--timeout-graceful-shutdown", "30"], catch_exceptions=False
+        )
         
         mockLaunch.assert_called_once()
         callKwargs = mockLaunch.call_args.kwargs
         assert callKwargs["cliArgs"]["timeout_graceful_shutdown"] == 30
 
-    @patch("fastapi_launcher.cli.launch")
     @patch("fastapi_launcher.cli.loadConfig")
     def test_start_with_max_requests(
         self, mockLoadConfig: MagicMock, mockLaunch: MagicMock
     ) -> None:
         """Test start command with --max-requests."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=Path("runtime"))
+        mockLoadConfig.return_value = SimpleNamespace(runtimeDir=Path("runtime"))
         
-        result = runner.invoke(app, ["start", "--max-requests", "1000"])
+        result = runner.invoke(cli, ["start", "--max-requests", "1000"], catch_exceptions=False)
         
         mockLaunch.assert_called_once()
         callKwargs = mockLaunch.call_args.kwargs
@@ -999,11 +854,11 @@ class TestStartWithEnvAndServer:
 class TestDevWithEnv:
     """Tests for dev command with --env option."""
 
-    @patch("fastapi_launcher.cli.launch")
     def test_dev_with_env(self, mockLaunch: MagicMock) -> None:
         """Test dev command with --env option."""
-        result = runner.invoke(app, ["dev", "--env", "staging"])
+        result = runner.invoke(cli, ["dev", "--env", "staging"], catch_exceptions=False)
         
+        assert result.exit_code == 0
         mockLaunch.assert_called_once()
         callKwargs = mockLaunch.call_args.kwargs
         assert callKwargs["envName"] == "staging"
@@ -1014,31 +869,31 @@ class TestStatusVerbose:
 
     def test_status_verbose(self, tempDir: Path) -> None:
         """Test status command with --verbose."""
-        from fastapi_launcher.process import ProcessStatus, WorkerStatus
-        
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isPortInUse") as mockIsPortInUse, \
-             patch("fastapi_launcher.cli.isProcessRunning") as mockIsRunning, \
-             patch("fastapi_launcher.process.getWorkerStatuses") as mockGetWorkers, \
-             patch("fastapi_launcher.cli.printStatusTable") as mockPrintStatus:
-            
-            mockLoadConfig.return_value = MagicMock(
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            readPidFile=DEFAULT,
+            probePort=DEFAULT,
+            isProcessRunning=DEFAULT,
+            printStatusTable=DEFAULT,
+        ) as mocks, patch("fastapi_launcher.process.getWorkerStatuses") as mockGetWorkers:
+            
+            mocks["loadConfig"].return_value = SimpleNamespace(
                 runtimeDir=tempDir / "runtime",
                 host="127.0.0.1",
                 port=8000,
             )
-            mockReadPid.return_value = 12345
-            mockIsRunning.return_value = True
-            mockIsPortInUse.return_value = False
+            mocks["readPidFile"].return_value = 12345
+            mocks["isProcessRunning"].return_value = True
+            mocks["probePort"].return_value = PortInfo(port=8000, status="free")
             mockGetWorkers.return_value = [
                 WorkerStatus(pid=1001, cpuPercent=5.0, memoryMb=100.0, requestsHandled=0, status="running")
             ]
             
-            result = runner.invoke(app, ["status", "--verbose"])
+            result = runner.invoke(cli, ["status", "--verbose"], catch_exceptions=False)
             
             assert result.exit_code == 0
-            mockPrintStatus.assert_called_once()
+            mocks["printStatusTable"].assert_called_once()
 
 
 class TestStatusServerRunningExternally:
@@ -1046,52 +901,54 @@ class TestStatusServerRunningExternally:
 
     def test_status_server_running_externally(self, tempDir: Path) -> None:
         """Test status when server is running but started externally (no PID file)."""
-        from fastapi_launcher.process import ProcessStatus
-        
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isPortInUse") as mockIsPortInUse, \
-             patch("fastapi_launcher.cli.getPortInfo") as mockGetPortInfo, \
-             patch("fastapi_launcher.cli.printStatusTable") as mockPrintStatus:
-            
-            mockLoadConfig.return_value = MagicMock(
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            readPidFile=DEFAULT,
+            probePort=DEFAULT,
+            printStatusTable=DEFAULT,
+        ) as mocks:
+            
+            mocks["loadConfig"].return_value = SimpleNamespace(
                 runtimeDir=tempDir / "runtime",
                 host="127.0.0.1",
                 port=8000,
             )
-            mockReadPid.return_value = None  # No PID file
-            mockIsPortInUse.return_value = True  # But port is in use
-            mockGetPortInfo.return_value = MagicMock(pid=12345, processName="python")
+            mocks["readPidFile"].return_value = None  # No PID file
+            # But port is in use
+            mocks["probePort"].return_value = PortInfo(
+                port=8000, pid=12345, processName="python", inUse=True
+            )
             
-            result = runner.invoke(app, ["status"])
+            result = runner.invoke(cli, ["status"], catch_exceptions=False)
             
             assert result.exit_code == 0
-            mockPrintStatus.assert_called_once()
+            mocks["printStatusTable"].assert_called_once()
 
     def test_status_server_running_externally_verbose(self, tempDir: Path) -> None:
         """Test verbose status when server is running externally."""
-        from fastapi_launcher.process import ProcessStatus, WorkerStatus
-        
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isPortInUse") as mockIsPortInUse, \
-             patch("fastapi_launcher.cli.getPortInfo") as mockGetPortInfo, \
-             patch("fastapi_launcher.process.getWorkerStatuses") as mockGetWorkers, \
-             patch("fastapi_launcher.cli.printStatusTable") as mockPrintStatus:
-            
-            mockLoadConfig.return_value = MagicMock(
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            readPidFile=DEFAULT,
+            probePort=DEFAULT,
+            printStatusTable=DEFAULT,
+        ) as mocks, patch("fastapi_launcher.process.getWorkerStatuses") as mockGetWorkers:
+            
+            mocks["loadConfig"].return_value = SimpleNamespace(
                 runtimeDir=tempDir / "runtime",
                 host="127.0.0.1",
                 port=8000,
             )
-            mockReadPid.return_value = None
-            mockIsPortInUse.return_value = True
-            mockGetPortInfo.return_value = MagicMock(pid=12345, processName="python")
+            mocks["readPidFile"].return_value = None
+            mocks["probePort"].return_value = PortInfo(
+                port=8000, pid=12345, processName="python", inUse=True
+            )
             mockGetWorkers.return_value = [
                 WorkerStatus(pid=1001, cpuPercent=2.0, memoryMb=50.0, requestsHandled=10, status="idle")
             ]
             
-            result = runner.invoke(app, ["status", "--verbose"])
+            result = runner.invoke(cli, ["status", "--verbose"], catch_exceptions=False)
             
             assert result.exit_code == 0
 
@@ -1106,19 +963,22 @@ class TestCleanCommandEdgeCases:
         pidFile = runtimeDir / "fa.pid"
         pidFile.write_text("12345")
         
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isProcessRunning") as mockIsRunning, \
-             patch("fastapi_launcher.cli.printWarningMessage") as mockWarn:
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            readPidFile=DEFAULT,
+            isProcessRunning=DEFAULT,
+            printWarningMessage=DEFAULT,
+        ) as mocks:
             
-            mockLoadConfig.return_value = MagicMock(runtimeDir=runtimeDir)
-            mockReadPid.return_value = 12345
-            mockIsRunning.return_value = True  # Server is still running
+            mocks["loadConfig"].return_value = SimpleNamespace(runtimeDir=runtimeDir)
+            mocks["readPidFile"].return_value = 12345
+            mocks["isProcessRunning"].return_value = True  # Server is still running
             
-            result = runner.invoke(app, ["clean", "--yes"])
+            result = runner.invoke(cli, ["clean", "--yes"], catch_exceptions=False)
             
             # Should warn that server is running
-            mockWarn.assert_called()
+            mocks["printWarningMessage"].assert_called()
 
     def test_clean_pid_file_stale(self, tempDir: Path) -> None:
         """Test clean command when PID file is stale (process not running)."""
@@ -1127,16 +987,19 @@ class TestCleanCommandEdgeCases:
         pidFile = runtimeDir / "fa.pid"
         pidFile.write_text("12345")
         
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isProcessRunning") as mockIsRunning, \
-             patch("fastapi_launcher.cli.printSuccessMessage") as mockSuccess:
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            readPidFile=DEFAULT,
+            isProcessRunning=DEFAULT,
+            printSuccessMessage=DEFAULT,
+        ) as mocks:
             
-            mockLoadConfig.return_value = MagicMock(runtimeDir=runtimeDir)
-            mockReadPid.return_value = 12345
-            mockIsRunning.return_value = False  # Process not running (stale PID)
+            mocks["loadConfig"].return_value = SimpleNamespace(runtimeDir=runtimeDir)
+            mocks["readPidFile"].return_value = 12345
+            mocks["isProcessRunning"].return_value = False  # Process not running (stale PID)
             
-            result = runner.invoke(app, ["clean", "--yes"])
+            result = runner.invoke(cli, ["clean", "--yes"], catch_exceptions=False)
             
             # Should clean up the stale PID file
             assert result.exit_code == 0
@@ -1147,14 +1010,17 @@ class TestCleanCommandEdgeCases:
         runtimeDir.mkdir(parents=True)
         # No logs, no PID file
         
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.cleanLogs") as mockCleanLogs, \
-             patch("fastapi_launcher.cli.printInfoMessage") as mockInfo:
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            cleanLogs=DEFAULT,
+            printInfoMessage=DEFAULT,
+        ) as mocks:
             
-            mockLoadConfig.return_value = MagicMock(runtimeDir=runtimeDir)
-            mockCleanLogs.return_value = 0  # No files cleaned
+            mocks["loadConfig"].return_value = SimpleNamespace(runtimeDir=runtimeDir)
+            mocks["cleanLogs"].return_value = 0  # No files cleaned
             
-            result = runner.invoke(app, ["clean", "--logs", "--yes"])
+            result = runner.invoke(cli, ["clean", "--logs", "--yes"], catch_exceptions=False)
             
             assert result.exit_code == 0
 
@@ -1162,17 +1028,13 @@ class TestCleanCommandEdgeCases:
 class TestRunCommandEdgeCases:
     """Edge case tests for run command."""
 
-    @patch("fastapi_launcher.cli.launch")
     @patch("fastapi_launcher.smartMode.detectEnvironment")
     def test_run_launch_error(self, mockDetect: MagicMock, mockLaunch: MagicMock) -> None:
         """Test run command with launch error."""
-        from fastapi_launcher.enums import RunMode
-        from fastapi_launcher.launcher import LaunchError
-        
         mockDetect.return_value = ("dev", RunMode.DEV)
         mockLaunch.side_effect = LaunchError("Failed to start")
         
-        result = runner.invoke(app, ["run"])
+        result = runner.invoke(cli, ["run"], catch_exceptions=False)
         
         assert result.exit_code == 1
 
@@ -1182,17 +1044,19 @@ class TestMonitorCommandEdgeCases:
 
     def test_monitor_server_not_running_no_tui(self, tempDir: Path) -> None:
         """Test monitor command when server is not running (no-tui mode)."""
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isProcessRunning") as mockIsRunning, \
-             patch("fastapi_launcher.monitor.runMonitorSimple") as mockRunSimple:
-            
-            mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime")
-            mockReadPid.return_value = None
-            mockIsRunning.return_value = False
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            readPidFile=DEFAULT,
+            isProcessRunning=DEFAULT,
+        ) as mocks, patch("fastapi_launcher.monitor.runMonitorSimple") as mockRunSimple:
+            
+            mocks["loadConfig"].return_value = SimpleNamespace(runtimeDir=tempDir / "runtime")
+            mocks["readPidFile"].return_value = None
+            mocks["isProcessRunning"].return_value = False
             mockRunSimple.side_effect = KeyboardInterrupt()
             
-            result = runner.invoke(app, ["monitor", "--no-tui"])
+            result = runner.invoke(cli, ["monitor", "--no-tui"], catch_exceptions=False)
             
             # Should call runMonitorSimple
             mockRunSimple.assert_called_once()
@@ -1207,21 +1071,24 @@ class TestLogsCommandEdgeCases:
         logsDir.mkdir(parents=True)
         # Don't create the log file
         
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.getLogFiles") as mockGetLogFiles, \
-             patch("fastapi_launcher.cli.printWarningMessage") as mockWarn:
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            getLogFiles=DEFAULT,
+            printWarningMessage=DEFAULT,
+        ) as mocks:
             
-            mockLoadConfig.return_value = MagicMock(
+            mocks["loadConfig"].return_value = MagicMock(
                 runtimeDir=tempDir / "runtime",
                 logFormat=MagicMock()
             )
-            mockGetLogFiles.return_value = {
+            mocks["getLogFiles"].return_value = {
                 "main": logsDir / "fa.log",  # File doesn't exist
                 "access": logsDir / "access.log",
                 "error": logsDir / "error.log",
             }
             
-            result = runner.invoke(app, ["logs"])
+            result = runner.invoke(cli, ["logs"], catch_exceptions=False)
             
             # Should warn about missing file
             assert result.exit_code == 0
@@ -1233,24 +1100,27 @@ class TestLogsCommandEdgeCases:
         logFile = logsDir / "fa.log"
         logFile.write_text("Line 1\nLine 2\n")
         
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.getLogFiles") as mockGetLogFiles, \
-             patch("fastapi_launcher.cli.readLogFile") as mockReadLog:
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            getLogFiles=DEFAULT,
+            readLogFile=DEFAULT,
+        ) as mocks:
             
-            mockLoadConfig.return_value = MagicMock(
+            mocks["loadConfig"].return_value = MagicMock(
                 runtimeDir=tempDir / "runtime",
                 logFormat=MagicMock()
             )
-            mockGetLogFiles.return_value = {
+            mocks["getLogFiles"].return_value = {
                 "main": logFile,
                 "access": logFile,
                 "error": logFile,
             }
             # Simulate keyboard interrupt during follow
-            mockReadLog.return_value = iter(["Line 1"])
-            mockReadLog.side_effect = KeyboardInterrupt()
+            mocks["readLogFile"].return_value = ["Line 1"]
+            mocks["readLogFile"].side_effect = KeyboardInterrupt()
             
-            result = runner.invoke(app, ["logs", "--follow"])
+            result = runner.invoke(cli, ["logs", "--follow"], catch_exceptions=False)
             
             # Should exit gracefully
             assert result.exit_code == 0
@@ -1261,25 +1131,24 @@ class TestStatusProcessRunning:
 
     def test_status_process_running_with_info(self, tempDir: Path) -> None:
         """Test status command with running process and full info."""
-        from fastapi_launcher.process import ProcessStatus
-        
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isProcessRunning") as mockIsRunning, \
-             patch("fastapi_launcher.cli.getProcessStatus") as mockGetStatus, \
-             patch("fastapi_launcher.cli.isPortInUse") as mockIsPortInUse, \
-             patch("fastapi_launcher.cli.printStatusTable") as mockPrintStatus:
-            
-            from datetime import timedelta
-            
-            mockLoadConfig.return_value = MagicMock(
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            readPidFile=DEFAULT,
+            isProcessRunning=DEFAULT,
+            getProcessStatus=DEFAULT,
+            probePort=DEFAULT,
+            printStatusTable=DEFAULT,
+        ) as mocks:
+            
+            mocks["loadConfig"].return_value = SimpleNamespace(
                 runtimeDir=tempDir / "runtime",
                 host="127.0.0.1",
                 port=8000,
             )
-            mockReadPid.return_value = 12345
-            mockIsRunning.return_value = True
-            mockGetStatus.return_value = ProcessStatus(
+            mocks["readPidFile"].return_value = 12345
+            mocks["isProcessRunning"].return_value = True
+            mocks["getProcessStatus"].return_value = ProcessStatus(
                 pid=12345,
                 isRunning=True,
                 name="python",
@@ -1287,12 +1156,12 @@ class TestStatusProcessRunning:
                 cpuPercent=5.0,
                 uptime=timedelta(hours=2),
             )
-            mockIsPortInUse.return_value = False
+            mocks["probePort"].return_value = PortInfo(port=8000, status="free")
             
-            result = runner.invoke(app, ["status"])
+            result = runner.invoke(cli, ["status"], catch_exceptions=False)
             
             assert result.exit_code == 0
-            mockPrintStatus.assert_called_once()
+            mocks["printStatusTable"].assert_called_once()
 
 
 class TestStopCommandForce:
@@ -1300,42 +1169,44 @@ class TestStopCommandForce:
 
     def test_stop_force_kill(self, tempDir: Path) -> None:
         """Test stop command with --force flag uses killProcess."""
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isProcessRunning") as mockIsRunning, \
-             patch("fastapi_launcher.cli.killProcess") as mockKill, \
-             patch("fastapi_launcher.cli.terminateProcess") as mockTerminate, \
-             patch("fastapi_launcher.cli.removePidFile"), \
-             patch("fastapi_launcher.cli.waitForPortFree") as mockWaitPort, \
-             patch("fastapi_launcher.cli.createSpinner") as mockSpinner:
-            
-            mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime", port=8000)
-            mockReadPid.return_value = 12345
-            mockIsRunning.return_value = True
-            mockKill.return_value = True
-            mockTerminate.return_value = True
-            mockWaitPort.return_value = True
-            mockSpinner.return_value.__enter__ = MagicMock(return_value=MagicMock())
-            mockSpinner.return_value.__exit__ = MagicMock(return_value=False)
-            
-            result = runner.invoke(app, ["stop", "--force"])
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            readPidFile=DEFAULT,
+            isProcessRunning=DEFAULT,
+            killProcess=DEFAULT,
+            terminateProcess=DEFAULT,
+            removePidFile=DEFAULT,
+            waitForPortFree=DEFAULT,
+            createSpinner=DEFAULT,
+        ) as mocks:
+            
+            mocks["loadConfig"].return_value = SimpleNamespace(
+                runtimeDir=tempDir / "runtime", port=8000
+            )
+            mocks["readPidFile"].return_value = 12345
+            mocks["isProcessRunning"].return_value = True
+            mocks["killProcess"].return_value = True
+            mocks["terminateProcess"].return_value = True
+            mocks["waitForPortFree"].return_value = True
+            mocks["createSpinner"].return_value.__enter__ = MagicMock(return_value=MagicMock())
+            mocks["createSpinner"].return_value.__exit__ = MagicMock(return_value=False)
+            
+            result = runner.invoke(cli, ["stop", "--force"], catch_exceptions=False)
             
             # --force 应该调用 killProcess 而不是 terminateProcess
-            mockKill.assert_called_once_with(12345)
-            mockTerminate.assert_not_called()
+            mocks["killProcess"].assert_called_once_with(12345)
+            mocks["terminateProcess"].assert_not_called()
 
 
 class TestDevCommandErrors:
     """Tests for dev command error handling."""
 
-    @patch("fastapi_launcher.cli.launch")
     def test_dev_launch_error(self, mockLaunch: MagicMock) -> None:
         """Test dev command handles LaunchError."""
-        from fastapi_launcher.launcher import LaunchError
-        
         mockLaunch.side_effect = LaunchError("App not found")
         
-        result = runner.invoke(app, ["dev"])
+        result = runner.invoke(cli, ["dev"], catch_exceptions=False)
         
         assert result.exit_code == 1
 
@@ -1343,16 +1214,15 @@ class TestDevCommandErrors:
 class TestStartDaemonModes:
     """Tests for start command daemon mode handling."""
 
-    @patch("fastapi_launcher.cli.launch")
     @patch("fastapi_launcher.cli.loadConfig")
     def test_start_with_no_daemon_flag(
         self, mockLoadConfig: MagicMock, mockLaunch: MagicMock
     ) -> None:
         """Test start command with --no-daemon explicitly disables daemon."""
         # 配置中 daemon=true，但 CLI 显式传入 --no-daemon
-        mockLoadConfig.return_value = MagicMock(runtimeDir=Path("runtime"), daemon=True)
+        mockLoadConfig.return_value = SimpleNamespace(runtimeDir=Path("runtime"), daemon=True)
         
-        result = runner.invoke(app, ["start", "--no-daemon"])
+        result = runner.invoke(cli, ["start", "--no-daemon"], catch_exceptions=False)
         
         assert result.exit_code == 0
         mockLaunch.assert_called_once()
@@ -1360,30 +1230,31 @@ class TestStartDaemonModes:
         cliArgs = mockLaunch.call_args.kwargs["cliArgs"]
         assert cliArgs.get("daemon") is False
 
-    @patch("fastapi_launcher.cli.daemonize")
-    @patch("fastapi_launcher.cli.setupDaemonLogging")
-    @patch("fastapi_launcher.cli.checkDaemonSupport")
-    @patch("fastapi_launcher.cli.launch")
-    @patch("fastapi_launcher.cli.loadConfig")
     def test_start_with_daemon_flag_explicit(
         self,
-        mockLoadConfig: MagicMock,
         mockLaunch: MagicMock,
-        mockCheckDaemonSupport: MagicMock,
-        mockSetupDaemonLogging: MagicMock,
-        mockDaemonize: MagicMock,
         tempDir: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test start command with --daemon explicitly enables daemon."""
-        os.chdir(tempDir)
-        mockCheckDaemonSupport.return_value = (True, "")
-        mockSetupDaemonLogging.return_value = tempDir / "runtime" / "fa.log"
-        mockLoadConfig.return_value = MagicMock(runtimeDir=Path("runtime"), daemon=False)
-        
-        result = runner.invoke(app, ["start", "--daemon"])
-        
-        assert result.exit_code == 0
-        mockDaemonize.assert_called_once()
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            checkDaemonSupport=DEFAULT,
+            setupDaemonLogging=DEFAULT,
+            daemonize=DEFAULT,
+        ) as mocks:
+            monkeypatch.chdir(tempDir)
+            mocks["checkDaemonSupport"].return_value = (True, "")
+            mocks["setupDaemonLogging"].return_value = tempDir / "runtime" / "fa.log"
+            mocks["loadConfig"].return_value = SimpleNamespace(
+                runtimeDir=Path("runtime"), daemon=False
+            )
+            
+            result = runner.invoke(cli, ["start", "--daemon"], catch_exceptions=False)
+            
+            assert result.exit_code == 0
+            mocks["daemonize"].assert_called_once()
 
 
 class TestStopCommandFailure:
@@ -1391,39 +1262,49 @@ class TestStopCommandFailure:
 
     def test_stop_terminate_fails(self, tempDir: Path) -> None:
         """Test stop command when terminate fails."""
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isProcessRunning") as mockIsRunning, \
-             patch("fastapi_launcher.cli.terminateProcess") as mockTerminate, \
-             patch("fastapi_launcher.cli.createSpinner") as mockSpinner:
-            
-            mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime", port=8000)
-            mockReadPid.return_value = 12345
-            mockIsRunning.return_value = True
-            mockTerminate.return_value = False  # 终止失败
-            mockSpinner.return_value.__enter__ = MagicMock(return_value=MagicMock())
-            mockSpinner.return_value.__exit__ = MagicMock(return_value=False)
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            readPidFile=DEFAULT,
+            isProcessRunning=DEFAULT,
+            terminateProcess=DEFAULT,
+            createSpinner=DEFAULT,
+        ) as mocks:
+            
+            mocks["loadConfig"].return_value = SimpleNamespace(
+                runtimeDir=tempDir / "runtime", port=8000
+            )
+            mocks["readPidFile"].return_value = 12345
+            mocks["isProcessRunning"].return_value = True
+            mocks["terminateProcess"].return_value = False  # 终止失败
+            mocks["createSpinner"].return_value.__enter__ = MagicMock(return_value=MagicMock())
+            mocks["createSpinner"].return_value.__exit__ = MagicMock(return_value=False)
             
-            result = runner.invoke(app, ["stop"])
+            result = runner.invoke(cli, ["stop"], catch_exceptions=False)
             
             assert result.exit_code == 1
 
     def test_stop_force_kill_fails(self, tempDir: Path) -> None:
         """Test stop --force command when kill fails."""
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.cli.isProcessRunning") as mockIsRunning, \
-             patch("fastapi_launcher.cli.killProcess") as mockKill, \
-             patch("fastapi_launcher.cli.createSpinner") as mockSpinner:
-            
-            mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime", port=8000)
-            mockReadPid.return_value = 12345
-            mockIsRunning.return_value = True
-            mockKill.return_value = False  # 强杀失败
-            mockSpinner.return_value.__enter__ = MagicMock(return_value=MagicMock())
-            mockSpinner.return_value.__exit__ = MagicMock(return_value=False)
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            readPidFile=DEFAULT,
+            isProcessRunning=DEFAULT,
+            killProcess=DEFAULT,
+            createSpinner=DEFAULT,
+        ) as mocks:
+            
+            mocks["loadConfig"].return_value = SimpleNamespace(
+                runtimeDir=tempDir / "runtime", port=8000
+            )
+            mocks["readPidFile"].return_value = 12345
+            mocks["isProcessRunning"].return_value = True
+            mocks["killProcess"].return_value = False  # 强杀失败
+            mocks["createSpinner"].return_value.__enter__ = MagicMock(return_value=MagicMock())
+            mocks["createSpinner"].return_value.__exit__ = MagicMock(return_value=False)
             
-            result = runner.invoke(app, ["stop", "--force"])
+            result = runner.invoke(cli, ["stop", "--force"], catch_exceptions=False)
             
             assert result.exit_code == 1
 
@@ -1434,12 +1315,14 @@ class TestPersistedEnvWithCustomRuntimeDir:
     @patch("fastapi_launcher.cli.checkHealth")
     @patch("fastapi_launcher.cli.printHealthResult")
     def test_health_reads_from_custom_runtime_dir(
-        self, mockPrintResult: MagicMock, mockCheckHealth: MagicMock, mockProjectDir: Path
+        self,
+        mockPrintResult: MagicMock,
+        mockCheckHealth: MagicMock,
+        mockProjectDir: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test health command reads env from custom runtime_dir."""
-        from fastapi_launcher.health import HealthCheckResult
-        
-        os.chdir(mockProjectDir)
+        monkeypatch.chdir(mockProjectDir)
         
         # 创建自定义 runtime 目录和 fa.env
         customRuntimeDir = mockProjectDir / "custom_runtime"
@@ -1465,7 +1348,7 @@ port = 8020
         
         mockCheckHealth.return_value = HealthCheckResult(healthy=True, statusCode=200)
         
-        result = runner.invoke(app, ["health"])
+        result = runner.invoke(cli, ["health"], catch_exceptions=False)
         
         # 验证使用了 prod 环境的端口
         assert result.exit_code == 0
@@ -1476,7 +1359,6 @@ port = 8020
 class TestEnvPersistence:
     """Tests for environment persistence during start."""
 
-    @patch("fastapi_launcher.cli.launch")
     @patch("fastapi_launcher.cli.writeEnvFile")
     @patch("fastapi_launcher.cli.loadConfig")
     def test_start_persists_env_name(
@@ -1486,34 +1368,32 @@ class TestEnvPersistence:
         mockLaunch: MagicMock,
     ) -> None:
         """Test start command persists env name to fa.env."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=Path("runtime"), daemon=False)
+        mockLoadConfig.return_value = SimpleNamespace(runtimeDir=Path("runtime"), daemon=False)
         
-        result = runner.invoke(app, ["start", "--env", "prod"])
+        result = runner.invoke(cli, ["start", "--env", "prod"], catch_exceptions=False)
         
         assert result.exit_code == 0
         mockWriteEnvFile.assert_called_once()
         callArgs = mockWriteEnvFile.call_args
         assert callArgs[0][1] == "prod"
 
-    @patch("fastapi_launcher.cli.launch")
-    @patch("fastapi_launcher.cli.writeEnvFile")
-    @patch("fastapi_launcher.cli.readEnvFile")
-    @patch("fastapi_launcher.cli.loadConfig")
-    def test_start_without_env_does_not_persist(
-        self,
-        mockLoadConfig: MagicMock,
-        mockReadEnvFile: MagicMock,
-        mockWriteEnvFile: MagicMock,
-        mockLaunch: MagicMock,
-    ) -> None:
+    def test_start_without_env_does_not_persist(self, mockLaunch: MagicMock) -> None:
         """Test start command without --env does not write fa.env."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=Path("runtime"), daemon=False)
-        mockReadEnvFile.return_value = None  # 没有持久化的环境
-        
-        result = runner.invoke(app, ["start"])
-        
-        assert result.exit_code == 0
-        mockWriteEnvFile.assert_not_called()
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            readEnvFile=DEFAULT,
+            writeEnvFile=DEFAULT,
+        ) as mocks:
+            mocks["loadConfig"].return_value = SimpleNamespace(
+                runtimeDir=Path("runtime"), daemon=False
+            )
+            mocks["readEnvFile"].return_value = None  # 没有持久化的环境
+            
+            result = runner.invoke(cli, ["start"], catch_exceptions=False)
+            
+            assert result.exit_code == 0
+            mocks["writeEnvFile"].assert_not_called()
 
 
 class TestAuxiliaryCommandsWithEnv:
@@ -1525,37 +1405,34 @@ class TestAuxiliaryCommandsWithEnv:
         self, mockReadPid: MagicMock, mockLoadConfig: MagicMock, tempDir: Path
     ) -> None:
         """Test stop command respects --env parameter."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime", port=8020)
+        mockLoadConfig.return_value = SimpleNamespace(runtimeDir=tempDir / "runtime", port=8020)
         mockReadPid.return_value = None
         
-        result = runner.invoke(app, ["stop", "--env", "prod"])
+        result = runner.invoke(cli, ["stop", "--env", "prod"], catch_exceptions=False)
         
         assert mockLoadConfig.call_args.kwargs.get("envName") == "prod"
 
-    @patch("fastapi_launcher.cli.loadConfig")
-    @patch("fastapi_launcher.cli.readPidFile")
-    @patch("fastapi_launcher.cli.isProcessRunning")
-    @patch("fastapi_launcher.cli.printStatusTable")
-    def test_status_with_env(
-        self,
-        mockPrintStatus: MagicMock,
-        mockIsRunning: MagicMock,
-        mockReadPid: MagicMock,
-        mockLoadConfig: MagicMock,
-        tempDir: Path,
-    ) -> None:
+    def test_status_with_env(self, tempDir: Path) -> None:
         """Test status command respects --env parameter."""
-        mockLoadConfig.return_value = MagicMock(
-            runtimeDir=tempDir / "runtime", host="127.0.0.1", port=8020
-        )
-        mockReadPid.return_value = None
-        mockIsRunning.return_value = False
-        
-        with patch("fastapi_launcher.cli.isPortInUse", return_value=False):
-            result = runner.invoke(app, ["status", "--env", "prod"])
-        
-        assert result.exit_code == 0
-        assert mockLoadConfig.call_args.kwargs.get("envName") == "prod"
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            printStatusTable=DEFAULT,
+            isProcessRunning=DEFAULT,
+            readPidFile=DEFAULT,
+            loadConfig=DEFAULT,
+            probePort=DEFAULT,
+        ) as mocks:
+            mocks["loadConfig"].return_value = SimpleNamespace(
+                runtimeDir=tempDir / "runtime", host="127.0.0.1", port=8020
+            )
+            mocks["readPidFile"].return_value = None
+            mocks["isProcessRunning"].return_value = False
+            mocks["probePort"].return_value = PortInfo(port=8020)
+            
+            result = runner.invoke(cli, ["status", "--env", "prod"], catch_exceptions=False)
+            
+            assert result.exit_code == 0
+            assert mocks["loadConfig"].call_args.kwargs.get("envName") == "prod"
 
     @patch("fastapi_launcher.cli.loadConfig")
     @patch("fastapi_launcher.cli.getLogFiles")
@@ -1563,65 +1440,72 @@ class TestAuxiliaryCommandsWithEnv:
         self, mockGetLogFiles: MagicMock, mockLoadConfig: MagicMock, tempDir: Path
     ) -> None:
         """Test logs command respects --env parameter."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime", logFormat="pretty")
+        mockLoadConfig.return_value = SimpleNamespace(runtimeDir=tempDir / "runtime", logFormat="pretty")
         mockGetLogFiles.return_value = {"main": tempDir / "fa.log"}
         
-        result = runner.invoke(app, ["logs", "--env", "prod", "--type", "main"])
+        result = runner.invoke(
+            cli, ["logs", "--env", "prod", "--type", "main"], catch_exceptions=False
+        )
         
         # 会失败因为日志文件不存在，但我们检查 envName 是否正确传递
         loadConfigCalls = [c for c in mockLoadConfig.call_args_list if "envName" in c.kwargs]
         assert any(c.kwargs.get("envName") == "prod" for c in loadConfigCalls)
 
-    @patch("fastapi_launcher.cli.loadConfig")
-    @patch("fastapi_launcher.cli.readPidFile")
-    @patch("fastapi_launcher.cli.isProcessRunning")
-    def test_reload_with_env(
-        self,
-        mockIsRunning: MagicMock,
-        mockReadPid: MagicMock,
-        mockLoadConfig: MagicMock,
-        tempDir: Path,
-    ) -> None:
+    def test_reload_with_env(self, tempDir: Path) -> None:
         """Test reload command respects --env parameter."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime")
-        mockReadPid.return_value = None
-        
-        result = runner.invoke(app, ["reload", "--env", "prod"])
-        
-        # 验证 envName 被传递
-        loadConfigCalls = [c for c in mockLoadConfig.call_args_list if "envName" in c.kwargs]
-        assert any(c.kwargs.get("envName") == "prod" for c in loadConfigCalls)
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            isProcessRunning=DEFAULT,
+            readPidFile=DEFAULT,
+            loadConfig=DEFAULT,
+        ) as mocks:
+            mocks["loadConfig"].return_value = SimpleNamespace(runtimeDir=tempDir / "runtime")
+            mocks["readPidFile"].return_value = None
+            
+            result = runner.invoke(cli, ["reload", "--env", "prod"], catch_exceptions=False)
+            
+            # 验证 envName 被传递
+            loadConfigCalls = [
+                c
+                for c in mocks["loadConfig"].call_args_list
+                if "envName" in c.kwargs
+            ]
+            assert any(c.kwargs.get("envName") == "prod" for c in loadConfigCalls)
 
-    @patch("fastapi_launcher.cli.loadConfig")
-    @patch("fastapi_launcher.cli.readPidFile")
-    @patch("fastapi_launcher.cli.isProcessRunning")
     @patch("fastapi_launcher.monitor.runMonitorSimple")
-    def test_monitor_with_env(
-        self,
-        mockRunSimple: MagicMock,
-        mockIsRunning: MagicMock,
-        mockReadPid: MagicMock,
-        mockLoadConfig: MagicMock,
-        tempDir: Path,
-    ) -> None:
+    def test_monitor_with_env(self, mockRunSimple: MagicMock, tempDir: Path) -> None:
         """Test monitor command respects --env parameter."""
-        mockLoadConfig.return_value = MagicMock(runtimeDir=tempDir / "runtime")
-        mockReadPid.return_value = None
-        mockIsRunning.return_value = False
-        mockRunSimple.side_effect = KeyboardInterrupt()
-        
-        result = runner.invoke(app, ["monitor", "--env", "prod", "--no-tui"])
-        
-        loadConfigCalls = [c for c in mockLoadConfig.call_args_list if "envName" in c.kwargs]
-        assert any(c.kwargs.get("envName") == "prod" for c in loadConfigCalls)
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            isProcessRunning=DEFAULT,
+            readPidFile=DEFAULT,
+            loadConfig=DEFAULT,
+        ) as mocks:
+            mocks["loadConfig"].return_value = SimpleNamespace(runtimeDir=tempDir / "runtime")
+            mocks["readPidFile"].return_value = None
+            mocks["isProcessRunning"].return_value = False
+            mockRunSimple.side_effect = KeyboardInterrupt()
+            
+            result = runner.invoke(
+                cli, ["monitor", "--env", "prod", "--no-tui"], catch_exceptions=False
+            )
+            
+            loadConfigCalls = [
+                c
+                for c in mocks["loadConfig"].call_args_list
+                if "envName" in c.kwargs
+            ]
+            assert any(c.kwargs.get("envName") == "prod" for c in loadConfigCalls)
 
 
 class TestReadPersistedEnvFallback:
     """Tests for _readPersistedEnvName custom runtime_dir fallback."""
 
-    def test_read_persisted_env_from_custom_runtime_dir(self, mockProjectDir: Path) -> None:
+    def test_read_persisted_env_from_custom_runtime_dir(
+        self, mockProjectDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test reading persisted env from custom runtime_dir when default not found."""
-        os.chdir(mockProjectDir)
+        monkeypatch.chdir(mockProjectDir)
         
         # 配置自定义 runtime_dir
         pyprojectPath = mockProjectDir / "pyproject.toml"
@@ -1645,14 +1529,14 @@ runtime_dir = "custom_runtime"
         if (defaultRuntimeDir / "fa.env").exists():
             (defaultRuntimeDir / "fa.env").unlink()
         
-        from fastapi_launcher.cli import _readPersistedEnvName
-        
         result = _readPersistedEnvName(mockProjectDir)
         assert result == "prod"
 
-    def test_read_persisted_env_config_error_returns_none(self, tempDir: Path) -> None:
+    def test_read_persisted_env_config_error_returns_none(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that config loading error returns None gracefully."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         # 确保默认目录没有 fa.env
         defaultRuntimeDir = tempDir / "runtime"
@@ -1666,17 +1550,15 @@ runtime_dir = "custom_runtime"
 port = "not_a_number"
 """)
         
-        from fastapi_launcher.cli import _readPersistedEnvName
-        
         # 应该返回 None，不抛出异常（fallback 路径中的异常被捕获）
         result = _readPersistedEnvName(tempDir)
         assert result is None
 
-    def test_read_persisted_env_os_error_returns_none(self, tempDir: Path) -> None:
+    def test_read_persisted_env_os_error_returns_none(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that OSError during config loading returns None gracefully."""
-        os.chdir(tempDir)
-        
-        from fastapi_launcher.cli import _readPersistedEnvName
+        monkeypatch.chdir(tempDir)
         
         # Mock loadConfig to raise OSError
         with patch("fastapi_launcher.cli.loadConfig", side_effect=OSError("Permission denied")):
@@ -1689,9 +1571,12 @@ class TestCleanEnvFile:
 
     def test_clean_removes_env_file(self, tempDir: Path) -> None:
         """Test clean command removes fa.env file."""
-        with patch("fastapi_launcher.cli.loadConfig") as mockLoadConfig, \
-             patch("fastapi_launcher.cli.cleanLogs") as mockCleanLogs, \
-             patch("fastapi_launcher.cli.readPidFile") as mockReadPid:
+        with patch.multiple(
+            "fastapi_launcher.cli",
+            loadConfig=DEFAULT,
+            cleanLogs=DEFAULT,
+            readPidFile=DEFAULT,
+        ) as mocks:
             
             runtimeDir = tempDir / "runtime"
             runtimeDir.mkdir(parents=True, exist_ok=True)
@@ -1700,11 +1585,11 @@ class TestCleanEnvFile:
             envFile = runtimeDir / "fa.env"
             envFile.write_text("prod\n")
             
-            mockLoadConfig.return_value = MagicMock(runtimeDir=runtimeDir)
-            mockCleanLogs.return_value = 0
-            mockReadPid.return_value = None
+            mocks["loadConfig"].return_value = SimpleNamespace(runtimeDir=runtimeDir)
+            mocks["cleanLogs"].return_value = 0
+            mocks["readPidFile"].return_value = None
             
-            result = runner.invoke(app, ["clean", "--yes"])
+            result = runner.invoke(cli, ["clean", "--yes"], catch_exceptions=False)
             
             assert result.exit_code == 0
             assert not envFile.exists()
@@ -542,6 +542,16 @@ timeout_graceful_shutdown = 30
         assert gunicornConfig["max_requests_jitter"] == 100
         assert gunicornConfig["loglevel"] == "info"
         assert gunicornConfig["graceful_timeout"] == 30
+        assert gunicornConfig["preload_app"] is False
+
+    def test_preload_app_opt_in(self, tempDir: Path, cleanEnv) -> None:
+        """Test preload_app is only enabled when configured."""
+        os.environ["FA_PRELOAD_APP"] = "true"
+
+        config = loadConfig(tempDir)
+
+        assert config.preloadApp is True
+        assert config.toGunicornConfig()["preload_app"] is True
 
 
 class TestLoadConfigCwdFallback:
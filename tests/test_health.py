@@ -184,6 +184,7 @@ class TestWaitForHealthy:
         assert result is True
         assert mockCheck.call_count == 3
 
+    @pytest.mark.slow
     @patch("fastapi_launcher.health.checkHealth")
     @patch("fastapi_launcher.health.time.time")
     def test_wait_timeout(
@@ -1,6 +1,5 @@
 """Tests for launcher core functionality."""
 
-import os
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -16,6 +15,7 @@ from fastapi_launcher.launcher import (
     launchProd,
     preLaunchChecks,
 )
+from fastapi_launcher.port import PortInfo
 from fastapi_launcher.schemas import LauncherConfig
 
 
@@ -90,11 +90,11 @@ class TestPreLaunchChecks:
 
     def test_checks_pass(self, tempDir: Path) -> None:
         """Test checks pass with valid config."""
-        with patch("fastapi_launcher.launcher.isPortInUse") as mockPortInUse, \
+        with patch("fastapi_launcher.launcher.probePort") as mockProbePort, \
              patch("fastapi_launcher.launcher.discoverApp") as mockDiscover, \
              patch("fastapi_launcher.launcher.validateAppPath") as mockValidate:
             
-            mockPortInUse.return_value = False
+            mockProbePort.return_value = PortInfo(port=8000, status="free")
             mockDiscover.return_value = "main:app"
             mockValidate.return_value = True
             
@@ -106,10 +106,10 @@ class TestPreLaunchChecks:
 
     def test_checks_pass_with_specified_app(self, tempDir: Path) -> None:
         """Test checks pass when app is specified."""
-        with patch("fastapi_launcher.launcher.isPortInUse") as mockPortInUse, \
+        with patch("fastapi_launcher.launcher.probePort") as mockProbePort, \
              patch("fastapi_launcher.launcher.validateAppPath") as mockValidate:
             
-            mockPortInUse.return_value = False
+            mockProbePort.return_value = PortInfo(port=8000, status="free")
             mockValidate.return_value = True
             
             config = LauncherConfig(app="myapp:api", appDir=tempDir)
@@ -120,11 +120,11 @@ class TestPreLaunchChecks:
 
     def test_port_in_use_raises(self, tempDir: Path) -> None:
         """Test that port in use raises error."""
-        with patch("fastapi_launcher.launcher.isPortInUse") as mockPortInUse, \
-             patch("fastapi_launcher.launcher.getPortInfo") as mockGetPortInfo:
+        with patch("fastapi_launcher.launcher.probePort") as mockProbePort:
             
-            mockPortInUse.return_value = True
-            mockGetPortInfo.return_value = MagicMock(processName="python", pid=123)
+            mockProbePort.return_value = PortInfo(
+                port=8000, pid=123, processName="python", inUse=True
+            )
             
             config = LauncherConfig(port=8000, appDir=tempDir)
             
@@ -133,10 +133,10 @@ class TestPreLaunchChecks:
 
     def test_app_not_found_raises(self, tempDir: Path) -> None:
         """Test that app not found raises error."""
-        with patch("fastapi_launcher.launcher.isPortInUse") as mockPortInUse, \
+        with patch("fastapi_launcher.launcher.probePort") as mockProbePort, \
              patch("fastapi_launcher.launcher.discoverApp") as mockDiscover:
             
-            mockPortInUse.return_value = False
+            mockProbePort.return_value = PortInfo(port=8000, status="free")
             mockDiscover.return_value = None
             
             config = LauncherConfig(appDir=tempDir)
@@ -146,10 +146,10 @@ class TestPreLaunchChecks:
 
     def test_invalid_app_path_raises(self, tempDir: Path) -> None:
         """Test that invalid app path raises error."""
-        with patch("fastapi_launcher.launcher.isPortInUse") as mockPortInUse, \
+        with patch("fastapi_launcher.launcher.probePort") as mockProbePort, \
              patch("fastapi_launcher.launcher.validateAppPath") as mockValidate:
             
-            mockPortInUse.return_value = False
+            mockProbePort.return_value = PortInfo(port=8000, status="free")
             mockValidate.return_value = False
             
             config = LauncherConfig(app="invalid:path", appDir=tempDir)
@@ -159,12 +159,12 @@ class TestPreLaunchChecks:
 
     def test_uses_cwd_when_no_app_dir(self, tempDir: Path) -> None:
         """Test uses current working directory when appDir is None."""
-        with patch("fastapi_launcher.launcher.isPortInUse") as mockPortInUse, \
+        with patch("fastapi_launcher.launcher.probePort") as mockProbePort, \
              patch("fastapi_launcher.launcher.discoverApp") as mockDiscover, \
              patch("fastapi_launcher.launcher.validateAppPath") as mockValidate, \
              patch("fastapi_launcher.launcher.Path") as mockPath:
             
-            mockPortInUse.return_value = False
+            mockProbePort.return_value = PortInfo(port=8000, status="free")
             mockDiscover.return_value = "main:app"
             mockValidate.return_value = True
             mockPath.cwd.return_value = tempDir
@@ -179,9 +179,11 @@ class TestPreLaunchChecks:
 class TestLaunch:
     """Tests for launch function."""
 
-    def test_launch_with_config(self, tempDir: Path) -> None:
+    def test_launch_with_config(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test launch with provided config."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         with patch("fastapi_launcher.launcher.preLaunchChecks") as mockChecks, \
              patch("fastapi_launcher.launcher.writePidFile"), \
@@ -202,9 +204,11 @@ class TestLaunch:
             
             mockServerInstance.run.assert_called_once()
 
-    def test_launch_loads_config_when_not_provided(self, tempDir: Path) -> None:
+    def test_launch_loads_config_when_not_provided(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test launch loads config when not provided."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         with patch("fastapi_launcher.launcher.loadConfig") as mockLoadConfig, \
              patch("fastapi_launcher.launcher.preLaunchChecks") as mockChecks, \
@@ -221,9 +225,11 @@ class TestLaunch:
             
             mockLoadConfig.assert_called_once()
 
-    def test_launch_applies_mode_override(self, tempDir: Path) -> None:
+    def test_launch_applies_mode_override(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test launch applies mode override."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         with patch("fastapi_launcher.launcher.preLaunchChecks") as mockChecks, \
              patch("fastapi_launcher.launcher.writePidFile"), \
@@ -244,9 +250,11 @@ class TestLaunch:
             
             # Check that mode was applied
 
-    def test_launch_creates_runtime_dir(self, tempDir: Path) -> None:
+    def test_launch_creates_runtime_dir(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test launch creates runtime directory."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         runtimeDir = tempDir / "new_runtime"
         
         with patch("fastapi_launcher.launcher.preLaunchChecks") as mockChecks, \
@@ -267,9 +275,12 @@ class TestLaunch:
             
             assert runtimeDir.exists()
 
-    def test_launch_adds_project_to_path(self, tempDir: Path) -> None:
-        """Test launch adds project directory to sys.path."""
-        os.chdir(tempDir)
+    def test_launch_adds_project_to_path(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test launch puts project directory first on sys.path."""
+        monkeypatch.chdir(tempDir)
+        monkeypatch.setattr(sys, "path", [*sys.path, str(tempDir)])
         
         with patch("fastapi_launcher.launcher.preLaunchChecks") as mockChecks, \
              patch("fastapi_launcher.launcher.writePidFile"), \
@@ -285,13 +296,17 @@ class TestLaunch:
                 runtimeDir=tempDir / "runtime",
             )
             
+            launch(config=config, showBanner=False)
             launch(config=config, showBanner=False)
             
-            assert str(tempDir) in sys.path
+            assert sys.path[0] == str(tempDir)
+            assert sys.path.count(str(tempDir)) == 2
 
-    def test_launch_shows_banner(self, tempDir: Path) -> None:
+    def test_launch_shows_banner(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test launch shows startup banner."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         with patch("fastapi_launcher.launcher.preLaunchChecks") as mockChecks, \
              patch("fastapi_launcher.launcher.writePidFile"), \
@@ -312,9 +327,11 @@ class TestLaunch:
             
             mockBanner.assert_called_once()
 
-    def test_launch_handles_server_exception(self, tempDir: Path) -> None:
+    def test_launch_handles_server_exception(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test launch handles server exception."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         with patch("fastapi_launcher.launcher.preLaunchChecks") as mockChecks, \
              patch("fastapi_launcher.launcher.writePidFile"), \
@@ -335,9 +352,11 @@ class TestLaunch:
             with pytest.raises(LaunchError):
                 launch(config=config, showBanner=False)
 
-    def test_launch_dev_enables_reload(self, tempDir: Path) -> None:
+    def test_launch_dev_enables_reload(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test dev mode enables reload by default."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         with patch("fastapi_launcher.launcher.loadConfig") as mockLoadConfig, \
              patch("fastapi_launcher.launcher.preLaunchChecks") as mockChecks, \
@@ -362,9 +381,11 @@ class TestLaunch:
 class TestLaunchDev:
     """Tests for launchDev function."""
 
-    def test_launch_dev_calls_launch(self, tempDir: Path) -> None:
+    def test_launch_dev_calls_launch(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test launchDev calls launch with dev mode."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         with patch("fastapi_launcher.launcher.launch") as mockLaunch:
             launchDev(app="main:app", port=9000)
@@ -379,9 +400,11 @@ class TestLaunchDev:
 class TestLaunchProd:
     """Tests for launchProd function."""
 
-    def test_launch_prod_calls_launch(self, tempDir: Path) -> None:
+    def test_launch_prod_calls_launch(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test launchProd calls launch with prod mode."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         with patch("fastapi_launcher.launcher.launch") as mockLaunch:
             launchProd(app="main:app", workers=8)
@@ -391,9 +414,11 @@ class TestLaunchProd:
             assert callKwargs["mode"] == RunMode.PROD
             assert callKwargs["cliArgs"]["workers"] == 8
 
-    def test_launch_prod_with_daemon(self, tempDir: Path) -> None:
+    def test_launch_prod_with_daemon(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test launchProd with daemon mode calls daemonize."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         # Test that daemon=True triggers daemonize import
         # The actual daemonize call happens inside launchProd
@@ -423,9 +448,11 @@ class TestLaunchError:
 class TestLaunchWithServerBackend:
     """Tests for launch with server backend configuration."""
 
-    def test_launch_with_uvicorn_backend(self, tempDir: Path) -> None:
+    def test_launch_with_uvicorn_backend(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test launch with Uvicorn server backend (default)."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         with patch("fastapi_launcher.launcher.preLaunchChecks") as mockChecks, \
              patch("fastapi_launcher.launcher.writePidFile"), \
@@ -449,9 +476,11 @@ class TestLaunchWithServerBackend:
 class TestLaunchWithEnvName:
     """Tests for launch with named environment."""
 
-    def test_launch_with_env_name(self, tempDir: Path) -> None:
+    def test_launch_with_env_name(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test launch with named environment."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         with patch("fastapi_launcher.launcher.loadConfig") as mockLoadConfig, \
              patch("fastapi_launcher.launcher.preLaunchChecks") as mockChecks, \
@@ -474,9 +503,11 @@ class TestLaunchWithEnvName:
 class TestLaunchWithGracefulShutdown:
     """Tests for launch with graceful shutdown timeout."""
 
-    def test_launch_with_timeout_graceful_shutdown(self, tempDir: Path) -> None:
+    def test_launch_with_timeout_graceful_shutdown(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test launch with graceful shutdown timeout."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         with patch("fastapi_launcher.launcher.preLaunchChecks") as mockChecks, \
              patch("fastapi_launcher.launcher.writePidFile"), \
@@ -587,6 +618,7 @@ class TestRunGunicorn:
         assert gunicornConfig["graceful_timeout"] == 30
         assert gunicornConfig["max_requests"] == 1000
         assert gunicornConfig["max_requests_jitter"] == 50
+        assert gunicornConfig["preload_app"] is False
 
     @pytest.mark.skipif(sys.platform != "win32", reason="Test for Windows only")
     def test_run_gunicorn_windows_error(self, tempDir: Path) -> None:
@@ -608,9 +640,11 @@ class TestRunGunicorn:
 class TestLaunchConfigErrors:
     """Tests for launch configuration error handling."""
 
-    def test_launch_config_validation_error(self, tempDir: Path) -> None:
+    def test_launch_config_validation_error(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test launch handles configuration validation errors."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         # 创建无效配置
         pyprojectPath = tempDir / "pyproject.toml"
@@ -623,9 +657,11 @@ port = "not_a_number"
             with pytest.raises(LaunchError, match="Invalid"):
                 launch()
 
-    def test_launch_server_exception(self, tempDir: Path) -> None:
+    def test_launch_server_exception(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test launch handles server exceptions."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         with patch("fastapi_launcher.launcher.preLaunchChecks") as mockChecks, \
              patch("fastapi_launcher.launcher.writePidFile"), \
@@ -649,9 +685,11 @@ port = "not_a_number"
 class TestLaunchSafeCwd:
     """Tests for launch _safeCwd fallback."""
 
-    def test_launch_with_provided_config(self, tempDir: Path) -> None:
+    def test_launch_with_provided_config(
+        self, tempDir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test launch works with provided config."""
-        os.chdir(tempDir)
+        monkeypatch.chdir(tempDir)
         
         with patch("fastapi_launcher.launcher.preLaunchChecks") as mockChecks, \
              patch("fastapi_launcher.launcher.writePidFile"), \
@@ -1,15 +1,21 @@
 """Tests for monitor module."""
 
+import io
 from datetime import timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from rich.console import Console
 
 from fastapi_launcher.monitor import (
     _buildStatusTable,
     _buildWorkerTable,
+    _formatStatusText,
     _formatUptime,
+    _formatWorkersText,
+    _sampleServer,
+    _snapshotKey,
     checkTextualInstalled,
 )
 from fastapi_launcher.process import ProcessStatus, WorkerStatus
@@ -129,6 +135,89 @@ class TestBuildWorkerTable:
         assert table is not None
 
 
+class TestSnapshotKey:
+    """Tests for _snapshotKey function."""
+
+    def test_not_running(self) -> None:
+        """Test key when server is not running."""
+        assert _snapshotKey(None, []) is None
+
+    def test_same_values_same_key(self) -> None:
+        """Test identical samples produce identical keys."""
+        workers = [
+            WorkerStatus(pid=1001, cpuPercent=0.04, memoryMb=50.0, requestsHandled=0, status="idle"),
+        ]
+        first = ProcessStatus(pid=1234, isRunning=True, memoryMb=100.01, cpuPercent=0.0, uptime=timedelta(seconds=10.2))
+        second = ProcessStatus(pid=1234, isRunning=True, memoryMb=100.02, cpuPercent=0.0, uptime=timedelta(seconds=10.7))
+
+        assert _snapshotKey(first, workers) == _snapshotKey(second, workers)
+
+    def test_worker_change_changes_key(self) -> None:
+        """Test a changed worker set produces a different key."""
+        master = ProcessStatus(pid=1234, isRunning=True)
+        workers = [
+            WorkerStatus(pid=1001, cpuPercent=0.0, memoryMb=50.0, requestsHandled=0, status="idle"),
+        ]
+
+        assert _snapshotKey(master, workers) != _snapshotKey(master, [])
+
+
+class TestTuiText:
+    """Tests for the TUI status and worker text formatters."""
+
+    def test_status_text_not_running(self) -> None:
+        """Test status text when server is not running."""
+        assert "not running" in _formatStatusText(None, MagicMock())
+
+    def test_status_text_running(self) -> None:
+        """Test status text includes PID and URL."""
+        config = MagicMock(host="127.0.0.1", port=8000)
+        master = ProcessStatus(pid=1234, isRunning=True, memoryMb=100.0, cpuPercent=5.0, uptime=timedelta(seconds=30))
+
+        text = _formatStatusText(master, config)
+
+        assert "PID: 1234" in text
+        assert "http://127.0.0.1:8000" in text
+        assert "Memory: 100.0 MB" in text
+
+    def test_workers_text(self) -> None:
+        """Test workers text for each server state."""
+        master = ProcessStatus(pid=1234, isRunning=True)
+        workers = [
+            WorkerStatus(pid=1001, cpuPercent=1.5, memoryMb=50.0, requestsHandled=0, status="running"),
+        ]
+
+        assert "No workers" in _formatWorkersText(None, [])
+        assert "No worker processes" in _formatWorkersText(master, [])
+        assert "PID 1001: 1.5% CPU, 50.0 MB" in _formatWorkersText(master, workers)
+
+
+class TestSampleServer:
+    """Tests for _sampleServer function."""
+
+    def test_sample_not_running(self, tempDir: Path) -> None:
+        """Test sampling without a PID file."""
+        assert _sampleServer(tempDir / "fa.pid") == (None, [])
+
+    def test_sample_running(self, tempDir: Path) -> None:
+        """Test sampling reads master and workers once."""
+        master = ProcessStatus(pid=1234, isRunning=True)
+
+        with patch("fastapi_launcher.monitor.readPidFile", return_value=1234), \
+             patch("fastapi_launcher.monitor.getMasterAndWorkerStatus", return_value=(master, [])) as mockSample:
+            assert _sampleServer(tempDir / "fa.pid") == (master, [])
+
+        mockSample.assert_called_once_with(1234)
+
+    def test_sample_stale_pid(self, tempDir: Path) -> None:
+        """Test sampling a PID file whose process has exited."""
+        master = ProcessStatus(pid=1234, isRunning=False)
+
+        with patch("fastapi_launcher.monitor.readPidFile", return_value=1234), \
+             patch("fastapi_launcher.monitor.getMasterAndWorkerStatus", return_value=(master, [])):
+            assert _sampleServer(tempDir / "fa.pid") == (None, [])
+
+
 class TestCheckTextualInstalled:
     """Tests for checkTextualInstalled function."""
 
@@ -185,9 +274,7 @@ class TestRunMonitorSimple:
         
         with patch("fastapi_launcher.monitor.loadConfig") as mockLoadConfig, \
              patch("fastapi_launcher.monitor.readPidFile") as mockReadPid, \
-             patch("fastapi_launcher.monitor.isProcessRunning") as mockIsRunning, \
-             patch("fastapi_launcher.monitor.getProcessStatus") as mockGetStatus, \
-             patch("fastapi_launcher.monitor.getWorkerStatuses") as mockGetWorkers, \
+             patch("fastapi_launcher.monitor.getMasterAndWorkerStatus") as mockSample, \
              patch("fastapi_launcher.monitor.console") as mockConsole, \
              patch("fastapi_launcher.monitor.Live", return_value=mockLiveInstance), \
              patch("fastapi_launcher.monitor.time.sleep", side_effect=KeyboardInterrupt):
@@ -198,22 +285,88 @@ class TestRunMonitorSimple:
                 port=8000
             )
             mockReadPid.return_value = 12345
-            mockIsRunning.return_value = True
-            mockGetStatus.return_value = ProcessStatus(pid=12345, isRunning=True, cpuPercent=5.0, memoryMb=100.0)
-            mockGetWorkers.return_value = [
-                WorkerStatus(pid=1001, cpuPercent=2.0, memoryMb=50.0, requestsHandled=10, status="running")
-            ]
+            mockSample.return_value = (
+                ProcessStatus(pid=12345, isRunning=True, cpuPercent=5.0, memoryMb=100.0),
+                [WorkerStatus(pid=1001, cpuPercent=2.0, memoryMb=50.0, requestsHandled=10, status="running")],
+            )
             
             # Should not hang - KeyboardInterrupt raised on first sleep
             runMonitorSimple(tempDir)
 
+    @pytest.mark.timeout(5)
+    def test_run_monitor_simple_skips_unchanged(self, tempDir: Path, mocker) -> None:
+        """Test simple monitor does not re-render when nothing changed."""
+        from fastapi_launcher.monitor import runMonitorSimple
+
+        runtimeDir = tempDir / "runtime"
+        runtimeDir.mkdir(parents=True, exist_ok=True)
+
+        mockLiveInstance = MagicMock()
+        mockLiveInstance.__enter__ = MagicMock(return_value=mockLiveInstance)
+        mockLiveInstance.__exit__ = MagicMock(return_value=False)
+
+        mocker.patch("fastapi_launcher.monitor.loadConfig", return_value=MagicMock(runtimeDir=runtimeDir))
+        mocker.patch("fastapi_launcher.monitor.readPidFile", return_value=None)
+        mocker.patch("fastapi_launcher.monitor.console")
+        mocker.patch("fastapi_launcher.monitor.Live", return_value=mockLiveInstance)
+        mocker.patch("fastapi_launcher.monitor.time.sleep", side_effect=[None, None, KeyboardInterrupt])
+
+        runMonitorSimple(tempDir)
+
+        mockLiveInstance.update.assert_not_called()
+
+    @pytest.mark.timeout(5)
+    def test_run_monitor_simple_running_uptime_tick(self, tempDir: Path, mocker) -> None:
+        """Test a ticking uptime refreshes the live cells without rebuilding."""
+        from fastapi_launcher.monitor import runMonitorSimple
+
+        runtimeDir = tempDir / "runtime"
+        runtimeDir.mkdir(parents=True, exist_ok=True)
+
+        mockLiveInstance = MagicMock()
+        mockLiveInstance.__enter__ = MagicMock(return_value=mockLiveInstance)
+        mockLiveInstance.__exit__ = MagicMock(return_value=False)
+
+        def sample(seconds: float):
+            return (
+                ProcessStatus(pid=12345, isRunning=True, memoryMb=100.0, uptime=timedelta(seconds=seconds)),
+                [WorkerStatus(pid=1001, cpuPercent=0.0, memoryMb=50.0, requestsHandled=0, status="idle",
+                              uptime=timedelta(seconds=seconds))],
+            )
+
+        mocker.patch(
+            "fastapi_launcher.monitor.loadConfig",
+            return_value=MagicMock(runtimeDir=runtimeDir, host="127.0.0.1", port=8000),
+        )
+        mocker.patch("fastapi_launcher.monitor.readPidFile", return_value=12345)
+        mocker.patch(
+            "fastapi_launcher.monitor.getMasterAndWorkerStatus",
+            side_effect=[sample(10.0), sample(10.4), sample(71.0)],
+        )
+        mocker.patch("fastapi_launcher.monitor.console")
+        mockLive = mocker.patch("fastapi_launcher.monitor.Live", return_value=mockLiveInstance)
+        mocker.patch("fastapi_launcher.monitor.time.sleep", side_effect=[None, None, KeyboardInterrupt])
+
+        runMonitorSimple(tempDir)
+
+        mockLiveInstance.update.assert_not_called()
+        mockLiveInstance.refresh.assert_called_once()
+
+        recorder = Console(record=True, width=120, file=io.StringIO())
+        recorder.print(mockLive.call_args.args[0])
+        output = recorder.export_text()
+
+        assert output.count("1m 11s") == 2
+        assert "10s" not in output
+
 
 class TestGetMasterAndWorkerStatusFromProcess:
     """Tests for getMasterAndWorkerStatus from process module."""
 
     def test_get_status(self) -> None:
         """Test getting master and worker status."""
-        with patch("fastapi_launcher.process.getProcessStatus") as mockGetStatus, \
+        with patch("fastapi_launcher.process.isProcessRunning", return_value=True), \
+             patch("fastapi_launcher.process.getProcessStatus") as mockGetStatus, \
              patch("fastapi_launcher.process.getWorkerStatuses") as mockGetWorkers:
             
             mockGetStatus.return_value = ProcessStatus(pid=12345, isRunning=True)
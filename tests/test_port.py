@@ -1,6 +1,8 @@
 """Tests for port detection utilities."""
 
+import os
 import socket
+import sys
 import time
 from unittest.mock import MagicMock, patch
 
@@ -11,6 +13,7 @@ from fastapi_launcher.port import (
     findAvailablePort,
     getPortInfo,
     isPortInUse,
+    probePort,
     waitForPort,
     waitForPortFree,
 )
@@ -42,6 +45,31 @@ class TestIsPortInUse:
             assert isPortInUse(port, "127.0.0.1") is True
 
 
+class TestProbePort:
+    """Tests for probing a port."""
+
+    def test_probe_free_port(self) -> None:
+        """Test probing a free port skips process lookup."""
+        with patch("fastapi_launcher.port.isPortInUse", return_value=False), \
+             patch("fastapi_launcher.port.getPortInfo") as mockGetPortInfo:
+            info = probePort(8000)
+
+        assert info.isOccupied is False
+        assert info.status == "free"
+        mockGetPortInfo.assert_not_called()
+
+    def test_probe_occupied_port(self) -> None:
+        """Test probing an occupied port looks up the process once."""
+        with patch("fastapi_launcher.port.isPortInUse", return_value=True), \
+             patch("fastapi_launcher.port.getPortInfo") as mockGetPortInfo:
+            mockGetPortInfo.return_value = PortInfo(port=8000)
+            info = probePort(8000)
+
+        assert info.isOccupied is True
+        assert info.status == "occupied"
+        mockGetPortInfo.assert_called_once_with(8000)
+
+
 class TestPortInfo:
     """Tests for PortInfo dataclass."""
 
@@ -76,8 +104,37 @@ class TestGetPortInfo:
         assert info.port == 59999
         # May or may not have pid depending on system
 
-    @patch("fastapi_launcher.port.psutil")
-    def test_get_info_with_process(self, mockPsutil: MagicMock) -> None:
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux /proc only")
+    def test_get_info_listening_socket_procfs(self) -> None:
+        """Test resolving a listening socket to this process via /proc."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(("127.0.0.1", 0))
+            sock.listen(1)
+            port = sock.getsockname()[1]
+
+            info = getPortInfo(port)
+
+        assert info.isOccupied is True
+        assert info.status == "LISTEN"
+        assert info.pid == os.getpid()
+
+    def test_get_info_procfs_unreadable_falls_back(self) -> None:
+        """Test falling back to psutil when /proc cannot be read."""
+        with patch("fastapi_launcher.port._HAS_PROCFS", True), \
+             patch("fastapi_launcher.port._findListenInode", side_effect=OSError), \
+             patch("psutil.net_connections", return_value=[]) as mockNetConnections:
+            info = getPortInfo(8000)
+
+        mockNetConnections.assert_called_once()
+        assert info.isOccupied is False
+
+    @patch("fastapi_launcher.port._HAS_PROCFS", False)
+    @patch("psutil.Process")
+    @patch("psutil.net_connections")
+    def test_get_info_with_process(
+        self, mockNetConnections: MagicMock, mockProcess: MagicMock
+    ) -> None:
         """Test getting info with process details."""
         mockConn = MagicMock()
         mockConn.laddr.port = 8000
@@ -87,8 +144,8 @@ class TestGetPortInfo:
         mockProc = MagicMock()
         mockProc.name.return_value = "python"
         
-        mockPsutil.net_connections.return_value = [mockConn]
-        mockPsutil.Process.return_value = mockProc
+        mockNetConnections.return_value = [mockConn]
+        mockProcess.return_value = mockProc
         
         info = getPortInfo(8000)
         
@@ -138,6 +195,7 @@ class TestWaitForPort:
             result = waitForPort(port, timeout=1.0)
             assert result is True
 
+    @pytest.mark.slow
     def test_wait_for_port_timeout(self) -> None:
         """Test timeout when port never becomes available."""
         # Use a port that's definitely not in use
@@ -172,7 +230,7 @@ class TestKillProcessOnPort:
         assert result is False
 
     @patch("fastapi_launcher.port.getPortInfo")
-    @patch("fastapi_launcher.port.psutil.Process")
+    @patch("psutil.Process")
     def test_kill_process_success(self, mockProcess: MagicMock, mockGetPort: MagicMock) -> None:
         """Test killing process successfully."""
         from fastapi_launcher.port import killProcessOnPort
@@ -186,7 +244,7 @@ class TestKillProcessOnPort:
         mockProc.terminate.assert_called_once()
 
     @patch("fastapi_launcher.port.getPortInfo")
-    @patch("fastapi_launcher.port.psutil.Process")
+    @patch("psutil.Process")
     def test_kill_process_force(self, mockProcess: MagicMock, mockGetPort: MagicMock) -> None:
         """Test force killing process."""
         from fastapi_launcher.port import killProcessOnPort
@@ -200,7 +258,7 @@ class TestKillProcessOnPort:
         mockProc.kill.assert_called_once()
 
     @patch("fastapi_launcher.port.getPortInfo")
-    @patch("fastapi_launcher.port.psutil.Process")
+    @patch("psutil.Process")
     def test_kill_process_no_such_process(self, mockProcess: MagicMock, mockGetPort: MagicMock) -> None:
         """Test killing when process no longer exists."""
         from fastapi_launcher.port import killProcessOnPort
@@ -216,7 +274,8 @@ class TestKillProcessOnPort:
 class TestGetPortInfoExtended:
     """Extended tests for getPortInfo."""
 
-    @patch("fastapi_launcher.port.psutil.net_connections")
+    @patch("fastapi_launcher.port._HAS_PROCFS", False)
+    @patch("psutil.net_connections")
     def test_get_info_access_denied(self, mockConnections: MagicMock) -> None:
         """Test getPortInfo with access denied."""
         import psutil as ps
@@ -229,7 +288,8 @@ class TestGetPortInfoExtended:
             
             assert info.status == "occupied"
 
-    @patch("fastapi_launcher.port.psutil.net_connections")
+    @patch("fastapi_launcher.port._HAS_PROCFS", False)
+    @patch("psutil.net_connections")
     def test_get_info_no_listening(self, mockConnections: MagicMock) -> None:
         """Test getPortInfo when port not listening."""
         mockConnections.return_value = []
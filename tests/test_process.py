@@ -2,7 +2,10 @@
 
 import os
 import signal
+import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -12,6 +15,12 @@ import pytest
 from fastapi_launcher.process import (
     ProcessStatus,
     WorkerStatus,
+    _HAS_PIDFD,
+    _cachedProc,
+    _getProc,
+    _readCmdline,
+    _readProcStat,
+    _sharedProcessGroup,
     getChildProcesses,
     getMasterAndWorkerStatus,
     getProcessStatus,
@@ -32,6 +41,28 @@ from fastapi_launcher.process import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clearProcCache():
+    """Drop cached process handles so patched psutil.Process mocks don't leak."""
+    _cachedProc.cache_clear()
+    yield
+    _cachedProc.cache_clear()
+
+
+class TestLazyPsutil:
+    """Tests for deferred psutil import."""
+
+    @pytest.mark.slow
+    def test_cli_import_does_not_load_psutil(self) -> None:
+        """Test psutil is imported lazily, not when the CLI loads."""
+        code = "import sys, fastapi_launcher.cli; print('psutil' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+
 class TestPidFile:
     """Tests for PID file operations."""
 
@@ -57,6 +88,39 @@ class TestPidFile:
         
         assert pidPath.exists()
 
+    def test_write_pid_file_truncates(self, tempDir: Path) -> None:
+        """Test a shorter PID fully replaces an existing longer one."""
+        pidPath = tempDir / "test.pid"
+        pidPath.write_text("1234567")
+        writePidFile(pidPath, 42)
+
+        assert pidPath.read_text() == "42"
+        assert readPidFile(pidPath) == 42
+
+    def test_write_pid_file_atomic(self, tempDir: Path) -> None:
+        """Test the PID file is replaced in one step without leftovers."""
+        pidPath = tempDir / "test.pid"
+        pidPath.write_text("1234567")
+
+        with patch("fastapi_launcher.process.os.replace", wraps=os.replace) as mockReplace:
+            writePidFile(pidPath, 42)
+
+        mockReplace.assert_called_once()
+        assert mockReplace.call_args.args[1] == pidPath
+        assert [p.name for p in tempDir.iterdir()] == ["test.pid"]
+
+    def test_write_pid_file_replace_fails(self, tempDir: Path) -> None:
+        """Test a failed rename removes the temp file and keeps the old PID."""
+        pidPath = tempDir / "test.pid"
+        pidPath.write_text("1234567")
+
+        with patch("fastapi_launcher.process.os.replace", side_effect=OSError("rename failed")):
+            with pytest.raises(OSError, match="rename failed"):
+                writePidFile(pidPath, 42)
+
+        assert [p.name for p in tempDir.iterdir()] == ["test.pid"]
+        assert readPidFile(pidPath) == 1234567
+
     def test_read_pid_file(self, tempDir: Path) -> None:
         """Test reading PID file."""
         pidPath = tempDir / "test.pid"
@@ -213,6 +277,19 @@ class TestProcessRunning:
         # Use a very high PID that's unlikely to exist
         assert isProcessRunning(9999999) is False
 
+    @patch("fastapi_launcher.process.os.kill", side_effect=PermissionError)
+    def test_other_user_process_running(self, mockKill: MagicMock) -> None:
+        """Test a process owned by another user counts as running."""
+        assert isProcessRunning(1) is True
+        mockKill.assert_called_once_with(1, 0)
+
+    @patch("fastapi_launcher.process.sys.platform", "win32")
+    @patch("fastapi_launcher.process.os.kill")
+    def test_windows_uses_psutil(self, mockKill: MagicMock) -> None:
+        """Test Windows never sends signal 0 via os.kill."""
+        assert isProcessRunning(os.getpid()) is True
+        mockKill.assert_not_called()
+
 
 class TestProcessStatus:
     """Tests for getting process status."""
@@ -233,6 +310,19 @@ class TestProcessStatus:
         
         assert status.isRunning is False
 
+    @pytest.mark.parametrize("procStatus", ["zombie", "dead"])
+    def test_zombie_or_dead_process_not_running(self, procStatus: str) -> None:
+        """Test one status() read reports zombie and dead processes as stopped."""
+        mockProc = MagicMock()
+        mockProc.status.return_value = procStatus
+
+        with patch("fastapi_launcher.process._getProc", return_value=mockProc):
+            status = getProcessStatus(12345)
+
+        assert status.isRunning is False
+        mockProc.status.assert_called_once()
+        mockProc.is_running.assert_not_called()
+
     def test_status_has_memory_info(self) -> None:
         """Test that status includes memory info."""
         status = getProcessStatus(os.getpid())
@@ -277,7 +367,8 @@ class TestTerminateProcess:
         result = terminateProcess(12345)
         assert result is True
 
-    @patch("fastapi_launcher.process.psutil.Process")
+    @patch("fastapi_launcher.process._HAS_PIDFD", False)
+    @patch("psutil.Process")
     @patch("fastapi_launcher.process.isProcessRunning")
     def test_terminate_success(
         self, mockRunning: MagicMock, mockProcess: MagicMock
@@ -307,7 +398,7 @@ class TestKillProcess:
 class TestWaitForExit:
     """Tests for waiting for process exit."""
 
-    @patch("fastapi_launcher.process.psutil.Process")
+    @patch("psutil.Process")
     def test_wait_already_exited(self, mockProcess: MagicMock) -> None:
         """Test waiting for already exited process."""
         mockProcess.side_effect = psutil.NoSuchProcess(12345)
@@ -315,7 +406,7 @@ class TestWaitForExit:
         result = waitForExit(12345, timeout=1.0)
         assert result is True
 
-    @patch("fastapi_launcher.process.psutil.Process")
+    @patch("psutil.Process")
     def test_wait_timeout(self, mockProcess: MagicMock) -> None:
         """Test timeout while waiting."""
         mockProc = MagicMock()
@@ -337,7 +428,8 @@ class TestChildProcesses:
         # Should return a list (may be empty)
         assert isinstance(children, list)
 
-    @patch("fastapi_launcher.process.psutil.Process")
+    @patch("fastapi_launcher.process._HAS_PROCFS", False)
+    @patch("psutil.Process")
     def test_get_children_success(self, mockProcess: MagicMock) -> None:
         """Test getting child processes."""
         mockChild1 = MagicMock()
@@ -353,6 +445,32 @@ class TestChildProcesses:
         
         assert children == [1001, 1002]
 
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="procfs only")
+    def test_get_children_procfs(self) -> None:
+        """Test descendants are found by walking /proc children files."""
+        script = (
+            "import subprocess, sys, time\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+            "time.sleep(30)\n"
+        )
+        proc = subprocess.Popen([sys.executable, "-c", script])
+        try:
+            deadline = time.monotonic() + 5
+            while len(psutil.Process(proc.pid).children()) < 1 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            grandchild = psutil.Process(proc.pid).children()[0].pid
+
+            with patch("psutil.Process.children") as mockChildren:
+                children = getChildProcesses(os.getpid())
+
+            mockChildren.assert_not_called()
+            assert children.index(proc.pid) < children.index(grandchild)
+        finally:
+            for p in psutil.Process(proc.pid).children(recursive=True):
+                p.kill()
+            proc.kill()
+            proc.wait()
+
 
 class TestSignalHandlers:
     """Tests for signal handler registration."""
@@ -387,8 +505,9 @@ class TestTerminateProcessTree:
         result = terminateProcessTree(12345)
         assert result is True
 
-    @patch("fastapi_launcher.process.psutil.Process")
-    @patch("fastapi_launcher.process.psutil.wait_procs")
+    @patch("fastapi_launcher.process._HAS_PIDFD", False)
+    @patch("psutil.Process")
+    @patch("psutil.wait_procs")
     @patch("fastapi_launcher.process.isProcessRunning")
     def test_terminate_tree_success(
         self, mockRunning: MagicMock, mockWaitProcs: MagicMock, mockProcess: MagicMock
@@ -410,6 +529,127 @@ class TestTerminateProcessTree:
         mockProc.terminate.assert_called_once()
         mockChild.terminate.assert_called_once()
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="process groups are POSIX only")
+    def test_terminate_tree_process_group(self) -> None:
+        """Test a master leading its own process group is signalled with killpg."""
+        script = (
+            "import subprocess, sys, time\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+            "time.sleep(30)\n"
+        )
+        proc = subprocess.Popen([sys.executable, "-c", script], start_new_session=True)
+        try:
+            deadline = time.monotonic() + 5
+            while not psutil.Process(proc.pid).children() and time.monotonic() < deadline:
+                time.sleep(0.05)
+
+            with patch("fastapi_launcher.process.os.killpg", wraps=os.killpg) as mockKillpg:
+                assert terminateProcessTree(proc.pid, timeout=5.0) is True
+
+            mockKillpg.assert_called_once_with(proc.pid, signal.SIGTERM)
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+
+    @pytest.mark.parametrize(
+        ("killpgError", "signalsEach"),
+        [(ProcessLookupError, False), (PermissionError, True)],
+        ids=["group_gone", "permission_denied"],
+    )
+    @patch("fastapi_launcher.process._HAS_PIDFD", False)
+    @patch("psutil.wait_procs")
+    @patch("fastapi_launcher.process.isProcessRunning", return_value=True)
+    def test_terminate_tree_killpg_fails(
+        self,
+        mockRunning: MagicMock,
+        mockWaitProcs: MagicMock,
+        killpgError: type[OSError],
+        signalsEach: bool,
+    ) -> None:
+        """Test a failed group SIGTERM is handled instead of escaping."""
+        mockChild = MagicMock()
+        mockProc = MagicMock()
+        mockProc.children.return_value = [mockChild]
+        mockWaitProcs.return_value = ([mockProc, mockChild], [])
+
+        with patch("fastapi_launcher.process._getProc", return_value=mockProc), \
+             patch("fastapi_launcher.process._sharedProcessGroup", return_value=4242), \
+             patch("fastapi_launcher.process.os.killpg", side_effect=killpgError):
+            assert terminateProcessTree(4242, timeout=0.1) is True
+
+        assert mockProc.terminate.called is signalsEach
+        assert mockChild.terminate.called is signalsEach
+
+    def test_shared_process_group_excludes_own_group(self) -> None:
+        """Test our own process group is never chosen for killpg."""
+        pgrp = os.getpgrp()
+        assert _sharedProcessGroup(pgrp, []) is None
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="process groups are POSIX only")
+    def test_shared_process_group_excludes_outsiders(self) -> None:
+        """Test killpg is not used when the group holds a non-descendant."""
+        sleeper = [sys.executable, "-c", "import time; time.sleep(30)"]
+        leader = subprocess.Popen(sleeper, preexec_fn=os.setpgrp)
+        outsider = None
+        try:
+            assert _sharedProcessGroup(leader.pid, []) == leader.pid
+
+            outsider = subprocess.Popen(sleeper, preexec_fn=lambda: os.setpgid(0, leader.pid))
+
+            assert _sharedProcessGroup(leader.pid, []) is None
+        finally:
+            for proc in (leader, outsider):
+                if proc is not None:
+                    proc.kill()
+                    proc.wait()
+
+    @pytest.mark.skipif(not _HAS_PIDFD, reason="pidfd_open not available")
+    def test_terminate_tree_pidfd(self) -> None:
+        """Test a real process tree is terminated and reaped via pidfds."""
+        script = (
+            "import subprocess, sys, time\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+            "time.sleep(30)\n"
+        )
+        proc = subprocess.Popen([sys.executable, "-c", script])
+        try:
+            deadline = time.monotonic() + 5
+            while not psutil.Process(proc.pid).children() and time.monotonic() < deadline:
+                time.sleep(0.05)
+            childPid = psutil.Process(proc.pid).children()[0].pid
+
+            with patch("psutil.wait_procs") as mockWaitProcs:
+                assert terminateProcessTree(proc.pid, timeout=5.0) is True
+
+            mockWaitProcs.assert_not_called()
+            # Reaped by terminateProcessTree, so no zombie is left behind
+            assert not psutil.pid_exists(proc.pid)
+            assert not isProcessRunning(childPid) or (
+                psutil.Process(childPid).status() == psutil.STATUS_ZOMBIE
+            )
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+
+    @pytest.mark.skipif(not _HAS_PIDFD, reason="pidfd_open not available")
+    def test_terminate_tree_closes_pidfds_on_error(self) -> None:
+        """Test pidfds are closed when signalling fails before the wait."""
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            mockProc = MagicMock(pid=proc.pid)
+            mockProc.children.return_value = []
+            mockProc.terminate.side_effect = psutil.NoSuchProcess(proc.pid)
+            fdsBefore = len(os.listdir("/proc/self/fd"))
+
+            with patch("fastapi_launcher.process._getProc", return_value=mockProc):
+                terminateProcessTree(proc.pid, timeout=0.1)
+
+            assert len(os.listdir("/proc/self/fd")) == fdsBefore
+        finally:
+            proc.kill()
+            proc.wait()
+
 
 class TestProcessStatusDataclass:
     """Tests for ProcessStatus dataclass."""
@@ -528,6 +768,72 @@ class TestTerminateProcess:
         
         result = terminateProcess(12345, timeout=0.5)
 
+    @pytest.mark.skipif(not _HAS_PIDFD, reason="pidfd_open not available")
+    def test_terminate_pidfd(self) -> None:
+        """Test a real process is terminated without psutil's polling wait."""
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            with patch("psutil.Process.wait") as mockWait:
+                assert terminateProcess(proc.pid, timeout=5.0) is True
+
+            mockWait.assert_not_called()
+            assert not isProcessRunning(proc.pid)
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(not _HAS_PIDFD, reason="pidfd_open not available")
+    def test_terminate_pidfd_force_kill(self) -> None:
+        """Test a process ignoring SIGTERM is killed after the timeout."""
+        script = (
+            "import signal, time\n"
+            "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+            "print(flush=True)\n"
+            "time.sleep(30)\n"
+        )
+        proc = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE)
+        try:
+            # Wait until the handler is installed
+            proc.stdout.readline()
+
+            with (
+                patch("fastapi_launcher.process.os.pidfd_open", wraps=os.pidfd_open) as mockOpen,
+                patch(
+                    "fastapi_launcher.process.signal.pidfd_send_signal",
+                    wraps=signal.pidfd_send_signal,
+                ) as mockSend,
+            ):
+                assert terminateProcess(proc.pid, timeout=0.2) is True
+
+            assert not isProcessRunning(proc.pid)
+            # Both signals go through the pidfd opened before the SIGTERM
+            mockOpen.assert_called_once_with(proc.pid)
+            assert [c.args[1] for c in mockSend.call_args_list] == [signal.SIGTERM, signal.SIGKILL]
+            assert len({c.args[0] for c in mockSend.call_args_list}) == 1
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+
+    @pytest.mark.skipif(not _HAS_PIDFD, reason="pidfd_open not available")
+    def test_terminate_closes_pidfds_on_error(self) -> None:
+        """Test the pidfd is closed when SIGTERM cannot be sent."""
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            fdsBefore = len(os.listdir("/proc/self/fd"))
+
+            with patch(
+                "fastapi_launcher.process.signal.pidfd_send_signal",
+                side_effect=PermissionError,
+            ):
+                assert terminateProcess(proc.pid, timeout=0.1) is False
+
+            assert len(os.listdir("/proc/self/fd")) == fdsBefore
+        finally:
+            proc.kill()
+            proc.wait()
+
 
 class TestWorkerStatus:
     """Tests for WorkerStatus dataclass."""
@@ -565,9 +871,14 @@ class TestWorkerStatus:
 
 
 class TestGetWorkerStatuses:
-    """Tests for getWorkerStatuses function."""
+    """Tests for getWorkerStatuses function (psutil path)."""
 
-    @patch("fastapi_launcher.process.psutil.Process")
+    @pytest.fixture(autouse=True)
+    def _noProcfs(self):
+        with patch("fastapi_launcher.process._HAS_PROCFS", False):
+            yield
+
+    @patch("psutil.Process")
     def test_get_worker_statuses_no_children(self, mockProcess: MagicMock) -> None:
         """Test getting worker statuses when there are no children."""
         mockProc = MagicMock()
@@ -578,16 +889,18 @@ class TestGetWorkerStatuses:
         
         assert workers == []
 
-    @patch("fastapi_launcher.process.psutil.Process")
+    @patch("psutil.Process")
     def test_get_worker_statuses_with_children(self, mockProcess: MagicMock) -> None:
         """Test getting worker statuses with child processes."""
         from datetime import datetime
         
         mockChild = MagicMock()
         mockChild.pid = 1001
-        mockChild.cpu_percent.return_value = 5.0
-        mockChild.memory_info.return_value = MagicMock(rss=100 * 1024 * 1024)  # 100 MB
-        mockChild.create_time.return_value = datetime.now().timestamp() - 3600
+        mockChild.as_dict.return_value = {
+            "cpu_percent": 5.0,
+            "memory_info": MagicMock(rss=100 * 1024 * 1024),  # 100 MB
+            "create_time": datetime.now().timestamp() - 3600,
+        }
         
         mockProc = MagicMock()
         mockProc.children.return_value = [mockChild]
@@ -598,8 +911,9 @@ class TestGetWorkerStatuses:
         assert len(workers) == 1
         assert workers[0].pid == 1001
         assert workers[0].memoryMb == pytest.approx(100.0, rel=0.1)
+        assert workers[0].uptime.total_seconds() == pytest.approx(3600, abs=5)
 
-    @patch("fastapi_launcher.process.psutil.Process")
+    @patch("psutil.Process")
     def test_get_worker_statuses_process_not_found(self, mockProcess: MagicMock) -> None:
         """Test getting worker statuses when main process not found."""
         mockProcess.side_effect = psutil.NoSuchProcess(12345)
@@ -608,7 +922,7 @@ class TestGetWorkerStatuses:
         
         assert workers == []
 
-    @patch("fastapi_launcher.process.psutil.Process")
+    @patch("psutil.Process")
     def test_get_worker_statuses_child_access_denied(self, mockProcess: MagicMock) -> None:
         """Test getting worker statuses when child access is denied."""
         mockChild = MagicMock()
@@ -624,16 +938,46 @@ class TestGetWorkerStatuses:
         # Should skip the inaccessible child
         assert workers == []
 
-    @patch("fastapi_launcher.process.psutil.Process")
+    @patch("fastapi_launcher.process.time.sleep")
+    @patch("psutil.Process")
+    def test_get_worker_statuses_shared_interval(
+        self, mockProcess: MagicMock, mockSleep: MagicMock
+    ) -> None:
+        """Test CPU is sampled non-blocking after one shared sleep."""
+        children = []
+        for pid in (1001, 1002):
+            child = MagicMock(pid=pid)
+            child.as_dict.return_value = {
+                "cpu_percent": 1.0,
+                "memory_info": MagicMock(rss=1024 * 1024),
+                "create_time": None,
+            }
+            children.append(child)
+
+        mockProc = MagicMock()
+        mockProc.children.return_value = children
+        mockProcess.return_value = mockProc
+
+        workers = getWorkerStatuses(12345)
+
+        assert [w.pid for w in workers] == [1001, 1002]
+        assert workers[0].uptime is None
+        mockSleep.assert_called_once_with(0.1)
+        for child in children:
+            child.cpu_percent.assert_called_once_with(interval=None)
+
+    @patch("psutil.Process")
     def test_get_worker_status_running(self, mockProcess: MagicMock) -> None:
         """Test worker status is 'running' when CPU usage is high."""
         from datetime import datetime
         
         mockChild = MagicMock()
         mockChild.pid = 1001
-        mockChild.cpu_percent.return_value = 50.0  # High CPU
-        mockChild.memory_info.return_value = MagicMock(rss=100 * 1024 * 1024)
-        mockChild.create_time.return_value = datetime.now().timestamp() - 3600
+        mockChild.as_dict.return_value = {
+            "cpu_percent": 50.0,  # High CPU
+            "memory_info": MagicMock(rss=100 * 1024 * 1024),
+            "create_time": datetime.now().timestamp() - 3600,
+        }
         
         mockProc = MagicMock()
         mockProc.children.return_value = [mockChild]
@@ -643,16 +987,18 @@ class TestGetWorkerStatuses:
         
         assert workers[0].status == "running"
 
-    @patch("fastapi_launcher.process.psutil.Process")
+    @patch("psutil.Process")
     def test_get_worker_status_idle(self, mockProcess: MagicMock) -> None:
         """Test worker status is 'idle' when CPU usage is low."""
         from datetime import datetime
         
         mockChild = MagicMock()
         mockChild.pid = 1001
-        mockChild.cpu_percent.return_value = 0.1  # Low CPU
-        mockChild.memory_info.return_value = MagicMock(rss=100 * 1024 * 1024)
-        mockChild.create_time.return_value = datetime.now().timestamp() - 3600
+        mockChild.as_dict.return_value = {
+            "cpu_percent": 0.1,  # Low CPU
+            "memory_info": MagicMock(rss=100 * 1024 * 1024),
+            "create_time": datetime.now().timestamp() - 3600,
+        }
         
         mockProc = MagicMock()
         mockProc.children.return_value = [mockChild]
@@ -663,13 +1009,66 @@ class TestGetWorkerStatuses:
         assert workers[0].status == "idle"
 
 
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="procfs only")
+class TestGetWorkerStatusesProcfs:
+    """Tests for the procfs worker sampling path."""
+
+    def test_read_proc_stat(self) -> None:
+        """Test parsing CPU and start ticks for the current process."""
+        cpuTicks, startTicks = _readProcStat(os.getpid())
+
+        assert cpuTicks >= 0
+        assert startTicks > 0
+
+    def test_read_cmdline(self) -> None:
+        """Test reading the current process command line."""
+        cmdline = _readCmdline(os.getpid())
+
+        assert cmdline is not None
+        assert cmdline == " ".join(psutil.Process().cmdline())
+
+    def test_read_cmdline_missing(self) -> None:
+        """Test reading the command line of a nonexistent process."""
+        assert _readCmdline(2**22 + 1) is None
+
+    def test_read_proc_stat_missing(self) -> None:
+        """Test reading stat for a nonexistent process raises OSError."""
+        with pytest.raises(OSError):
+            _readProcStat(2**22 + 1)
+
+    def test_get_proc_reuses_handle(self) -> None:
+        """Test the same live process returns the cached handle."""
+        assert _getProc(os.getpid()) is _getProc(os.getpid())
+
+    def test_get_proc_missing(self) -> None:
+        """Test a nonexistent PID raises NoSuchProcess."""
+        with pytest.raises(psutil.NoSuchProcess):
+            _getProc(2**22 + 1)
+
+    @patch("psutil.Process")
+    def test_get_worker_statuses_procfs(self, mockProcess: MagicMock) -> None:
+        """Test sampling real processes with one shared sleep."""
+        mockProc = MagicMock()
+        mockProc.children.return_value = [MagicMock(pid=os.getpid()), MagicMock(pid=2**22 + 1)]
+        mockProcess.return_value = mockProc
+
+        with patch("fastapi_launcher.process.time.sleep") as mockSleep:
+            workers = getWorkerStatuses(12345)
+
+        mockSleep.assert_called_once()
+        assert [w.pid for w in workers] == [os.getpid()]
+        assert workers[0].memoryMb > 0
+        assert workers[0].uptime is not None
+
+
 class TestGetMasterAndWorkerStatus:
     """Tests for getMasterAndWorkerStatus function."""
 
+    @patch("fastapi_launcher.process.isProcessRunning", return_value=True)
     @patch("fastapi_launcher.process.getWorkerStatuses")
     @patch("fastapi_launcher.process.getProcessStatus")
     def test_get_master_and_worker_status_running(
-        self, mockGetStatus: MagicMock, mockGetWorkers: MagicMock
+        self, mockGetStatus: MagicMock, mockGetWorkers: MagicMock, mockIsRunning: MagicMock
     ) -> None:
         """Test getting master and worker status when running."""
         mockMasterStatus = ProcessStatus(pid=12345, isRunning=True)
@@ -686,11 +1085,14 @@ class TestGetMasterAndWorkerStatus:
         assert master.isRunning is True
         assert len(workers) == 1
         assert workers[0].pid == 1001
+        # The sampler thread is shut down with the call
+        assert not [t for t in threading.enumerate() if t.name.startswith("fa-sampler")]
 
+    @patch("fastapi_launcher.process.isProcessRunning", return_value=False)
     @patch("fastapi_launcher.process.getWorkerStatuses")
     @patch("fastapi_launcher.process.getProcessStatus")
     def test_get_master_and_worker_status_not_running(
-        self, mockGetStatus: MagicMock, mockGetWorkers: MagicMock
+        self, mockGetStatus: MagicMock, mockGetWorkers: MagicMock, mockIsRunning: MagicMock
     ) -> None:
         """Test getting master and worker status when not running."""
         mockMasterStatus = ProcessStatus(pid=12345, isRunning=False)
@@ -703,11 +1105,29 @@ class TestGetMasterAndWorkerStatus:
         # getWorkerStatuses should not be called when not running
         mockGetWorkers.assert_not_called()
 
+    @patch("fastapi_launcher.process.isProcessRunning", return_value=True)
+    @patch("fastapi_launcher.process.getWorkerStatuses")
+    @patch("fastapi_launcher.process.getProcessStatus")
+    def test_get_master_and_worker_status_exits_during_sample(
+        self, mockGetStatus: MagicMock, mockGetWorkers: MagicMock, mockIsRunning: MagicMock
+    ) -> None:
+        """Test workers are dropped if the master exits while sampling."""
+        mockGetStatus.return_value = ProcessStatus(pid=12345, isRunning=False)
+        mockGetWorkers.return_value = [
+            WorkerStatus(pid=1001, cpuPercent=5.0, memoryMb=100.0, requestsHandled=0, status="running"),
+        ]
+
+        master, workers = getMasterAndWorkerStatus(12345)
+
+        assert master.isRunning is False
+        assert workers == []
+
 
 class TestTerminateProcessTreeAdditional:
     """Additional tests for terminateProcessTree."""
 
-    @patch("fastapi_launcher.process.psutil.Process")
+    @patch("fastapi_launcher.process._HAS_PIDFD", False)
+    @patch("psutil.Process")
     @patch("fastapi_launcher.process.isProcessRunning")
     def test_terminate_tree_with_no_children(
         self, mockRunning: MagicMock, mockProcess: MagicMock
@@ -720,14 +1140,14 @@ class TestTerminateProcessTreeAdditional:
         mockProcess.return_value = mockProc
         
         # Simulate wait_procs returning all processes terminated
-        with patch("fastapi_launcher.process.psutil.wait_procs") as mockWaitProcs:
+        with patch("psutil.wait_procs") as mockWaitProcs:
             mockWaitProcs.return_value = ([mockProc], [])
             
             result = terminateProcessTree(12345, timeout=1.0)
             
             mockProc.terminate.assert_called_once()
 
-    @patch("fastapi_launcher.process.psutil.Process")
+    @patch("psutil.Process")
     @patch("fastapi_launcher.process.isProcessRunning")
     def test_terminate_tree_access_denied(
         self, mockRunning: MagicMock, mockProcess: MagicMock
@@ -744,7 +1164,7 @@ class TestTerminateProcessTreeAdditional:
 class TestKillProcessAdditional:
     """Additional tests for killProcess."""
 
-    @patch("fastapi_launcher.process.psutil.Process")
+    @patch("psutil.Process")
     @patch("fastapi_launcher.process.isProcessRunning")
     def test_kill_process_success(
         self, mockRunning: MagicMock, mockProcess: MagicMock
@@ -759,7 +1179,7 @@ class TestKillProcessAdditional:
         
         mockProc.kill.assert_called_once()
 
-    @patch("fastapi_launcher.process.psutil.Process")
+    @patch("psutil.Process")
     @patch("fastapi_launcher.process.isProcessRunning")
     def test_kill_process_no_such_process(
         self, mockRunning: MagicMock, mockProcess: MagicMock
@@ -1,9 +1,10 @@
 """Tests for schema models."""
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from fastapi_launcher.enums import LogFormat, RunMode
 from fastapi_launcher.schemas import (
@@ -161,6 +162,97 @@ class TestLauncherConfig:
         
         assert effective.reload is True
 
+    def test_get_effective_config_copy_is_independent(self) -> None:
+        """Test the effective copy drops env sections and has its own cache."""
+        config = LauncherConfig(
+            mode=RunMode.DEV,
+            port=8000,
+            dev=EnvironmentConfig(port=9000),
+        )
+
+        effective = config.getEffectiveConfig()
+
+        assert effective.dev is None
+        assert effective.port == 9000
+        assert config.port == 8000
+        assert effective.getEffectiveConfig() is effective
+
+    def test_every_env_override_field_exists(self) -> None:
+        """Test each EnvironmentConfig field overrides a LauncherConfig field."""
+        assert set(EnvironmentConfig.model_fields) <= set(LauncherConfig.model_fields)
+
+    def test_get_effective_config_all_overrides(self) -> None:
+        """Test every override field is applied."""
+        config = LauncherConfig(
+            mode=RunMode.PROD,
+            prod=EnvironmentConfig(
+                host="0.0.0.0",
+                port=9000,
+                workers=8,
+                log_format=LogFormat.JSON,
+                max_requests=1000,
+                worker_class="custom.Worker",
+            ),
+        )
+
+        effective = config.getEffectiveConfig()
+
+        assert effective.host == "0.0.0.0"
+        assert effective.port == 9000
+        assert effective.workers == 8
+        assert effective.logFormat == LogFormat.JSON
+        assert effective.maxRequests == 1000
+        assert effective.workerClass == "custom.Worker"
+        # Unset overrides keep the base values
+        assert effective.logLevel == "info"
+
+    def test_with_overrides_reapplies_env(self) -> None:
+        """Test a mode override copy picks up that mode's env overrides."""
+        config = LauncherConfig(
+            mode=RunMode.DEV,
+            dev=EnvironmentConfig(workers=1),
+            prod=EnvironmentConfig(workers=4),
+        )
+        assert config.getEffectiveConfig().workers == 1
+
+        prodConfig = config.withOverrides(mode=RunMode.PROD)
+
+        assert prodConfig.getEffectiveConfig().workers == 4
+        assert config.mode == RunMode.DEV
+
+    def test_exclude_paths_set(self) -> None:
+        """Test excludePathsSet mirrors excludePaths, including on copies."""
+        config = LauncherConfig(exclude_paths=["/health"])
+
+        assert config.excludePathsSet == frozenset({"/health"})
+        assert config.excludePathsSet is config.excludePathsSet
+        assert config.withOverrides(excludePaths=["/ping"]).excludePathsSet == frozenset({"/ping"})
+
+    def test_config_is_frozen(self) -> None:
+        """Test configs can't be mutated after construction."""
+        config = LauncherConfig()
+
+        with pytest.raises(ValidationError):
+            config.port = 9000
+
+    def test_get_effective_config_cached(self) -> None:
+        """Test effective config is built once per environment name."""
+        config = LauncherConfig(
+            mode=RunMode.PROD,
+            prod=EnvironmentConfig(workers=4),
+            envs={"staging": EnvironmentConfig(port=9000)},
+        )
+
+        assert config.getEffectiveConfig() is config.getEffectiveConfig()
+        assert config.getEffectiveConfig("staging") is config.getEffectiveConfig("staging")
+        assert config.getEffectiveConfig("staging").port == 9000
+        assert config.getEffectiveConfig().workers == 4
+        assert config == LauncherConfig(
+            mode=RunMode.PROD,
+            prod=EnvironmentConfig(workers=4),
+            envs={"staging": EnvironmentConfig(port=9000)},
+        )
+
     def test_to_uvicorn_kwargs_dev(self) -> None:
         """Test converting to uvicorn kwargs for dev mode."""
         config = LauncherConfig(
@@ -270,6 +362,31 @@ class TestAccessLogEntry:
         
         assert "[SLOW]" in prettyStr
 
+    def test_to_pretty_str_timestamps(self) -> None:
+        """Test the timestamp stays correct across second boundaries."""
+        def pretty(ts: datetime) -> str:
+            return AccessLogEntry(
+                timestamp=ts, method="GET", path="/", status_code=200, response_time=0.0
+            ).toPrettyStr()
+
+        assert pretty(datetime(2024, 1, 1, 12, 0, 0, 100)).startswith("2024-01-01 12:00:00 ")
+        assert pretty(datetime(2024, 1, 1, 12, 0, 0, 900)).startswith("2024-01-01 12:00:00 ")
+        assert pretty(datetime(2024, 1, 1, 12, 0, 1)).startswith("2024-01-01 12:00:01 ")
+        assert pretty(datetime(2024, 1, 1, 12, 0, 0)).startswith("2024-01-01 12:00:00 ")
+
+    def test_to_pretty_str_same_instant_other_timezone(self) -> None:
+        """Test the same instant in another timezone shows its own wall clock."""
+        def pretty(ts: datetime) -> str:
+            return AccessLogEntry(
+                timestamp=ts, method="GET", path="/", status_code=200, response_time=0.0
+            ).toPrettyStr()
+
+        utcTime = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        localTime = utcTime.astimezone(timezone(timedelta(hours=8)))
+
+        assert pretty(utcTime).startswith("2024-01-01 12:00:00 ")
+        assert pretty(localTime).startswith("2024-01-01 20:00:00 ")
+
     def test_to_json_str(self) -> None:
         """Test JSON string format."""
         entry = AccessLogEntry(
@@ -285,6 +402,43 @@ class TestAccessLogEntry:
         assert '"path":"/api/users"' in jsonStr
         assert '"status_code":200' in jsonStr
 
+    def test_to_json_bytes_matches_str(self) -> None:
+        """Test JSON bytes and str forms agree."""
+        entry = AccessLogEntry(
+            method="GET",
+            path="/api/users",
+            status_code=200,
+            response_time=0.1,
+        )
+
+        assert entry.toJsonBytes().decode() == entry.toJsonStr()
+        assert AccessLogEntry.model_validate_json(entry.toJsonBytes()) == entry
+
+    @pytest.mark.parametrize(
+        "timestamp",
+        [
+            datetime(2024, 1, 15, 12, 0, 0),
+            datetime(2024, 1, 15, 12, 0, 0, 123456),
+            datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
+            datetime(2024, 1, 15, 20, 0, 0, 5, tzinfo=timezone(timedelta(hours=8))),
+        ],
+    )
+    def test_to_json_bytes_orjson_matches_pydantic(self, timestamp: datetime) -> None:
+        """Test the orjson output is identical to model_dump_json."""
+        pytest.importorskip("orjson")
+        entry = AccessLogEntry(
+            timestamp=timestamp,
+            method="GET",
+            path="/api/ünïcode",
+            query_string="q=1",
+            status_code=200,
+            response_time=0.1,
+            user_agent=None,
+            is_slow=True,
+        )
+
+        assert entry.toJsonBytes() == entry.model_dump_json(by_alias=True).encode()
+
     def test_optional_fields(self) -> None:
         """Test optional fields."""
         entry = AccessLogEntry(
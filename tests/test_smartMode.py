@@ -2,13 +2,17 @@
 
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from fastapi_launcher.enums import RunMode
 from fastapi_launcher.smartMode import (
     _heuristicDetection,
+    _loadDotenv,
     _normalizeEnv,
+    _scanDotenvKeys,
+    clearDetectionCaches,
     detectEnvironment,
     getEnvironmentInfo,
 )
@@ -90,6 +94,143 @@ class TestDetectEnvironment:
         assert envName == "development"
         assert mode == RunMode.DEV
 
+    def test_dotenv_parsed_once_while_unchanged(self, cleanEnv, tempDir: Path) -> None:
+        """Test an unchanged .env is not re-parsed on repeated detection."""
+        _loadDotenv.cache_clear()
+        (tempDir / ".env").write_text("FA_ENV=staging\n")
+
+        with patch(
+            "fastapi_launcher.smartMode._scanDotenvKeys",
+            return_value={"FA_ENV": "staging"},
+        ) as mockDotenv:
+            assert detectEnvironment(tempDir) == ("staging", RunMode.PROD)
+            assert detectEnvironment(tempDir) == ("staging", RunMode.PROD)
+
+        mockDotenv.assert_called_once()
+
+    def test_dotenv_reparsed_after_change(self, cleanEnv, tempDir: Path) -> None:
+        """Test editing .env invalidates the cached values."""
+        _loadDotenv.cache_clear()
+        envPath = tempDir / ".env"
+        envPath.write_text("FA_ENV=staging\n")
+        assert detectEnvironment(tempDir)[0] == "staging"
+
+        envPath.write_text("FA_ENV=production\n")
+
+        assert detectEnvironment(tempDir) == ("production", RunMode.PROD)
+
+    def test_missing_dotenv_not_opened(self, cleanEnv, tempDir: Path) -> None:
+        """Test a missing .env falls through to heuristics without parsing."""
+        with patch("fastapi_launcher.smartMode._loadDotenv") as mockLoad:
+            assert detectEnvironment(tempDir) == ("dev", RunMode.DEV)
+
+        mockLoad.assert_not_called()
+
+    def test_unreadable_dotenv_falls_back(self, cleanEnv, tempDir: Path) -> None:
+        """Test a .env that cannot be read is skipped with a warning."""
+        (tempDir / ".env").write_text("FA_ENV=prod\n")
+        (tempDir / "Dockerfile").write_text("FROM python:3.11\n")
+
+        with patch(
+            "fastapi_launcher.smartMode._loadDotenv",
+            side_effect=PermissionError("denied"),
+        ):
+            assert detectEnvironment(tempDir) == ("prod", RunMode.PROD)
+
+    def test_directory_listed_once_while_unchanged(self, cleanEnv, tempDir: Path) -> None:
+        """Test repeated detection reuses the project directory listing."""
+        clearDetectionCaches()
+
+        with patch("fastapi_launcher.smartMode.os.scandir", wraps=os.scandir) as mockScandir:
+            assert detectEnvironment(tempDir) == ("dev", RunMode.DEV)
+            assert detectEnvironment(tempDir) == ("dev", RunMode.DEV)
+
+        mockScandir.assert_called_once()
+
+    def test_new_indicator_file_detected(self, cleanEnv, tempDir: Path) -> None:
+        """Test a Dockerfile added after the first detection is picked up."""
+        assert detectEnvironment(tempDir) == ("dev", RunMode.DEV)
+
+        (tempDir / "Dockerfile").touch()
+
+        assert detectEnvironment(tempDir) == ("prod", RunMode.PROD)
+        assert getEnvironmentInfo(tempDir)["has_dockerfile"] is True
+        assert getEnvironmentInfo(tempDir)["detected_env"] == "prod"
+
+    def test_new_dotenv_detected(self, cleanEnv, tempDir: Path) -> None:
+        """Test a .env added after the first detection is picked up."""
+        assert detectEnvironment(tempDir) == ("dev", RunMode.DEV)
+
+        (tempDir / ".env").write_text("FA_ENV=prod\n")
+
+        assert detectEnvironment(tempDir) == ("prod", RunMode.PROD)
+
+    def test_env_var_change_invalidates_cache(self, cleanEnv, tempDir: Path) -> None:
+        """Test changing an environment variable bypasses the cached result."""
+        assert detectEnvironment(tempDir) == ("dev", RunMode.DEV)
+
+        os.environ["FA_ENV"] = "prod"
+
+        assert detectEnvironment(tempDir) == ("prod", RunMode.PROD)
+
+
+class TestScanDotenvKeys:
+    """Tests for _scanDotenvKeys function."""
+
+    def test_scan_plain_quoted_and_exported(self, tempDir: Path) -> None:
+        """Test common assignment forms are read like python-dotenv."""
+        envPath = tempDir / ".env"
+        envPath.write_text(
+            "# FA_ENV=ignored\n"
+            "FA_HOST=0.0.0.0\n"
+            "export FA_ENV='staging'  # deploy target\n"
+            'PYTHON_ENV = "development"\n'
+        )
+
+        assert _scanDotenvKeys(envPath, ("FA_ENV", "PYTHON_ENV")) == {
+            "FA_ENV": "staging",
+            "PYTHON_ENV": "development",
+        }
+
+    def test_scan_strips_inline_comment(self, tempDir: Path) -> None:
+        """Test unquoted values drop trailing comments."""
+        envPath = tempDir / ".env"
+        envPath.write_text("FA_ENV=prod # set by CI\n")
+
+        assert _scanDotenvKeys(envPath, ("FA_ENV",)) == {"FA_ENV": "prod"}
+
+    def test_scan_last_assignment_wins(self, tempDir: Path) -> None:
+        """Test a repeated key takes its last value, as in python-dotenv."""
+        envPath = tempDir / ".env"
+        envPath.write_text("FA_ENV=qa\nFA_ENV=prod\n")
+
+        assert _scanDotenvKeys(envPath, ("FA_ENV",)) == {"FA_ENV": "prod"}
+
+    @pytest.mark.parametrize(
+        "content",
+        ['FA_ENV="multi\nline"\n', "FA_ENV=${DEPLOY_ENV}\n"],
+    )
+    def test_complex_values_fall_back_to_dotenv(
+        self, tempDir: Path, content: str
+    ) -> None:
+        """Test values the scanner cannot handle are parsed by python-dotenv."""
+        _loadDotenv.cache_clear()
+        envPath = tempDir / ".env"
+        envPath.write_text(content)
+
+        with pytest.raises(ValueError):
+            _scanDotenvKeys(envPath, ("FA_ENV",))
+
+        with patch(
+            "fastapi_launcher.smartMode.dotenv_values",
+            return_value={"FA_ENV": "staging"},
+        ) as mockDotenv:
+            stat = envPath.stat()
+            values = _loadDotenv(str(envPath), stat.st_mtime_ns, stat.st_size)
+
+        mockDotenv.assert_called_once_with(str(envPath))
+        assert values == {"FA_ENV": "staging"}
+
 
 class TestHeuristicDetection:
     """Tests for _heuristicDetection function."""
@@ -132,6 +273,20 @@ class TestHeuristicDetection:
         assert envName == "prod"
         assert mode == RunMode.PROD
 
+    def test_pre_commit_config_indicates_dev(self, tempDir: Path) -> None:
+        """Test .pre-commit-config.yaml wins over production indicators."""
+        (tempDir / ".pre-commit-config.yaml").write_text("repos: []\n")
+        (tempDir / "Dockerfile").write_text("FROM python:3.11\n")
+
+        assert _heuristicDetection(tempDir) == ("dev", RunMode.DEV)
+
+    def test_scandir_failure_falls_back(self, tempDir: Path) -> None:
+        """Test indicators are still found when the directory cannot be listed."""
+        (tempDir / "app.yaml").write_text("runtime: python311\n")
+
+        with patch("fastapi_launcher.smartMode.os.scandir", side_effect=OSError):
+            assert _heuristicDetection(tempDir) == ("prod", RunMode.PROD)
+
     def test_default_is_dev(self, tempDir: Path) -> None:
         """Test default environment is development."""
         envName, mode = _heuristicDetection(tempDir)
@@ -157,6 +312,33 @@ class TestGetEnvironmentInfo:
         assert "has_dockerfile" in info
         assert "has_docker_compose" in info
 
+    def test_environment_info_reuses_directory_listing(
+        self, cleanEnv, tempDir: Path
+    ) -> None:
+        """Test detection and indicator flags share one directory read."""
+        (tempDir / "Dockerfile").write_text("FROM python:3.11\n")
+
+        with patch(
+            "fastapi_launcher.smartMode.os.scandir", wraps=os.scandir
+        ) as mockScandir:
+            info = getEnvironmentInfo(tempDir)
+
+        mockScandir.assert_called_once()
+        assert info["detected_env"] == "prod"
+        assert info["has_dockerfile"] is True
+        assert info["has_docker_compose"] is False
+        assert info["has_pre_commit"] is False
+
+    def test_environment_info_defaults_to_cwd(self, cleanEnv, tempDir: Path) -> None:
+        """Test the working directory is resolved once when none is given."""
+        with patch(
+            "fastapi_launcher.smartMode.os.getcwd", return_value=str(tempDir)
+        ) as mockGetcwd:
+            info = getEnvironmentInfo()
+
+        mockGetcwd.assert_called_once()
+        assert info["project_dir"] == str(tempDir)
+
     def test_environment_info_with_env_vars(self, cleanEnv, tempDir: Path) -> None:
         """Test environment info includes env vars."""
         os.environ["FA_ENV"] = "staging"
@@ -165,3 +347,21 @@ class TestGetEnvironmentInfo:
         
         assert info["fa_env"] == "staging"
         assert info["detected_env"] == "staging"
+
+    def test_environment_info_skips_probes_with_env_var(
+        self, cleanEnv, tempDir: Path
+    ) -> None:
+        """Test indicator files are not probed when an env var decides."""
+        (tempDir / "Dockerfile").write_text("FROM python:3.11\n")
+        os.environ["NODE_ENV"] = "development"
+
+        with patch("fastapi_launcher.smartMode._scanProjectDir") as mockScan, \
+             patch("fastapi_launcher.smartMode._hasPreCommitHook") as mockHook:
+            info = getEnvironmentInfo(tempDir)
+
+        mockScan.assert_not_called()
+        mockHook.assert_not_called()
+        assert info["detected_env"] == "development"
+        assert info["has_dockerfile"] is None
+        assert info["has_docker_compose"] is None
+        assert info["has_pre_commit"] is None
@@ -2,6 +2,7 @@
 
 from datetime import timedelta
 from io import StringIO
+from unittest.mock import patch
 
 import pytest
 from rich.console import Console
@@ -11,6 +12,8 @@ from fastapi_launcher.schemas import LauncherConfig
 from fastapi_launcher.ui import (
     colorizeHttpMethod,
     colorizeStatusCode,
+    printAccessLogEntries,
+    printAccessLogEntry,
     printConfigTable,
     printErrorMessage,
     printErrorPanel,
@@ -49,6 +52,22 @@ class TestFormatUptime:
         assert "3d" in result
         assert "12h" in result
 
+    def test_format_skips_zero_units(self) -> None:
+        """Test zero-valued middle units are omitted."""
+        assert _formatUptime(timedelta(days=1, minutes=5)) == "1d 5m 0s"
+        assert _formatUptime(timedelta(hours=3, seconds=7)) == "3h 7s"
+
+    def test_format_cached_by_whole_seconds(self) -> None:
+        """Test uptimes within the same second reuse one formatted string."""
+        from fastapi_launcher.ui import _formatUptimeSeconds
+
+        _formatUptimeSeconds.cache_clear()
+        first = _formatUptime(timedelta(seconds=90, milliseconds=100))
+        second = _formatUptime(timedelta(seconds=90, milliseconds=900))
+
+        assert first == second == "1m 30s"
+        assert _formatUptimeSeconds.cache_info().hits == 1
+
 
 class TestColorizeHttpMethod:
     """Tests for HTTP method colorization."""
@@ -76,6 +95,21 @@ class TestColorizeHttpMethod:
         result = colorizeHttpMethod("CUSTOM")
         assert "CUSTOM" in result
 
+    def test_lowercase_method_keeps_case(self) -> None:
+        """Test lowercase methods get the method color and keep their text."""
+        assert colorizeHttpMethod("get") == "[green]get    [/]"
+        assert colorizeHttpMethod("GET") == "[green]GET    [/]"
+
+    def test_unknown_method_markup_cached(self) -> None:
+        """Test markup for unknown methods is built once and reused."""
+        from fastapi_launcher.ui import _fallbackMethodMarkup
+
+        _fallbackMethodMarkup.cache_clear()
+        assert colorizeHttpMethod("PURGE") == "[white]PURGE  [/]"
+        assert colorizeHttpMethod("PURGE") == "[white]PURGE  [/]"
+
+        assert _fallbackMethodMarkup.cache_info().hits == 1
+
 
 class TestColorizeStatusCode:
     """Tests for status code colorization."""
@@ -101,6 +135,20 @@ class TestColorizeStatusCode:
         result = colorizeStatusCode(500)
         assert "[bold red]" in result
 
+    @pytest.mark.parametrize(
+        ("code", "expected"),
+        [
+            (100, "[dim]100[/]"),
+            (204, "[green]204[/]"),
+            (999, "[bold red]999[/]"),
+            (1000, "[bold red]1000[/]"),
+            (-1, "[dim]-1[/]"),
+        ],
+    )
+    def test_table_and_fallback_agree(self, code: int, expected: str) -> None:
+        """Test precomputed and out-of-range codes share the same markup."""
+        assert colorizeStatusCode(code) == expected
+
 
 class TestPrintFunctions:
     """Tests for print functions with captured output."""
@@ -229,6 +277,19 @@ class TestPrintConfigTable:
         
         printConfigTable(config)
 
+    def test_print_config_value_rendering(self) -> None:
+        """Test booleans, None and other values render by type."""
+        output = StringIO()
+        config = {"reload": True, "daemon": False, "workers": None, "port": 8000}
+        with patch("fastapi_launcher.ui.console", Console(file=output, width=100)):
+            printConfigTable(config)
+
+        text = output.getvalue()
+        assert "true" in text
+        assert "false" in text
+        assert "not set" in text
+        assert "8000" in text
+
 
 class TestPrintHealthStatus:
     """Tests for health status printing."""
@@ -331,3 +392,58 @@ class TestPrintStatusTableWithWorkers:
         
         # Should not raise
         printStatusTable(statusInfo, processInfo, workerStatuses)
+
+
+class TestPrintAccessLogEntries:
+    """Tests for batched access log printing."""
+
+    def test_plain_output_when_not_terminal(self) -> None:
+        """Test piped output is written as plain text without markup."""
+        output = StringIO()
+        with patch("fastapi_launcher.ui.console", Console(file=output)):
+            printAccessLogEntries(
+                [
+                    ("GET", "/items", 200, 0.012, False),
+                    ("POST", "/upload", 500, 2.5, True),
+                ]
+            )
+
+        lines = output.getvalue().splitlines()
+        assert lines == [
+            f"{'GET':7} {'/items':40} 200 0.012s",
+            f"{'POST':7} {'/upload':40} 500 2.500s [SLOW]",
+        ]
+
+    def test_terminal_output_single_print(self) -> None:
+        """Test terminal output renders all entries in one console print."""
+        output = StringIO()
+        terminal = Console(file=output, force_terminal=True, width=120)
+        with patch("fastapi_launcher.ui.console", terminal), \
+             patch.object(terminal, "print", wraps=terminal.print) as mockPrint:
+            printAccessLogEntries(
+                [
+                    ("GET", "/items", 200, 0.012, False),
+                    ("DELETE", "/items/1", 404, 0.003, False),
+                ]
+            )
+
+        mockPrint.assert_called_once()
+        text = output.getvalue()
+        assert "\x1b[" in text
+        assert "DELETE" in text
+
+    def test_empty_batch_writes_nothing(self) -> None:
+        """Test an empty batch produces no output."""
+        output = StringIO()
+        with patch("fastapi_launcher.ui.console", Console(file=output)):
+            printAccessLogEntries([])
+
+        assert output.getvalue() == ""
+
+    def test_single_entry_uses_batch_path(self) -> None:
+        """Test printAccessLogEntry writes the same line as a one-entry batch."""
+        output = StringIO()
+        with patch("fastapi_launcher.ui.console", Console(file=output)):
+            printAccessLogEntry("GET", "/health", 200, 0.001)
+
+        assert output.getvalue() == f"{'GET':7} {'/health':40} 200 0.001s\n"